@@ -0,0 +1,353 @@
+#######################################################################################################################
+#
+#
+#  	Project     	: 	Generic Data generator.
+#
+#   File            :   batch_writer.py
+#
+#   Description     :   Pipelined generate/persist, generation hands finished day batches to background writer threads.
+#
+#   Created     	:   17 Oct 2026
+#
+#                   :   Generation is CPU bound Faker work, persisting is mostly waiting on the database round trip.
+#                       BatchWriter overlaps the two: submit() puts a batch on a bounded queue and returns, one or more
+#                       writer threads drain the queue into the persistent store. When the writers fall behind the
+#                       queue fills up and submit() blocks (backpressure), so memory stays bounded at roughly
+#                       queue_size day batches.
+#
+#                       Failures the flush function marks as recoverable (DatabaseOperationError by default) are
+#                       logged and counted, the run carries on, as before. Anything else is fatal: the first such
+#                       error is kept and re-raised in the generating thread on its next submit(), or by close().
+#
+#                       Sinks that load asynchronously hand back Futures, the flush function may return them (one,
+#                       or a list of insert results). Such a batch is only settled, flushed or failed, once all of
+#                       its Futures complete, and on_flushed(batch) is only called for batches actually persisted.
+#
+#   Usage:
+#       with BatchWriter(flush, mylogger, writers=2, queue_size=4, on_flushed=report) as writer:
+#           writer.submit(batch)                    # Blocks while the queue is full
+#           writer.drain()                          # Wait until everything submitted so far is settled
+#
+#   Classes         :   BatchWriter
+#                   :       submit
+#                   :       drain
+#                   :       close
+#                   :       stats
+#
+#
+########################################################################################################################
+__author__      = "Generic Data playground"
+__email__       = "georgelza@gmail.com"
+__version__     = "0.1"
+__copyright__   = "Copyright 2025, - George Leonard"
+
+
+import concurrent.futures, queue, threading
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from connections import DatabaseOperationError
+
+
+_STOP = object()                                        # Queue sentinel, one per writer thread
+
+
+class BatchWriter:
+
+    """
+    Bounded queue plus writer threads in front of a flush function.
+
+    writers=0 keeps everything in the calling thread, submit() flushes inline, i.e. the old synchronous behaviour.
+    """
+
+    def __init__(self,
+                 flush:         Callable[[Any], Any],
+                 mylogger,
+                 writers:       int = 1,
+                 queue_size:    int = 4,
+                 recoverable:   Tuple[Type[BaseException], ...] = (DatabaseOperationError,),
+                 on_flushed:    Optional[Callable[[Any], None]] = None):
+
+        """
+        Args:
+            flush:          Persists one batch, called from the writer threads, must be safe to call concurrently
+                            when writers > 1. May return a Future, or a list with Futures, for loads still in flight
+            mylogger:       Logger
+            writers:        Number of writer threads, 0 => flush inline in submit()
+            queue_size:     Batches that may be waiting before submit() blocks
+            recoverable:    Exception types that are logged and counted instead of stopping the run
+            on_flushed:     Called with each batch once it has been persisted, one call at a time
+        """
+
+        self.flush          = flush
+        self.mylogger       = mylogger
+        self.recoverable    = recoverable
+        self.on_flushed     = on_flushed
+        self.submitted      = 0
+        self.flushed        = 0
+        self.failed         = 0
+        self._error         = None
+        self._lock          = threading.Lock()
+        self._settled       = threading.Condition(self._lock)
+        self._inflight      = 0                         # Batches still waiting on their Futures
+        self._report_lock   = threading.Lock()          # Serialises on_flushed
+        self._queue         = queue.Queue(maxsize=max(1, queue_size))
+        self._threads       = [threading.Thread(target=self._run, name=f"BatchWriter-{i}", daemon=True) for i in range(writers)]
+        self._closed        = False
+
+        for thread in self._threads:
+            thread.start()
+        #end for
+    #end __init__
+
+
+    def __enter__(self):
+        return self
+    #end __enter__
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        # On the way out because of an error already, don't mask it with a writer error
+        self.close(raise_error=exc_type is None)
+    #end __exit__
+
+
+    def _settle(self, batch, err):
+
+        """Record a batch's outcome, err is None once it has been persisted, returns False on a fatal error"""
+
+        if err is None:
+            try:
+                if self.on_flushed is not None:
+                    with self._report_lock:
+                        self.on_flushed(batch)
+                    #end with
+                #end if
+
+            except Exception as report_err:
+                err = report_err
+
+            else:
+                with self._lock:
+                    self.flushed += 1
+                #end with
+                return True
+
+            #end try
+        #end if
+
+        if isinstance(err, self.recoverable):
+            with self._lock:
+                self.failed += 1
+            #end with
+
+            self.mylogger.error("Batch writer flush failed, batch skipped: {err}".format(
+                err = err
+            ))
+            return True
+        #end if
+
+        with self._lock:
+            self.failed += 1
+            if self._error is None:
+                self._error = err
+            #end if
+        #end with
+
+        self.mylogger.error("Batch writer stopped on error: {err}".format(
+            err = err
+        ))
+        return False
+    #end _settle
+
+
+    def _flush_one(self, batch):
+
+        """Flush a batch, recording the outcome now or once its Futures complete, returns False on a fatal error"""
+
+        try:
+            result = self.flush(batch)
+
+        except Exception as err:
+            return self._settle(batch, err)
+
+        #end try
+        results = result if isinstance(result, (list, tuple)) else [result]
+        futures = [future for future in results if isinstance(future, concurrent.futures.Future)]
+        if not futures:
+            return self._settle(batch, None)
+
+        #end if
+        with self._lock:
+            self._inflight += 1
+        #end with
+
+        remaining = [len(futures)]
+
+        def _done(_):
+            with self._lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+
+                #end if
+            #end with
+
+            # First failure, if any, fails the whole batch
+            err = None
+            for future in futures:
+                err = concurrent.futures.CancelledError() if future.cancelled() else future.exception()
+                if err is not None:
+                    break
+
+                #end if
+            #end for
+
+            self._settle(batch, err)
+
+            with self._lock:
+                self._inflight -= 1
+                self._settled.notify_all()
+            #end with
+        #end _done
+
+        for future in futures:
+            future.add_done_callback(_done)
+        #end for
+
+        return True
+    #end _flush_one
+
+
+    def _run(self):
+
+        """Writer thread, drains the queue until it sees the stop sentinel"""
+
+        failed = False
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is _STOP:
+                    return
+
+                #end if
+                # After a fatal error keep draining, so a producer blocked on a full queue gets released
+                if not failed:
+                    failed = not self._flush_one(batch)
+
+                #end if
+            finally:
+                self._queue.task_done()
+
+            #end try
+        #end while
+    #end _run
+
+
+    def _raise_error(self):
+
+        if self._error is not None:
+            raise self._error
+        #end if
+    #end _raise_error
+
+
+    def _wait_settled(self):
+
+        """Wait for the batches still waiting on their Futures"""
+
+        with self._lock:
+            while self._inflight:
+                self._settled.wait()
+            #end while
+        #end with
+    #end _wait_settled
+
+
+    def submit(self, batch):
+
+        """
+        Hand a batch to the writers, blocks while the queue is full.
+
+        Raises:
+            The first fatal writer error, if one occurred
+        """
+
+        if self._closed:
+            raise RuntimeError("BatchWriter is closed")
+        #end if
+
+        self._raise_error()
+        self.submitted += 1
+
+        if not self._threads:
+            if not self._flush_one(batch):
+                self._raise_error()
+
+            #end if
+            return
+        #end if
+
+        self._queue.put(batch)
+    #end submit
+
+
+    def drain(self):
+
+        """
+        Wait until every batch submitted so far is settled, flushed or failed, the writers keep running.
+
+        Raises:
+            The first fatal writer error, if one occurred
+        """
+
+        self._queue.join()
+        self._wait_settled()
+        self._raise_error()
+    #end drain
+
+
+    def close(self, raise_error=True):
+
+        """
+        Drain the queue, stop and join the writer threads, then wait for the loads still in flight. Safe to call
+        more than once.
+
+        Raises:
+            The first fatal writer error, if one occurred and raise_error is set
+        """
+
+        if not self._closed:
+            self._closed = True
+
+            for _ in self._threads:
+                self._queue.put(_STOP)
+            #end for
+
+            for thread in self._threads:
+                thread.join()
+            #end for
+        #end if
+
+        self._wait_settled()
+
+        if raise_error:
+            self._raise_error()
+        #end if
+    #end close
+
+
+    def stats(self) -> Dict[str, int]:
+
+        """Counters for reporting"""
+
+        with self._lock:
+            return {
+                'writers':      len(self._threads),
+                'submitted':    self.submitted,
+                'flushed':      self.flushed,
+                'failed':       self.failed
+            }
+        #end with
+    #end stats
+#end BatchWriter
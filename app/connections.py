@@ -9,6 +9,20 @@
 #   
 #   Created         :   06 Aug 2025
 #                   :   18 Aug 2025 - Added Kafka as destitation
+#                   :   17 Oct 2026 - PostgreSQL COPY based bulk loading, see POSTGRES_LOAD
+#                   :   17 Oct 2026 - PostgreSQL connection pool per writer thread and commit cadence, see POSTGRES_POOL
+#                   :   17 Oct 2026 - Added asyncpg based AsyncPostgreSQL as destination
+#                   :   17 Oct 2026 - MongoDB unordered bulk inserts, bulk write concern and pre-encoded (raw BSON) documents
+#                   :   17 Oct 2026 - MongoDB parallel per collection insert streams over several clients, see MONGO_STREAMS
+#                   :   17 Oct 2026 - Redis non transactional, chunked and concurrent pipelines, MSET when there is no TTL
+#                   :   17 Oct 2026 - Redis SCAN/MGET based iter_by_pattern, get_by_pattern no longer uses KEYS
+#                   :   17 Oct 2026 - Redis storage layouts, JSON strings, bucketed hashes or RedisJSON, see REDIS_LAYOUT
+#                   :   17 Oct 2026 - Kafka streaming mode, no flush per batch, producer batching/compression tunables
+#                   :   17 Oct 2026 - Kafka per topic delivery accounting, failed messages re-produced, in flight depth
+#                   :   17 Oct 2026 - Kafka Avro values with schema registration, see KAFKA_FORMAT and kafka_serde.py
+#                   :   17 Oct 2026 - JSON encoding through json_codec (orjson/msgspec/json) for every store
+#                   :   17 Oct 2026 - Added Parquet/Arrow IPC file sink as destination
+#                   :   17 Oct 2026 - Added compressed JSONL file sink as destination
 #
 ########################################################################################################################
 __author__      = "Generic Data playground"
@@ -17,15 +31,19 @@ __version__     = "0.3"
 __copyright__   = "Copyright 2025, - George Leonard"
 
 
-import json, socket, time
+import json, socket, time, struct, threading, zlib, gzip
+import asyncio, concurrent.futures, itertools
 import sys, os
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Iterator, Optional, Tuple, Union
 
 try:
     import pymongo
+    import bson
+    from bson.raw_bson import RawBSONDocument
     from pymongo.errors import ServerSelectionTimeoutError, ConnectionFailure
+    from pymongo.write_concern import WriteConcern
     print("MongoDB, Module Import Successful")
     
 except ImportError as err:
@@ -35,6 +53,7 @@ except ImportError as err:
 try:
     import psycopg2
     from psycopg2.extras import Json, execute_values
+    from psycopg2.pool import ThreadedConnectionPool
     from psycopg2 import sql
     from psycopg2.errors import Error as PostgreSQLError
     print("PostgreSQL Module Import Successful")
@@ -43,6 +62,32 @@ except ImportError as err:
     print("PostgreSQL, Module Import Error {err}")
     sys.exit(1)
 
+# Optional, only needed for DEST=5, so don't bail out if it's missing
+try:
+    import asyncpg
+    print("AsyncPG Module Import Successful")
+    
+except ImportError as err:
+    asyncpg = None
+    print(f"AsyncPG, Module Import Error {err}, AsyncPostgreSQL (DEST=5) unavailable")
+
+# Optional, only needed for DEST=6
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    print("PyArrow Module Import Successful")
+    
+except ImportError as err:
+    pa = None
+    print(f"PyArrow, Module Import Error {err}, Parquet (DEST=6) unavailable")
+
+# Optional, only needed for DEST=7 with JSONL_COMPRESSION=zstd
+try:
+    import zstandard
+    
+except ImportError:
+    zstandard = None
+
 try:
     import redis
     from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
@@ -60,6 +105,9 @@ except ImportError as err:
     print("Confluent Kafka, Module Import Error {err}")
     sys.exit(1)
 
+import json_codec
+from kafka_serde import AvroSerializer, create_schema_registry, ADULT_SCHEMA, CHILD_SCHEMA, FAMILY_SCHEMA
+
 
 class DatabaseConnectionError(Exception):
     
@@ -137,6 +185,19 @@ class DatabaseConnection(ABC):
 #end DatabaseConnection
 
 
+def encode_documents(documents: List[Dict[str, Any]]) -> List[Any]:
+    
+    """
+    Pre-encode documents to RawBSONDocument, see MONGO_RAW_BSON.
+    
+    Called where the documents are generated (the generation process/thread) so insert_many() only has to
+    frame the already encoded bytes instead of walking and encoding every dict on the writer.
+    """
+    
+    return [RawBSONDocument(bson.encode(document)) for document in documents]
+#end encode_documents
+
+
 class MongoDBConnection(DatabaseConnection):
     
     """MongoDB connection and operations class"""
@@ -149,6 +210,29 @@ class MongoDBConnection(DatabaseConnection):
         self.client      = None
         self.database    = None
         self.collections = {}
+        
+        # Bulk load tuning, unordered inserts and the collection write concern, e.g. w=1/j=False or w=0
+        self.ordered     = bool(int(config_params.get("MONGO_ORDERED", 0)))
+        write_w          = str(config_params.get("MONGO_WRITE_W", "1"))
+        self.write_concern = WriteConcern(
+            w = int(write_w) if write_w.isdigit() else write_w,                         # 0, 1, ... or "majority"
+            j = bool(int(config_params.get("MONGO_JOURNAL", 0)))
+        )
+        
+        # Parallel writer, MONGO_STREAMS concurrent insert_many streams per collection, 0 => insert in the caller,
+        # spread over MONGO_CLIENTS MongoClients (each with its own connection pool)
+        self.streams        = max(0, int(config_params.get("MONGO_STREAMS",   2)))
+        self.num_clients    = max(1, int(config_params.get("MONGO_CLIENTS",   1)))
+        self.pool_size      = int(config_params.get("MONGO_POOL_SIZE",        100))
+        self.compressors    = config_params.get("MONGO_COMPRESSORS",          "zstd,snappy")
+        self.clients        = []
+        self._executors     = {}                        # store_name -> ThreadPoolExecutor
+        self._slots         = {}                        # store_name -> BoundedSemaphore, caps batches queued per collection
+        self._stream_ids    = itertools.count()
+        self._local         = threading.local()
+        self._pending       = set()
+        self._counters      = {}                        # store_name -> {documents, batches, busy, started}
+        self._lock          = threading.Lock()
     #end __init__
      
         
@@ -160,12 +244,18 @@ class MongoDBConnection(DatabaseConnection):
             mongo_uri = self._build_mongo_uri()                                
             self.mylogger.debug(f'MongoDB Connection URI: {mongo_uri}')
 
-            self.client = pymongo.MongoClient(
-                mongo_uri,
-                serverSelectionTimeoutMS=5000,          # 5 second timeout
-                connectTimeoutMS        =10000,         # 10 second connection timeout
-                socketTimeoutMS         =20000          # 20 second socket timeout
-            )
+            client_options = {
+                "serverSelectionTimeoutMS": 5000,       # 5 second timeout
+                "connectTimeoutMS":         10000,      # 10 second connection timeout
+                "socketTimeoutMS":          20000,      # 20 second socket timeout
+                "maxPoolSize":              self.pool_size
+            }
+            if self.compressors:
+                client_options["compressors"] = self.compressors          # Unavailable compressors are dropped with a warning
+            
+            #end if
+            self.clients  = [pymongo.MongoClient(mongo_uri, **client_options) for _ in range(self.num_clients)]
+            self.client   = self.clients[0]
             self.client.server_info()  # Force connection test
             self.database = self.client[self.config_params["MONGO_DATASTORE"]]
 
@@ -235,7 +325,7 @@ class MongoDBConnection(DatabaseConnection):
                 raise DatabaseConnectionError("Database not connected")
             
             #end if
-            self.collections[store_name] = self.database[store_name]
+            self.collections[store_name] = self.database.get_collection(store_name, write_concern=self.write_concern)
             self.mylogger.info('MongoDB collection reference created: {host} {dbstore} {store_name}'.format(
                 host            = self.config_params["MONGO_HOST"],
                 dbstore         = self.config_params["MONGO_DATASTORE"],
@@ -282,7 +372,7 @@ class MongoDBConnection(DatabaseConnection):
                 
             #end if
             collection = self.get_collection(store_name)
-            result     = collection.insert_many(data)
+            result     = collection.insert_many(data, ordered=self.ordered)
             
             self.mylogger.debug('MongoDB inserted : {result_id} documents into {store_name}'.format(
                 result_id       = len(result.inserted_ids),
@@ -303,12 +393,124 @@ class MongoDBConnection(DatabaseConnection):
     #end insert_multiple
     
     
+    def _stream_collection(self, store_name: str):
+        
+        """Collection handle on the calling stream thread's client"""
+        
+        client_index = getattr(self._local, "client_index", 0)
+        if client_index == 0:
+            return self.get_collection(store_name)
+        
+        #end if
+        collections = self._local.__dict__.setdefault("collections", {})
+        if store_name not in collections:
+            database                = self.clients[client_index][self.config_params["MONGO_DATASTORE"]]
+            collections[store_name] = database.get_collection(store_name, write_concern=self.write_concern)
+        
+        #end if
+        return collections[store_name]
+    #end _stream_collection
+    
+    
+    def _init_stream(self):
+        
+        """Stream thread initializer, spreads the stream threads round robin over the clients"""
+        
+        self._local.client_index = next(self._stream_ids) % len(self.clients)
+    #end _init_stream
+    
+    
+    def _stream_insert(self, data: List[Any], store_name: str) -> int:
+        
+        """
+        One insert_many on a stream thread, counted towards the collection's throughput.
+        
+        Raises:
+            DatabaseOperationError: Via the batch's Future, if the insert failed
+        """
+        
+        start = time.perf_counter()
+        try:
+            self._stream_collection(store_name).insert_many(data, ordered=self.ordered)
+            
+        except Exception as err:
+            self.mylogger.error('MongoDB stream insert error: {host} {dbstore} {store_name} {err}'.format(
+                host            = self.config_params["MONGO_HOST"],
+                dbstore         = self.config_params["MONGO_DATASTORE"],
+                store_name      = store_name,
+                err             = err
+            ))
+            raise DatabaseOperationError(f"MongoDB stream insert into {store_name} failed: {err}") from err
+        #end try
+        
+        with self._lock:
+            counters               = self._counters[store_name]
+            counters["documents"] += len(data)
+            counters["batches"]   += 1
+            counters["busy"]      += time.perf_counter() - start
+        #end with
+        
+        return len(data)
+    #end _stream_insert
+    
+    
+    def _submit(self, data: List[Any], store_name: str):
+        
+        """
+        Queue a batch on the collection's streams, blocks while 2 x MONGO_STREAMS batches are queued for it.
+        
+        Returns:
+            The batch's Future, a failed insert only fails this batch
+        """
+        
+        with self._lock:
+            if store_name not in self._executors:
+                self._executors[store_name] = concurrent.futures.ThreadPoolExecutor(max_workers        = self.streams, 
+                                                                                    thread_name_prefix = f"Mongo-{store_name}", 
+                                                                                    initializer        = self._init_stream)
+                self._slots[store_name]     = threading.BoundedSemaphore(self.streams * 2)
+                self._counters[store_name]  = {"documents": 0, "batches": 0, "busy": 0.0, "started": time.perf_counter()}
+            
+            #end if
+            executor = self._executors[store_name]
+            slots    = self._slots[store_name]
+        #end with
+        
+        slots.acquire()
+        future = executor.submit(self._stream_insert, data, store_name)
+        
+        with self._lock:
+            self._pending.add(future)
+        #end with
+        
+        def _done(done):
+            with self._lock:
+                self._pending.discard(done)
+            #end with
+            slots.release()
+        #end _done
+        
+        future.add_done_callback(_done)
+        
+        return future
+    #end _submit
+    
+    
     def insert(self, data: Union[Dict[str, Any], List[Dict[str, Any]]], **kwargs) -> Any:
         
-        """Universal insert method that routes to single or multiple insert"""
+        """
+        Universal insert method that routes to single or multiple insert.
+        
+        With MONGO_STREAMS > 0 a list is queued on the collection's insert streams instead and a Future is returned,
+        adults, children and families then load concurrently. A failed stream insert fails that batch's Future with a
+        DatabaseOperationError, flush() raises for any that were still in flight when it was called.
+        """
         
         if isinstance(data, list):
-            if len(data) > 1:
+            if self.streams and data:
+                return self._submit(data, kwargs["store_name"])
+            
+            elif len(data) > 1:
                 return self.insert_multiple(data, **kwargs)
             
             elif len(data) == 1:
@@ -322,6 +524,53 @@ class MongoDBConnection(DatabaseConnection):
     #end insert
     
     
+    def flush(self, timeout: Optional[float] = None):
+        
+        """
+        Wait for every queued stream insert.
+        
+        Raises:
+            DatabaseOperationError: If any insert still in flight failed, earlier failures are on their batch's Future
+        """
+        
+        with self._lock:
+            pending = list(self._pending)
+        #end with
+        
+        concurrent.futures.wait(pending, timeout=timeout)
+        
+        failed = [future.exception() for future in pending if future.done() and not future.cancelled() and future.exception()]
+        if failed:
+            raise DatabaseOperationError(f"MongoDB {len(failed)} stream insert(s) failed: {failed[0]}")
+        #end if
+    #end flush
+    
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        
+        """
+        Per collection throughput counters.
+        
+        Returns:
+            {store_name: {documents, batches, busy_secs, docs_per_sec}}, docs_per_sec over wall time since the
+            collection's first insert
+        """
+        
+        with self._lock:
+            now = time.perf_counter()
+            return {
+                store_name: {
+                    "documents":    counters["documents"],
+                    "batches":      counters["batches"],
+                    "busy_secs":    round(counters["busy"], 2),
+                    "docs_per_sec": round(counters["documents"] / max(now - counters["started"], 1e-9), 2)
+                }
+                for store_name, counters in self._counters.items()
+            }
+        #end with
+    #end stats
+    
+    
     def health_check(self) -> bool:
         
         """Perform MongoDB health check"""
@@ -344,7 +593,31 @@ class MongoDBConnection(DatabaseConnection):
         """Close MongoDB connection"""
         
         if self.client:
-            self.client.close()
+            try:
+                self.flush()
+            
+            except DatabaseOperationError as err:
+                self.mylogger.error('MongoDB stream inserts failed before disconnect: {err}'.format(
+                    err = err
+                ))
+            #end try
+            
+            for store_name, counters in self.stats().items():
+                self.mylogger.info('MongoDB {store_name}: {documents} documents in {batches} batches, {rate} docs/sec'.format(
+                    store_name  = store_name,
+                    documents   = counters["documents"],
+                    batches     = counters["batches"],
+                    rate        = counters["docs_per_sec"]
+                ))
+            #end for
+            
+            for executor in self._executors.values():
+                executor.shutdown(wait=True)
+            #end for
+            
+            for client in self.clients:
+                client.close()
+            #end for
             self.mylogger.error('MongoDB connection closed: {host} {dbstore}'.format(
                 host            = self.config_params["MONGO_HOST"],
                 dbstore         = self.config_params["MONGO_DATASTORE"]
@@ -354,6 +627,95 @@ class MongoDBConnection(DatabaseConnection):
 #end MongoConnection
 
 
+# Text format COPY escapes, see https://www.postgresql.org/docs/current/sql-copy.html#id-1.9.3.55.9.2
+_COPY_TEXT_ESCAPES  = str.maketrans({'\\': '\\\\', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
+
+# Binary format COPY framing
+_COPY_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+_COPY_BINARY_FOOTER = struct.pack('!h', -1)
+_JSONB_VERSION      = b'\x01'
+
+
+def _copy_text_rows(rows: List[Dict[str, Any]], extract_unique_id: bool):
+    
+    """COPY text format lines, uniqueId<TAB>data or just data, one per document"""
+    
+    for row in rows:
+        data = json_codec.dumps(row).translate(_COPY_TEXT_ESCAPES)
+        if extract_unique_id:
+            yield f"{str(row['uniqueId']).translate(_COPY_TEXT_ESCAPES)}\t{data}\n".encode('utf-8')
+        
+        else:
+            yield f"{data}\n".encode('utf-8')
+        
+        #end if
+    #end for
+#end _copy_text_rows
+
+
+def _copy_binary_rows(rows: List[Dict[str, Any]], extract_unique_id: bool):
+    
+    """COPY binary format tuples, varchar as utf-8, jsonb as the version byte followed by the JSON text"""
+    
+    yield _COPY_BINARY_HEADER
+    
+    for row in rows:
+        data = _JSONB_VERSION + json_codec.dumpb(row)
+        if extract_unique_id:
+            unique_id = str(row['uniqueId']).encode('utf-8')
+            yield struct.pack('!hi', 2, len(unique_id)) + unique_id + struct.pack('!i', len(data)) + data
+        
+        else:
+            yield struct.pack('!hi', 1, len(data)) + data
+        
+        #end if
+    #end for
+    
+    yield _COPY_BINARY_FOOTER
+#end _copy_binary_rows
+
+
+class _CopyStream:
+    
+    """
+    File like wrapper psycopg2's copy_expert() reads from, pulls the encoded rows from the generator as the server
+    asks for them, so the batch is never held as one big string.
+    """
+    
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = bytearray()
+    #end __init__
+    
+    
+    def read(self, size: int = -1) -> bytes:
+        
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            
+            #end if
+            self._buffer += chunk
+        #end while
+        
+        if size < 0:
+            size = len(self._buffer)
+        #end if
+        
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        
+        return data
+    #end read
+    
+    
+    def readline(self, size: int = -1) -> bytes:
+        return self.read(size)
+    #end readline
+#end _CopyStream
+
+
 class PostgreSQLConnection(DatabaseConnection):
     
     """PostgreSQL connection and operations class"""
@@ -361,25 +723,92 @@ class PostgreSQLConnection(DatabaseConnection):
     def __init__(self, config_params: Dict[str, Any], mylogger):
         super().__init__(config_params, mylogger)
         
+        # insert => INSERT ... SELECT jsonb_array_elements, copy => COPY straight into the table,
+        # merge  => COPY into a temp staging table then INSERT ... ON CONFLICT (uniqueId) DO NOTHING
+        self.load_mode   = config_params.get("POSTGRES_LOAD",        "merge").lower()
+        self.copy_format = config_params.get("POSTGRES_COPY_FORMAT", "text").lower()
+        
+        if self.load_mode not in ("insert", "copy", "merge"):
+            raise ValueError(f"Unsupported PostgreSQL load mode: {self.load_mode}")
+        
+        #end if
+        if self.copy_format not in ("text", "binary"):
+            raise ValueError(f"Unsupported PostgreSQL COPY format: {self.copy_format}")
+        
+        #end if
+        
+        # POSTGRES_POOL > 1 => every writer thread gets its own session from a ThreadedConnectionPool,
+        # POSTGRES_COMMIT_EVERY => commit once per K insert calls per session instead of every call
+        self.pool_size    = max(1, int(config_params.get("POSTGRES_POOL",         1)))
+        self.commit_every = max(1, int(config_params.get("POSTGRES_COMMIT_EVERY", 1)))
+        self.pool         = None
+        self._local       = threading.local()
+        self._sessions    = {}                          # id(connection) -> [connection, uncommitted insert calls]
+        self._lock        = threading.Lock()
     #end __init__
     
     
+    def _connect_params(self) -> Dict[str, Any]:
+        
+        return {
+            "host":             self.config_params["POSTGRES_HOST"],
+            "database":         self.config_params["POSTGRES_DB"],
+            "user":             self.config_params["POSTGRES_USER"],
+            "password":         self.config_params["POSTGRES_PASSWORD"],
+            "connect_timeout":  10                      # 10 second timeout
+        }
+    #end _connect_params
+    
+    
+    def _thread_connection(self):
+        
+        """The calling thread's session, taken from the pool on first use when pooled"""
+        
+        if self.pool is None:
+            return self.connection
+        
+        #end if
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection             = self.pool.getconn(key=threading.get_ident())
+            self._local.connection = connection
+            
+            # Thread idents get reused, a new thread may pick up a finished thread's session, keep its count
+            with self._lock:
+                self._sessions.setdefault(id(connection), [connection, 0])
+            #end with
+        #end if
+        
+        return connection
+    #end _thread_connection
+    
+    
     def connect(self) -> bool:
         
         """Establish PostgreSQL connection"""
         
         try:
-            self.connection = psycopg2.connect(
-                host            = self.config_params["POSTGRES_HOST"],
-                database        = self.config_params["POSTGRES_DB"],
-                user            = self.config_params["POSTGRES_USER"],
-                password        = self.config_params["POSTGRES_PASSWORD"],
-                connect_timeout = 10  # 10 second timeout
-            )
-
+            if self.pool_size > 1:
+                # Every writer thread keeps its session for its lifetime, as does this (the connecting) thread
+                pool_max = max(self.pool_size, int(self.config_params.get("WRITERS", 1)) + 1)
+                if pool_max > self.pool_size:
+                    self.mylogger.warning('PostgreSQL pool raised from {pool_size} to {pool_max}, WRITERS + 1 sessions are needed'.format(
+                        pool_size = self.pool_size,
+                        pool_max  = pool_max
+                    ))
+                
+                #end if
+                self.pool       = ThreadedConnectionPool(1, pool_max, **self._connect_params())
+                self.connection = self._thread_connection()
+                
+            else:
+                self.connection = psycopg2.connect(**self._connect_params())
+                self._sessions[id(self.connection)] = [self.connection, 0]
+            
+            #end if
             self._is_connected = True
             self.mylogger.debug('PostgreSQL connection established to: {host} {dbstore}'.format(
-                connection    = self.config_params["POSTGRES_HOST"],
+                host          = self.config_params["POSTGRES_HOST"],
                 dbstore       = self.config_params["POSTGRES_DB"]
             ))
             return True
@@ -404,21 +833,40 @@ class PostgreSQLConnection(DatabaseConnection):
     @contextmanager
     def get_cursor(self):
         
-        """Context manager for database cursor"""
+        """
+        Context manager for database cursor, on the calling thread's session.
+        
+        Commits every commit_every calls, a failure rolls back everything since the last commit on this session,
+        i.e. with commit_every > 1 earlier, already reported, insert calls can be lost with it, which is logged.
+        """
         
         if not self.connection:
             raise DatabaseConnectionError("PostgreSQL not connected")
         
         #end if
         
-        cursor = self.connection.cursor()
+        connection = self._thread_connection()
+        session    = self._sessions[id(connection)]
+        cursor     = connection.cursor()
         
         try:
             yield cursor
-            self.connection.commit()
             
+            session[1] += 1
+            if session[1] >= self.commit_every:
+                connection.commit()
+                session[1] = 0
+            
+            #end if
         except Exception:
-            self.connection.rollback()
+            connection.rollback()
+            
+            if session[1] > 0:
+                self.mylogger.warning('PostgreSQL rollback discarded {count} uncommitted earlier insert calls'.format(
+                    count = session[1]
+                ))
+            #end if
+            session[1] = 0
             raise
         
         finally:
@@ -427,6 +875,25 @@ class PostgreSQLConnection(DatabaseConnection):
     #end get_cursor
     
     
+    def commit(self):
+        
+        """Commit whatever is outstanding on every session, see POSTGRES_COMMIT_EVERY"""
+        
+        with self._lock:
+            sessions = list(self._sessions.values())
+        #end with
+        
+        for session in sessions:
+            connection, pending = session
+            if pending and not connection.closed:
+                connection.commit()
+                session[1] = 0
+            
+            #end if
+        #end for
+    #end commit
+    
+    
     def insert_single(self, 
                       data:         Dict[str, Any], 
                       store_name:   str = "documents", 
@@ -447,7 +914,7 @@ class PostgreSQLConnection(DatabaseConnection):
         
         try:
             with self.get_cursor() as cursor:
-                json_string = json.dumps(data)
+                json_string = json_codec.dumps(data)
                 
                 if unique_id is not None:
                     query = sql.SQL("""
@@ -518,17 +985,23 @@ class PostgreSQLConnection(DatabaseConnection):
             
             #end if
                 
+            if self.load_mode != "insert":
+                return self.copy_multiple(data, store_name=store_name, extract_unique_id=extract_unique_id)
+            
+            #end if
             with self.get_cursor() as cursor:
-                json_array_string = json.dumps(data)
+                json_array_string = json_codec.dumpb_array(data).decode('utf-8')
                 
                 if extract_unique_id:
+                    # Expand the array once, each element gives both columns
                     query = sql.SQL("""
                         INSERT INTO {store_name} (uniqueId, data)
-                        SELECT (jsonb_array_elements(%s)->>'uniqueId'), jsonb_array_elements(%s)
+                        SELECT elem->>'uniqueId', elem
+                        FROM jsonb_array_elements(%s::jsonb) AS elem
                         ON CONFLICT (uniqueId) DO NOTHING;
                     """).format(store_name=sql.Identifier(store_name))
                     
-                    cursor.execute(query, (json_array_string, json_array_string))
+                    cursor.execute(query, (json_array_string,))
                     
                 else:
                     query = sql.SQL("""
@@ -562,6 +1035,91 @@ class PostgreSQLConnection(DatabaseConnection):
     #end insert_multiple
     
     
+    def copy_multiple(self, 
+                      data:               List[Dict[str, Any]], 
+                      store_name:         str = "families", 
+                      extract_unique_id:  bool = False, 
+                      **kwargs) -> None:
+        
+        """
+        Bulk load JSON documents with COPY ... FROM STDIN, the rows are streamed to the server as they are encoded.
+        
+        In merge mode (POSTGRES_LOAD=merge) tables keyed on uniqueId are loaded through a temp staging table and
+        merged with ON CONFLICT (uniqueId) DO NOTHING, the same conflict semantics as the INSERT path. In copy mode
+        the rows go straight into the table, a duplicate uniqueId then fails the whole batch.
+        
+        Args:
+            data:               List of dictionaries to insert
+            store_name:         Name of the table
+            extract_unique_id:  Whether to extract uniqueId from JSON data
+        """
+        
+        try:
+            if not data:
+                return
+            
+            #end if
+            columns = ["uniqueid", "data"] if extract_unique_id else ["data"]
+            merge   = extract_unique_id and self.load_mode == "merge"
+            
+            if self.copy_format == "binary":
+                stream = _CopyStream(_copy_binary_rows(data, extract_unique_id))
+                
+            else:
+                stream = _CopyStream(_copy_text_rows(data, extract_unique_id))
+            
+            #end if
+            with self.get_cursor() as cursor:
+                target = sql.Identifier(store_name)
+                
+                if merge:
+                    target = sql.Identifier(f"{store_name}_stage")
+                    cursor.execute(sql.SQL("""
+                        CREATE TEMP TABLE IF NOT EXISTS {stage} (uniqueId varchar(14), data JSONB) ON COMMIT DELETE ROWS;
+                    """).format(stage=target))
+                
+                #end if
+                copy_query = sql.SQL("COPY {target} ({columns}) FROM STDIN WITH (FORMAT {fmt})").format(
+                    target  = target,
+                    columns = sql.SQL(', ').join(map(sql.Identifier, columns)),
+                    fmt     = sql.SQL(self.copy_format)
+                )
+                cursor.copy_expert(copy_query.as_string(cursor), stream)
+                
+                if merge:
+                    cursor.execute(sql.SQL("""
+                        INSERT INTO {store_name} (uniqueId, data)
+                        SELECT uniqueId, data FROM {stage}
+                        ON CONFLICT (uniqueId) DO NOTHING;
+                        TRUNCATE {stage};
+                    """).format(store_name=sql.Identifier(store_name), stage=target))
+                
+                #end if
+                self.mylogger.debug('PostgreSQL COPY ({mode}, {fmt}) loaded {count} records into {store_name}'.format(
+                    mode        = self.load_mode,
+                    fmt         = self.copy_format,
+                    count       = len(data),
+                    store_name  = store_name
+                ))
+            #end with
+        except PostgreSQLError as err:
+            self.mylogger.error('PostgreSQL COPY error in {store_name}: {err}'.format(
+                store_name = store_name,
+                err        = err
+            ))
+            raise DatabaseOperationError(f"PostgreSQL COPY failed: {err}")
+        
+        except Exception as err:
+            self.mylogger.error('PostgreSQL COPY error in {store_name}: {err}'.format(
+                store_name    = store_name,
+                err           = err
+            ))  
+            
+            raise DatabaseOperationError(f"PostgreSQL COPY failed: {err}")
+        #end try
+    #end copy_multiple
+    
+    
     def insert(self, data: Union[Dict[str, Any], List[Dict[str, Any]]], **kwargs) -> Any:
         
         """Universal insert method that routes to single or multiple insert"""
@@ -656,17 +1214,312 @@ class PostgreSQLConnection(DatabaseConnection):
     
     def disconnect(self):
         
-        """Close PostgreSQL connection"""
+        """Commit outstanding work and close the PostgreSQL connection(s)"""
         
         if self.connection:
-            self.connection.close()
-            self.mylogger.info('PostgreSQL connection closed')
-        #end if
-    #end disconnect
-# end PostgreSQLConnection
-
-
-class RedisConnection(DatabaseConnection):
+            try:
+                self.commit()
+            
+            except PostgreSQLError as err:
+                self.mylogger.error('PostgreSQL final commit failed: {err}'.format(
+                    err = err
+                ))
+            #end try
+            
+            if self.pool is not None:
+                self.pool.closeall()
+                
+            else:
+                self.connection.close()
+            
+            #end if
+            self.mylogger.info('PostgreSQL connection closed')
+        #end if
+    #end disconnect
+# end PostgreSQLConnection
+
+
+class AsyncPostgreSQLConnection(DatabaseConnection):
+    
+    """
+    Asyncio PostgreSQL sink on asyncpg, DEST=5.
+    
+    An asyncpg pool runs on its own event loop in a background thread. insert() schedules the load on that loop
+    and returns straight away with a concurrent.futures.Future, so up to POSTGRES_INFLIGHT batches are in flight
+    on the pool's connections without a thread per connection, insert() blocks once that many are outstanding.
+    Asyncio code can await insert_async() directly on the sink's loop.
+    
+    Loads use copy_records_to_table (binary COPY), tables keyed on uniqueId go through a temp staging table and
+    INSERT ... ON CONFLICT (uniqueId) DO NOTHING, like PostgreSQLConnection's merge mode.
+    
+    A failed load is logged when it completes and fails only its own batch's Future with a DatabaseOperationError,
+    flush()/disconnect() report the loads that were still in flight when they were called.
+    """
+    
+    def __init__(self, config_params: Dict[str, Any], mylogger):
+        super().__init__(config_params, mylogger)
+        
+        self.inflight       = max(1, int(config_params.get("POSTGRES_INFLIGHT", 8)))
+        self.pool           = None
+        self.loop           = None
+        self._loop_thread   = None
+        self._slots         = threading.BoundedSemaphore(self.inflight)
+        self._pending       = set()
+        self._lock          = threading.Lock()
+    #end __init__
+    
+    
+    def _run(self, coro, timeout: Optional[float] = None):
+        
+        """Run a coroutine on the sink's loop and wait for the result, from any other thread"""
+        
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+    #end _run
+    
+    
+    def connect(self) -> bool:
+        
+        """Start the event loop thread and open the asyncpg pool"""
+        
+        if asyncpg is None:
+            raise DatabaseConnectionError("AsyncPostgreSQL sink needs the asyncpg package, pip install asyncpg")
+        
+        #end if
+        try:
+            self.loop         = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self.loop.run_forever, name="AsyncPostgreSQL", daemon=True)
+            self._loop_thread.start()
+            
+            self.pool         = self._run(asyncpg.create_pool(
+                host            = self.config_params["POSTGRES_HOST"],
+                port            = int(self.config_params["POSTGRES_PORT"]),
+                database        = self.config_params["POSTGRES_DB"],
+                user            = self.config_params["POSTGRES_USER"],
+                password        = self.config_params["POSTGRES_PASSWORD"],
+                min_size        = 1,
+                max_size        = self.inflight,
+                timeout         = 10                    # 10 second timeout
+            ))
+            self.connection    = self.pool
+            self._is_connected = True
+            
+            self.mylogger.info('AsyncPostgreSQL pool established to: {host} {dbstore}, {inflight} batches in flight'.format(
+                host        = self.config_params["POSTGRES_HOST"],
+                dbstore     = self.config_params["POSTGRES_DB"],
+                inflight    = self.inflight
+            ))
+            return True
+            
+        except Exception as err:
+            self.mylogger.error('AsyncPostgreSQL connection failed: {dbstore} {err}'.format(
+                dbstore = self.config_params["POSTGRES_DB"],
+                err     = err
+            ))
+            self._stop_loop()
+            raise DatabaseConnectionError(f"AsyncPostgreSQL connection failed: {err}")
+        #end try
+    #end connect
+    
+    
+    async def insert_async(self, 
+                           data:               List[Dict[str, Any]], 
+                           store_name:         str = "families", 
+                           extract_unique_id:  bool = False, 
+                           **kwargs) -> int:
+        
+        """
+        Load a batch of JSON documents, coroutine, must run on the sink's loop.
+        
+        Returns:
+            Number of documents sent
+        """
+        
+        if not data:
+            return 0
+        
+        #end if
+        async with self.pool.acquire() as connection:
+            if extract_unique_id:
+                records = [(str(row["uniqueId"]), json_codec.dumps(row)) for row in data]
+                stage   = f"{store_name}_stage"
+                
+                async with connection.transaction():
+                    await connection.execute(f"""
+                        CREATE TEMP TABLE IF NOT EXISTS "{stage}" (uniqueId varchar(14), data JSONB) ON COMMIT DELETE ROWS;
+                    """)
+                    await connection.copy_records_to_table(stage, records=records, columns=["uniqueid", "data"])
+                    await connection.execute(f"""
+                        INSERT INTO "{store_name}" (uniqueId, data)
+                        SELECT uniqueId, data FROM "{stage}"
+                        ON CONFLICT (uniqueId) DO NOTHING;
+                    """)
+                #end async with
+            else:
+                records = [(json_codec.dumps(row),) for row in data]
+                await connection.copy_records_to_table(store_name, records=records, columns=["data"])
+            
+            #end if
+        #end async with
+        
+        self.mylogger.debug('AsyncPostgreSQL loaded {count} records into {store_name}'.format(
+            count       = len(data),
+            store_name  = store_name
+        ))
+        return len(data)
+    #end insert_async
+    
+    
+    async def _load(self, data: List[Dict[str, Any]], store_name: str, extract_unique_id: bool) -> int:
+        
+        """insert_async() for insert(), a failure becomes a DatabaseOperationError on this batch's future"""
+        
+        try:
+            return await self.insert_async(data, store_name=store_name, extract_unique_id=extract_unique_id)
+        
+        except Exception as err:
+            self.mylogger.error('AsyncPostgreSQL load error in {store_name}: {err}'.format(
+                store_name = store_name,
+                err        = err
+            ))
+            raise DatabaseOperationError(f"AsyncPostgreSQL load into {store_name} failed: {err}") from err
+        #end try
+    #end _load
+    
+    
+    def _done(self, future):
+        
+        """Completion callback, frees the in flight slot"""
+        
+        with self._lock:
+            self._pending.discard(future)
+        #end with
+        self._slots.release()
+    #end _done
+    
+    
+    def insert(self, data: Union[Dict[str, Any], List[Dict[str, Any]]], store_name: str = "families", extract_unique_id: bool = False, **kwargs) -> Any:
+        
+        """
+        Schedule a batch load and return without waiting for it, blocks while POSTGRES_INFLIGHT loads are running.
+        
+        Returns:
+            concurrent.futures.Future resolving to the number of documents loaded, or failing with a
+            DatabaseOperationError if this batch's load failed
+        """
+        
+        if not self._is_connected:
+            raise DatabaseConnectionError("AsyncPostgreSQL not connected")
+        
+        #end if
+        if isinstance(data, dict):
+            data = [data]
+        
+        #end if
+        self._slots.acquire()
+        future = asyncio.run_coroutine_threadsafe(self._load(data, store_name, extract_unique_id), self.loop)
+        
+        with self._lock:
+            self._pending.add(future)
+        #end with
+        future.add_done_callback(self._done)
+        
+        return future
+    #end insert
+    
+    
+    def insert_single(self, data: Dict[str, Any], **kwargs) -> Any:
+        
+        """Insert single document, waits for it"""
+        
+        return self.insert([data], **kwargs).result()
+    #end insert_single
+    
+    
+    def insert_multiple(self, data: List[Dict[str, Any]], **kwargs) -> Any:
+        
+        """Insert multiple documents, waits for them"""
+        
+        return self.insert(data, **kwargs).result()
+    #end insert_multiple
+    
+    
+    def flush(self, timeout: Optional[float] = None):
+        
+        """
+        Wait for every load in flight.
+        
+        Raises:
+            DatabaseOperationError: If any load still in flight failed, earlier failures are on their batch's Future
+        """
+        
+        with self._lock:
+            pending = list(self._pending)
+        #end with
+        
+        concurrent.futures.wait(pending, timeout=timeout)
+        
+        failed = [future.exception() for future in pending if future.done() and not future.cancelled() and future.exception()]
+        if failed:
+            raise DatabaseOperationError(f"AsyncPostgreSQL {len(failed)} load(s) failed: {failed[0]}")
+        #end if
+    #end flush
+    
+    
+    def health_check(self) -> bool:
+
+        """Perform AsyncPostgreSQL health check"""
+
+        try:
+            if self.pool is not None:
+                return self._run(self.pool.fetchval("SELECT 1"), timeout=10) == 1
+            
+            #end if
+        except Exception as err:
+            self.mylogger.error('AsyncPostgreSQL health check failed: {err}'.format(
+                err = err
+            ))
+            self._is_connected = False
+        
+        return False
+    #end health_check
+    
+    
+    def _stop_loop(self):
+        
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._loop_thread.join()
+            self.loop.close()
+            self.loop = None
+        #end if
+    #end _stop_loop
+    
+    
+    def disconnect(self):
+        
+        """Wait for the loads in flight, close the pool and stop the loop"""
+        
+        if self.pool is not None:
+            try:
+                self.flush()
+            
+            except DatabaseOperationError as err:
+                self.mylogger.error('AsyncPostgreSQL loads failed before disconnect: {err}'.format(
+                    err = err
+                ))
+            #end try
+            
+            self._run(self.pool.close())
+            self.pool          = None
+            self._is_connected = False
+            self._stop_loop()
+            self.mylogger.info('AsyncPostgreSQL connection closed')
+        #end if
+    #end disconnect
+# end AsyncPostgreSQLConnection
+
+
+class RedisConnection(DatabaseConnection):
     
     """Redis connection and operations class"""
     
@@ -677,6 +1530,28 @@ class RedisConnection(DatabaseConnection):
         super().__init__(config_params, mylogger)
         
         self.client = None
+        
+        # Bulk load tuning, MULTI/EXEC per chunk or not, MSET when no TTL, commands per round trip and the number
+        # of chunks written concurrently (each on its own pooled connection)
+        self.transaction    = bool(int(config_params.get("REDIS_TRANSACTION", 0)))
+        self.use_mset       = bool(int(config_params.get("REDIS_MSET",        1)))
+        self.chunk_size     = int(config_params.get("REDIS_CHUNK",            500))       # 0 => whole batch in one round trip
+        self.pipelines      = max(1, int(config_params.get("REDIS_PIPELINES", 2)))
+        self._executor      = None
+        
+        # Storage layout
+        #   string  one compact JSON string per document, key store:id
+        #   hash    documents as fields of small hashes, key store:bucket:<crc32(id) % REDIS_HASH_BUCKETS>, field id.
+        #           Saves the per key overhead, the hashes stay listpack encoded as long as the documents per bucket
+        #           and the document size stay under hash-max-listpack-entries / hash-max-listpack-value (raise the
+        #           latter on the server, documents are a few hundred bytes). A TTL applies to the whole bucket.
+        #   json    RedisJSON (Redis Stack) document per key, JSON.SET store:id $
+        self.layout         = config_params.get("REDIS_LAYOUT", "string").lower()
+        self.hash_buckets   = max(1, int(config_params.get("REDIS_HASH_BUCKETS", 65536)))
+        
+        if self.layout not in ("string", "hash", "json"):
+            raise ValueError(f"Unsupported Redis layout: {self.layout}")
+        #end if
     #end __init__
         
     
@@ -695,6 +1570,11 @@ class RedisConnection(DatabaseConnection):
             # Test connection
             self.client.ping()
             self._is_connected = True
+            
+            if self.pipelines > 1:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.pipelines, thread_name_prefix="Redis-pipeline")
+            
+            #end if
             self.mylogger.info('Redis connection established to: {host}:{port}/{db}'.format(
                 host = self.config_params["REDIS_HOST"],
                 port = self.config_params.get("REDIS_PORT", 6379), 
@@ -800,6 +1680,25 @@ class RedisConnection(DatabaseConnection):
     #end _generate_key
     
     
+    def _bucket(self, redis_key: str) -> Tuple[str, str]:
+        
+        """Hash layout, the (bucket key, field) a store:id key lives under"""
+        
+        store_name, _, key_value = redis_key.rpartition(":")
+        bucket                   = zlib.crc32(key_value.encode("utf-8")) % self.hash_buckets
+        
+        return f"{store_name}:bucket:{bucket}", key_value
+    #end _bucket
+    
+    
+    def _encode(self, data: Dict[str, Any]) -> bytes:
+        
+        """Compact JSON, no whitespace between fields"""
+        
+        return json_codec.dumpb(data)
+    #end _encode
+    
+    
     def insert_single(self, 
                       data:             Dict[str, Any], 
                       store_name:  str, 
@@ -826,18 +1725,10 @@ class RedisConnection(DatabaseConnection):
             
             #end if
             
-            redis_key   = self._generate_key(store_name, key_field, data)
-            json_string = json.dumps(data, default=str)
-            
-            if ttl:
-                self.client.setex(redis_key, ttl, json_string)
+            redis_key = self._generate_key(store_name, key_field, data)
             
-            else:
-                self.client.set(redis_key, json_string)
+            self._write_chunk([(redis_key, self._encode(data))], ttl)
             
-            #end if
-        
-        
             self.mylogger.debug('Redis single document inserted with key: {redis_key}'.format(
                 redis_key = redis_key
             ))
@@ -870,7 +1761,12 @@ class RedisConnection(DatabaseConnection):
                         **kwargs) -> List[str]:
         
         """
-        Insert multiple JSON documents into Redis using pipeline
+        Insert multiple JSON documents into Redis using pipelines
+        
+        The batch is written in chunks of REDIS_CHUNK keys, each chunk one round trip: a single MSET when there
+        is no TTL (and REDIS_MSET is set), otherwise a pipeline of SET/SETEX (HSET per bucket, JSON.SET for the
+        hash and json layouts), wrapped in MULTI/EXEC only when REDIS_TRANSACTION is set. With REDIS_PIPELINES > 1
+        the chunks go out concurrently.
         
         Args:
             data:           List of dictionaries to insert
@@ -893,25 +1789,21 @@ class RedisConnection(DatabaseConnection):
             
             #end if
             
-            pipe       = self.client.pipeline()
-            redis_keys = []
-                        
-            for item in data:
-                redis_key   = self._generate_key(store_name, key_field, item)
-                json_string = json.dumps(item)
-                
-                if ttl:
-                    pipe.setex(redis_key, ttl, json_string)
-            
-                else:
-                    pipe.set(redis_key, json_string)
-                
-                #end if    
-                redis_keys.append(redis_key)
+            items      = [(self._generate_key(store_name, key_field, item), self._encode(item)) for item in data]
+            redis_keys = [redis_key for redis_key, _ in items]
+            chunk_size = self.chunk_size or len(items)
+            chunks     = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
             
-            #end for
+            if self._executor and len(chunks) > 1:
+                # list() waits for all of them and re-raises the first failure
+                list(self._executor.map(lambda chunk: self._write_chunk(chunk, ttl), chunks))
             
-            pipe.execute()
+            else:
+                for chunk in chunks:
+                    self._write_chunk(chunk, ttl)
+                
+                #end for
+            #end if
             
             self.mylogger.debug('Redis inserted {count} documents into {store_name}'.format(
                 count           = len(data),
@@ -938,6 +1830,74 @@ class RedisConnection(DatabaseConnection):
     #end insert_multiple
     
     
+    def _write_chunk(self, 
+                     chunk: List[tuple], 
+                     ttl:   Optional[int] = None):
+        
+        """Write one chunk of (key, json) pairs in a single round trip"""
+        
+        if self.layout == "hash":
+            buckets = {}
+            for redis_key, json_string in chunk:
+                bucket_key, field = self._bucket(redis_key)
+                buckets.setdefault(bucket_key, {})[field] = json_string
+            
+            #end for
+            pipe = self.client.pipeline(transaction=self.transaction)
+            
+            for bucket_key, mapping in buckets.items():
+                pipe.hset(bucket_key, mapping=mapping)
+                if ttl:
+                    pipe.expire(bucket_key, ttl)
+                
+                #end if
+            #end for
+            
+            pipe.execute()
+            return
+        
+        elif self.layout == "json":
+            pipe = self.client.pipeline(transaction=self.transaction)
+            
+            for redis_key, json_string in chunk:
+                pipe.execute_command("JSON.SET", redis_key, "$", json_string)
+                if ttl:
+                    pipe.expire(redis_key, ttl)
+                
+                #end if
+            #end for
+            
+            pipe.execute()
+            return
+        
+        #end if
+        if not ttl and self.use_mset:
+            if self.transaction:
+                self.client.pipeline(transaction=True).mset(dict(chunk)).execute()
+            
+            else:
+                self.client.mset(dict(chunk))                   # MSET is atomic on its own
+            
+            #end if
+            return
+        
+        #end if
+        pipe = self.client.pipeline(transaction=self.transaction)
+        
+        for redis_key, json_string in chunk:
+            if ttl:
+                pipe.setex(redis_key, ttl, json_string)
+            
+            else:
+                pipe.set(redis_key, json_string)
+            
+            #end if
+        #end for
+        
+        pipe.execute()
+    #end _write_chunk
+    
+    
     def insert(self, data: Union[Dict[str, Any], List[Dict[str, Any]]], **kwargs) -> Any:
         
         """Universal insert method that routes to single or multiple insert"""
@@ -976,14 +1936,7 @@ class RedisConnection(DatabaseConnection):
             
             #end if
             
-            json_string = self.client.get(redis_key)
-            
-            if json_string:
-                return json.loads(json_string)
-            
-            #end if
-            
-            return None
+            return self.get_many([redis_key])[0]
             
         except RedisError as err:
             self.mylogger.error('Redis get error for key {redis_key}: {err}'.format(
@@ -1003,17 +1956,26 @@ class RedisConnection(DatabaseConnection):
     #end get_by_key
     
     
-    def get_by_pattern(self, 
-                       pattern: str) -> Dict[str, Dict[str, Any]]:
+    def iter_by_pattern(self, 
+                        pattern:    str, 
+                        count:      int = 1000, 
+                        chunk_size: int = 500) -> Iterator[Tuple[str, Dict[str, Any]]]:
         
         """
-        Retrieve multiple documents by key pattern
+        Stream documents by key pattern, in constant memory.
+        
+        Keys are walked with SCAN (non blocking on the server, unlike KEYS), values fetched with one MGET per
+        chunk_size keys and decoded as they are yielded. SCAN may return a key more than once and keys deleted
+        while scanning are skipped. In the hash layout the pattern has to match bucket keys (store:bucket:*),
+        see iter_store().
         
         Args:
-            pattern: Redis key pattern (e.g., 'adults:*')
+            pattern:    Redis key pattern (e.g., 'adults:*')
+            count:      SCAN COUNT hint, keys the server looks at per call
+            chunk_size: Keys per MGET
             
-        Returns:
-            Dictionary mapping keys to their JSON data
+        Yields:
+            (key, document) pairs
         """
         
         try:
@@ -1022,29 +1984,157 @@ class RedisConnection(DatabaseConnection):
             
             #end if
             
-            keys = self.client.keys(pattern)
+            chunk = []
+            for key in self.client.scan_iter(match=pattern, count=count):
+                chunk.append(key)
+                
+                if len(chunk) >= chunk_size:
+                    yield from self._mget_chunk(chunk)
+                    chunk = []
+                
+                #end if
+            #end for
             
-            if not keys:
-                return {}
+            if chunk:
+                yield from self._mget_chunk(chunk)
             
             #end if
             
-            pipe = self.client.pipeline()
-            
-            for key in keys:
-                pipe.get(key)
-            
-            #end for
-            
-            values = pipe.execute()
-            
-            result = {}
-            for key, value in zip(keys, values):
-                if value:
-                    result[key] = json.loads(value)
-                    
-                #end if
+        except RedisError as err:
+            self.mylogger.error('Redis pattern scan error for {pattern}: {err}'.format(
+                pattern = pattern,
+                err     = err
+            ))
+            raise DatabaseOperationError(f"Redis pattern scan failed: {err}")
+        #end try
+    #end iter_by_pattern
+    
+    
+    def _mget_chunk(self, 
+                    keys: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        
+        """Fetch a chunk of scanned keys, yielding the documents that still exist"""
+        
+        if self.layout == "hash":
+            # Scanned keys are buckets, one HGETALL each, yielding the documents under their store:id key
+            pipe = self.client.pipeline(transaction=False)
+            for bucket_key in keys:
+                pipe.hgetall(bucket_key)
+            
+            #end for
+            
+            for bucket_key, fields in zip(keys, pipe.execute()):
+                store_name = bucket_key.rsplit(":bucket:", 1)[0]
+                for field, value in fields.items():
+                    yield f"{store_name}:{field}", json_codec.loads(value)
+                
+                #end for
+            #end for
+            return
+        
+        #end if
+        for key, document in zip(keys, self._fetch(keys)):
+            if document is not None:
+                yield key, document
+                
+            #end if
+        #end for
+    #end _mget_chunk
+    
+    
+    def _fetch(self, 
+               redis_keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        
+        """One round trip read of store:id keys in the configured layout, None where missing"""
+        
+        if self.layout == "hash":
+            pipe = self.client.pipeline(transaction=False)
+            for redis_key in redis_keys:
+                pipe.hget(*self._bucket(redis_key))
+            
+            #end for
+            values = pipe.execute()
+        
+        elif self.layout == "json":
+            # JSON.MGET with a $ path answers a JSON array of matches per key
+            values = [value and value[1:-1] for value in self.client.execute_command("JSON.MGET", *redis_keys, "$")]
+        
+        else:
+            values = self.client.mget(redis_keys)
+        
+        #end if
+        return [json_codec.loads(value) if value else None for value in values]
+    #end _fetch
+    
+    
+    def get_many(self, 
+                 redis_keys: List[str], 
+                 chunk_size: int = 500) -> List[Optional[Dict[str, Any]]]:
+        
+        """
+        Batched read of documents by store:id key, whatever the layout, one round trip per chunk_size keys
+        
+        Args:
+            redis_keys: Keys as returned by insert()
+            chunk_size: Keys per round trip
+            
+        Returns:
+            Documents in key order, None for keys that don't exist
+        """
+        
+        try:
+            if not self.client:
+                raise DatabaseConnectionError("Redis not connected")
+            
+            #end if
+            
+            documents = []
+            for i in range(0, len(redis_keys), chunk_size):
+                documents.extend(self._fetch(redis_keys[i:i + chunk_size]))
+            
             #end for
+            return documents
+            
+        except RedisError as err:
+            self.mylogger.error('Redis batched get error: {err}'.format(
+                err = err
+            ))
+            raise DatabaseOperationError(f"Redis batched get failed: {err}")
+        #end try
+    #end get_many
+    
+    
+    def iter_store(self, 
+                   store_name: str, 
+                   **kwargs) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        
+        """Stream every document of a store, whatever the layout, see iter_by_pattern()"""
+        
+        if self.layout == "hash":
+            return self.iter_by_pattern(f"{store_name}:bucket:*", **kwargs)
+        
+        #end if
+        return self.iter_by_pattern(f"{store_name}:*", **kwargs)
+    #end iter_store
+    
+    
+    def get_by_pattern(self, 
+                       pattern: str) -> Dict[str, Dict[str, Any]]:
+        
+        """
+        Retrieve multiple documents by key pattern
+        
+        Collects iter_by_pattern() into a dict, for large keyspaces iterate iter_by_pattern() instead.
+        
+        Args:
+            pattern: Redis key pattern (e.g., 'adults:*')
+            
+        Returns:
+            Dictionary mapping keys to their JSON data
+        """
+        
+        try:
+            result = dict(self.iter_by_pattern(pattern))
             
             self.mylogger.debug('Redis retrieved {count} documents with pattern {pattern}'.format(
                 count   = len(result),
@@ -1090,7 +2180,13 @@ class RedisConnection(DatabaseConnection):
             
             #end if
             
-            result = self.client.delete(redis_key)
+            if self.layout == "hash":
+                result = self.client.hdel(*self._bucket(redis_key))
+            
+            else:
+                result = self.client.delete(redis_key)
+            
+            #end if
             
             self.mylogger.debug('Redis key {redis_key} deleted: {result}'.format(
                 redis_key = redis_key,
@@ -1121,6 +2217,11 @@ class RedisConnection(DatabaseConnection):
         
         """Close Redis connection"""
         
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        #end if
         if self.client:
             self.client.close()
             self.mylogger.info('Redis connection closed: {host}:{port}'.format(
@@ -1132,6 +2233,10 @@ class RedisConnection(DatabaseConnection):
 #end RedisConnection
 
 
+# Delivery errors worth another attempt even though librdkafka doesn't flag them retriable
+_KAFKA_REQUEUE_ERRORS = (KafkaError._MSG_TIMED_OUT, KafkaError._PURGE_QUEUE, KafkaError._PURGE_INFLIGHT)
+
+
 class KafkaConnection(DatabaseConnection):
     
     """
@@ -1148,6 +2253,33 @@ class KafkaConnection(DatabaseConnection):
         self.initial_delay  = config_params["DELAY"]         # Initial delay for exponential backoff
         self.producer       = None
         
+        # Streaming mode, batches are produced and only polled, the producer flushes every KAFKA_CHECKPOINT
+        # batches (0 => at disconnect only) instead of waiting on the broker acks after every batch
+        self.streaming      = bool(int(config_params.get("KAFKA_STREAMING",    1)))
+        self.checkpoint     = int(config_params.get("KAFKA_CHECKPOINT",        0))
+        self.flush_timeout  = float(config_params.get("KAFKA_FLUSH_TIMEOUT",   30))
+        self.batches        = 0
+        
+        # Delivery accounting, filled in by the delivery reports, failed messages are re-produced up to
+        # KAFKA_DELIVERY_RETRIES times when the error is retriable
+        self.delivery_retries = int(config_params.get("KAFKA_DELIVERY_RETRIES", 3))
+        self._topics        = {}                        # topic -> {produced, delivered, failed, retried}
+        self._retry         = []                        # (topic, value, key, attempt) waiting to be re-produced
+        self._lock          = threading.Lock()
+        
+        # Value encoding, json or avro (schemas registered against SCHEMAREGISTRY_SERVERS at connect)
+        self.format         = config_params.get("KAFKA_FORMAT", "json").lower()
+        self._serializers   = {}                        # topic -> AvroSerializer
+        self._schemas       = {
+            config_params.get("ADULTS_STORE"):      ADULT_SCHEMA,
+            config_params.get("CHILDREN_STORE"):    CHILD_SCHEMA,
+            config_params.get("FAMILY_STORE"):      FAMILY_SCHEMA
+        }
+        
+        if self.format not in ("json", "avro"):
+            raise ValueError(f"Unsupported Kafka format: {self.format}")
+        #end if
+        
     #end __init__
     
     
@@ -1163,7 +2295,7 @@ class KafkaConnection(DatabaseConnection):
                 'sasl.username':        self.config_params["SASL_USERNAME"],
                 'sasl.password':        self.config_params["SASL_PASSWORD"],
                 'client.id':            socket.gethostname(),
-                'error_cb':             error_cb,
+                'error_cb':             lambda err: error_cb(err, self.mylogger),
             }
         else:
             conf = {
@@ -1171,18 +2303,27 @@ class KafkaConnection(DatabaseConnection):
                 "security.protocol":    self.config_params["SECURITY_PROTOCOL"],
                 "sasl.mechanism":       self.config_params["SASL_MECHANISMS"],
                 'client.id':            socket.gethostname(),
-                'error_cb':             error_cb,
+                'error_cb':             lambda err: error_cb(err, self.mylogger),
             }        
         # end
         
+        # Producer batching, bigger/longer batches and compression trade a little latency for throughput
+        conf.update({
+            'linger.ms':                    self.config_params.get("KAFKA_LINGER_MS",       20),
+            'batch.size':                   self.config_params.get("KAFKA_BATCH_SIZE",      1048576),
+            'compression.type':             self.config_params.get("KAFKA_COMPRESSION",     "lz4"),
+            'enable.idempotence':           bool(int(self.config_params.get("KAFKA_IDEMPOTENCE", 1))),
+            'acks':                         self.config_params.get("KAFKA_ACKS",            "all"),
+            'queue.buffering.max.messages': self.config_params.get("KAFKA_QUEUE_MAX",       1000000),
+        })
                 
         # if self.config_params.get("SCHEMAREGISTRY_SERVERS"):
         #     conf['schema.registry.url'] = self.config_params["SCHEMAREGISTRY_SERVERS"]
             
-            self.mylogger.debug("Kafka Connect Detail ({conn})...".format(
-                conn = conf
-            ))
-            return conf
+        self.mylogger.debug("Kafka Connect Detail ({conn})...".format(
+            conn = conf
+        ))
+        return conf
     #end _build_kafka_config
     
     
@@ -1193,6 +2334,11 @@ class KafkaConnection(DatabaseConnection):
         Retries up to self.max_retries times.
         """
         
+        # Whatever the old producer still holds is delivered, or handed over to the new one, not dropped
+        if self.producer is not None:
+            self._retire_producer()
+        
+        #end if
         delay = self.initial_delay
         for i in range(self.max_retries):
             self.mylogger.info("Attempting Kafka connection ({max_retries})...".format(
@@ -1227,26 +2373,305 @@ class KafkaConnection(DatabaseConnection):
     #end _reconnect_with_retry
     
     
+    def _retire_producer(self):
+        
+        """
+        Flush the producer before it gets replaced, messages it can't deliver within KAFKA_FLUSH_TIMEOUT are purged,
+        which hands them to _delivery_report() and from there to the retry queue, so the next producer sends them
+        again. Purged in-flight messages may have reached the broker already, i.e. at least once delivery.
+        """
+        
+        producer, self.producer = self.producer, None
+        
+        try:
+            try:
+                remaining = producer.flush(timeout=self.flush_timeout)
+            
+            except KafkaException as err:                   # error_cb, all brokers down
+                remaining = len(producer)
+            
+            #end try
+            if remaining:
+                producer.purge(in_queue=True, in_flight=True)
+                producer.poll(0)                            # Serves the purged messages' delivery reports
+                
+                self.mylogger.warning('Kafka producer replaced with {remaining} messages undelivered, queued to be produced again'.format(
+                    remaining = remaining
+                ))
+            #end if
+            
+        except Exception as err:
+            self.mylogger.error('Kafka producer flush before reconnect failed: {err}'.format(
+                err = err
+            ))
+        #end try
+    #end _retire_producer
+    
+    
     def connect(self) -> bool:
 
         """Establish Kafka producer connection, with retries."""
 
+        if self.format == "avro":
+            self._register_schemas()
+        
+        #end if
         return self._reconnect_with_retry()
     #end connect
     
     
+    def _register_schemas(self):
+        
+        """Register the adult/child/family value schemas under <topic>-value and build their serialisers"""
+        
+        try:
+            registry = create_schema_registry(self.config_params["SCHEMAREGISTRY_SERVERS"])
+            
+            for topic, schema in self._schemas.items():
+                schema_id                 = registry.register(f"{topic}-value", schema)
+                self._serializers[topic]  = AvroSerializer(schema, schema_id)
+                
+                self.mylogger.info("Kafka Avro schema {name} registered for {topic}, id {schema_id}".format(
+                    name      = schema["name"],
+                    topic     = topic,
+                    schema_id = schema_id
+                ))
+            #end for
+            
+        except Exception as err:
+            self.mylogger.error("Kafka schema registration failed: {registry} {err}".format(
+                registry = self.config_params["SCHEMAREGISTRY_SERVERS"],
+                err      = err
+            ))
+            raise DatabaseConnectionError(f"Kafka schema registration failed: {err}")
+        #end try
+    #end _register_schemas
+    
+    
+    def _encode(self, 
+                record:     Dict[str, Any], 
+                store_name: str) -> bytes:
+        
+        """Message value, JSON or Avro (Confluent wire format) depending on KAFKA_FORMAT"""
+        
+        if self.format == "avro":
+            serializer = self._serializers.get(store_name)
+            if serializer is None:
+                raise DatabaseOperationError(f"No Avro schema for topic: {store_name}")
+            
+            #end if
+            return serializer(record)
+        
+        #end if
+        return json_codec.dumpb(record)
+    #end _encode
+    
+    
     def disconnect(self):
         
         """Close Kafka producer connection and flush messages"""
         
         if self.producer:
             self.mylogger.debug('Final Flush of Kafka producer messages...')
-            self.producer.flush(timeout=10)
+            try:
+                remaining = self.flush()
+            
+            except KafkaException as err:                   # error_cb, all brokers down
+                remaining = len(self.producer)
+                self.mylogger.error('Kafka final flush failed: {err}'.format(
+                    err = err
+                ))
+            #end try
+            
+            if remaining:
+                # Out of time, purge so every message left gets its (failed) delivery report
+                self.producer.purge(in_queue=True, in_flight=True)
+                self.producer.poll(0)
+            
+            #end if
+            with self._lock:
+                for topic, value, key, attempt in self._retry:
+                    self._topics[topic]["failed"] += 1
+                #end for
+                self._retry = []
+                
+                # Every message produced, less the re-produced ones, ends up delivered or failed, anything without
+                # a delivery report by now is lost as well
+                for counters in self._topics.values():
+                    unresolved = counters["produced"] - counters["retried"] - counters["delivered"] - counters["failed"]
+                    if unresolved > 0:
+                        counters["failed"] += unresolved
+                    #end if
+                #end for
+            #end with
+            
+            for topic, counters in self.stats()["topics"].items():
+                self.mylogger.info('Kafka {topic}: produced {produced}, delivered {delivered}, failed {failed}, retried {retried}'.format(
+                    topic = topic,
+                    **counters
+                ))
+                
+                if counters["failed"]:
+                    self.mylogger.error('Kafka {topic}: {failed} messages could not be delivered'.format(
+                        topic  = topic,
+                        failed = counters["failed"]
+                    ))
+                #end if
+            #end for
+            
             self.mylogger.debug('Kafka producer disconnected.')
         #end if
     #end disconnect
     
     
+    def flush(self, timeout: Optional[float] = None) -> int:
+        
+        """
+        Wait for outstanding messages to be delivered, at checkpoints and at disconnect.
+        
+        Returns:
+            Messages still undelivered when the timeout (default KAFKA_FLUSH_TIMEOUT) ran out
+        """
+        
+        if not self.producer:
+            return 0
+        
+        #end if
+        deadline = time.monotonic() + (self.flush_timeout if timeout is None else timeout)
+        while True:
+            remaining = self.producer.flush(timeout=max(0, deadline - time.monotonic()))
+            
+            # Failed deliveries queued for another attempt go out and get waited on as well
+            if not self._produce_retries() or time.monotonic() >= deadline:
+                remaining = len(self.producer)
+                break
+            
+            #end if
+        #end while
+        
+        if remaining:
+            self.mylogger.warning('Kafka flush timed out with {remaining} messages undelivered'.format(
+                remaining = remaining
+            ))
+        #end if
+        
+        return remaining
+    #end flush
+    
+    
+    def _produce(self, 
+                 record:        Dict[str, Any], 
+                 store_name:    str, 
+                 key:           Optional[str] = None):
+        
+        """Produce one message"""
+        
+        payload_value = self._encode(record, store_name)
+        message_key   = None
+
+        if key and key in record:
+            message_key = str(record[key]).encode('utf-8')
+        
+        #end if
+        self._produce_raw(store_name, payload_value, message_key)
+    #end _produce
+    
+    
+    def _produce_raw(self, 
+                     topic:     str, 
+                     value:     bytes, 
+                     key:       Optional[bytes] = None, 
+                     attempt:   int = 0):
+        
+        """Produce an encoded message, blocking in poll() while the local producer queue is full"""
+        
+        # Counters exist before the message does, another thread's poll() may serve its delivery report
+        with self._lock:
+            counters = self._topics.setdefault(topic, {"produced": 0, "delivered": 0, "failed": 0, "retried": 0})
+        #end with
+        
+        while True:
+            try:
+                self.producer.produce(topic     = topic,
+                                      value     = value,
+                                      key       = key,
+                                      callback  = lambda err, msg: self._delivery_report(err, msg, attempt))
+                break
+            
+            except BufferError:
+                self.producer.poll(0.1)     # queue.buffering.max.messages reached, wait for deliveries
+            #end try
+        #end while
+        
+        with self._lock:
+            counters["produced"] += 1
+            if attempt:
+                counters["retried"] += 1
+            #end if
+        #end with
+    #end _produce_raw
+    
+    
+    def _produce_retries(self) -> int:
+        
+        """Re-produce the messages whose delivery failed, returns how many"""
+        
+        with self._lock:
+            retry       = self._retry
+            self._retry = []
+        #end with
+        
+        for topic, value, key, attempt in retry:
+            self._produce_raw(topic, value, key, attempt)
+        #end for
+        
+        return len(retry)
+    #end _produce_retries
+    
+    
+    def in_flight(self) -> int:
+        
+        """Messages produced but not yet acknowledged (or failed), i.e. the local producer queue depth"""
+        
+        return len(self.producer) if self.producer else 0
+    #end in_flight
+    
+    
+    def stats(self) -> Dict[str, Any]:
+        
+        """
+        Delivery counters for reporting.
+        
+        Returns:
+            {"in_flight": n, "topics": {topic: {produced, delivered, failed, retried}}}, failed counts messages
+            given up on, retried the extra produce attempts
+        """
+        
+        with self._lock:
+            return {
+                "in_flight":    self.in_flight(),
+                "topics":       {topic: dict(counters) for topic, counters in self._topics.items()}
+            }
+        #end with
+    #end stats
+    
+    
+    def _checkpoint(self):
+        
+        """Streaming mode, flush every KAFKA_CHECKPOINT batches"""
+        
+        self.batches += 1
+        if self.checkpoint and self.batches % self.checkpoint == 0:
+            self.flush()
+            
+            self.mylogger.debug('Kafka checkpoint {batches}: {stats}'.format(
+                batches = self.batches,
+                stats   = self.stats()
+            ))
+        #end if
+    #end _checkpoint
+    
+    
     def health_check(self) -> bool:
         
         """
@@ -1271,16 +2696,41 @@ class KafkaConnection(DatabaseConnection):
     #end health_check
     
     
-    def _delivery_report(self, err, msg):
+    def _delivery_report(self, err, msg, attempt: int = 0):
+        
+        """
+        Callback function for Kafka message delivery reports.
         
-        """Callback function for Kafka message delivery reports"""
+        Runs in whichever thread calls poll()/flush(). A retriable failure (or a message timeout, or a purge when the
+        producer is replaced) is queued to be produced again, up to KAFKA_DELIVERY_RETRIES times, anything else
+        counts as failed.
+        """
+        
+        topic = msg.topic()
         
         if err is not None:
-            self.mylogger.error('Failed to Produce: Topic: {topic}, Err: {err}'.format(
-                topic = msg.topic(),
-                err   = err
+            retry = (err.retriable() or err.code() in _KAFKA_REQUEUE_ERRORS) and attempt < self.delivery_retries
+            
+            with self._lock:
+                if retry:
+                    self._retry.append((topic, msg.value(), msg.key(), attempt + 1))
+                
+                else:
+                    self._topics[topic]["failed"] += 1
+                
+                #end if
+            #end with
+            
+            self.mylogger.error('Failed to Produce: Topic: {topic}, Err: {err}{retry}'.format(
+                topic = topic,
+                err   = err,
+                retry = ", retrying" if retry else ""
             ))
         else:
+            with self._lock:
+                self._topics[topic]["delivered"] += 1
+            #end with
+            
             self.mylogger.debug('Produced to: Topic: {topic}, Partition: [{partition}], @ Offset: {offset}'.format(
                 topic     = msg.topic(),
                 partition = msg.partition(),
@@ -1297,7 +2747,7 @@ class KafkaConnection(DatabaseConnection):
 
         """
         Produce a single message to Kafka topic. Retries connection on failure.
-        Flushes after successful production.
+        Flushes after successful production, unless streaming.
         
         Args:
             data:           Dictionary containing the message payload.
@@ -1312,16 +2762,7 @@ class KafkaConnection(DatabaseConnection):
                     if not self._reconnect_with_retry():
                         raise DatabaseConnectionError("Kafka producer not connected after retries.")
 
-                payload_value = json.dumps(data).encode('utf-8')
-                message_key   = None
-
-                if key and key in data:
-                    message_key = str(data[key]).encode('utf-8')
-
-                self.producer.produce(topic     = store_name,
-                                     value      = payload_value,
-                                     key        = message_key,
-                                     callback   = self._delivery_report)
+                self._produce(data, store_name, key)
 
                 # Poll for delivery reports immediately after producing
                 self.producer.poll(0)
@@ -1330,6 +2771,11 @@ class KafkaConnection(DatabaseConnection):
                     store_name = store_name
                 ))
 
+                if self.streaming:
+                    self._checkpoint()
+                    return
+                
+                #end if
                 # Flush after single insert
                 self.producer.flush(timeout=1)
                 self.mylogger.info("Kafka producer flushed after single insert to topic: {store_name}".format(
@@ -1372,7 +2818,7 @@ class KafkaConnection(DatabaseConnection):
 
         """
         Produce multiple messages to Kafka topic. Retries connection on failure.
-        Flushes after all messages in the batch are produced.
+        Flushes after all messages in the batch are produced, unless streaming.
         
         Args:
             data:           A list of dictionaries to insert.
@@ -1383,33 +2829,33 @@ class KafkaConnection(DatabaseConnection):
         if not data:
             return
 
-        retries = 0
+        retries  = 0
+        produced = 0
         while retries <= self.max_retries:
             try:
                 if not self.producer:
                     if not self._reconnect_with_retry():
                         raise DatabaseConnectionError("Kafka producer not connected after retries.")
 
-                for record in data:
-                    payload_value = json.dumps(record).encode('utf-8')
-                    message_key   = None
+                # On a retry carry on after the last message that made it into the producer queue
+                for record in data[produced:]:
+                    self._produce(record, store_name, key)
+                    produced += 1
 
-                    if key and key in record:
-                        message_key = str(record[key]).encode('utf-8')
-
-                    self.producer.produce(topic     = store_name,
-                                         value      = payload_value,
-                                         key        = message_key,
-                                         callback   = self._delivery_report)
-
-                    # Poll frequently to allow delivery reports to be called
-                    self.producer.poll(0)
+                # Serve the delivery reports once per batch, re-producing whatever failed
+                self.producer.poll(0)
+                self._produce_retries()
 
                 self.mylogger.debug('Kafka {count} messages produced to: {store_name}'.format(
                     count       = len(data),
                     store_name  = store_name
                 ))
 
+                if self.streaming:
+                    self._checkpoint()
+                    return
+                
+                #end if
                 # Flush after multiple inserts
                 self.producer.flush(timeout=5) # Longer timeout for a batch flush
                 
@@ -1462,22 +2908,578 @@ class KafkaConnection(DatabaseConnection):
 #end KafkaConnection
 
 
-class DatabaseManager:
+def _arrow_type(avro_type: Any, named: Dict[str, Any]) -> Any:
     
-    """Factory class for managing different database connections"""
+    """
+    Arrow type for an Avro type, records become struct columns, arrays list columns, ["null", x] a nullable x.
+    The record shapes are defined once, as the Avro schemas in kafka_serde.py.
+    """
     
-    @staticmethod
-    def create_connection(db_type:       str, 
-                          config_params: Dict[str, Any], 
-                          mylogger) -> DatabaseConnection:
-        
-        """
-        Factory method to create appropriate database connection
+    if isinstance(avro_type, list):
+        return _arrow_type([branch for branch in avro_type if branch != "null"][0], named)
+    
+    elif isinstance(avro_type, str):
+        if avro_type in named:
+            return named[avro_type]
         
-        Args:
-            db_type:        Type of database ('mongodb' or 'postgresql')
-            config_params:  Configuration parameters
-            mylogger:       mylogger instance
+        #end if
+        return {"string": pa.string(), "int": pa.int32(), "long": pa.int64(), "boolean": pa.bool_(), 
+                "float": pa.float32(), "double": pa.float64()}[avro_type]
+    
+    elif avro_type["type"] == "array":
+        return pa.list_(_arrow_type(avro_type["items"], named))
+    
+    elif avro_type["type"] == "record":
+        struct = pa.struct([pa.field(field["name"], _arrow_type(field["type"], named)) for field in avro_type["fields"]])
+        named[avro_type["name"]] = struct
+        return struct
+    
+    else:
+        return _arrow_type(avro_type["type"], named)
+    
+    #end if
+#end _arrow_type
+
+
+class ParquetConnection(DatabaseConnection):
+    
+    """
+    Columnar file sink, DEST=6, one dataset per store under FILE_DIR/<store>/.
+    
+    Rows are buffered per store and written PARQUET_ROW_GROUP rows at a time as one row group (one record batch
+    for Arrow IPC), nested address/account/husband/wife/children as struct and list<struct> columns. Every
+    connection (process/shard) writes its own part files, rolled every PARQUET_FILE_ROWS rows, so parallel workers
+    never share a file.
+    insert() may be called from several writer threads, each store is guarded by its own lock.
+    """
+    
+    def __init__(self, 
+                 config_params: Dict[str, Any], 
+                 mylogger):
+        
+        super().__init__(config_params, mylogger)
+        
+        self.directory      = config_params.get("FILE_DIR",             "output")
+        self.format         = config_params.get("PARQUET_FORMAT",       "parquet").lower()      # parquet or arrow (IPC)
+        self.compression    = config_params.get("PARQUET_COMPRESSION",  "zstd")
+        self.row_group      = int(config_params.get("PARQUET_ROW_GROUP", 100000))
+        self.file_rows      = int(config_params.get("PARQUET_FILE_ROWS", 0))                    # 0 => one file per store
+        self._stores        = {}                        # store_name -> {schema, buffer, writer, rows, total, files, lock}
+        self._part          = f"{socket.gethostname()}-{os.getpid()}-{os.urandom(4).hex()}"   # Unique per connection
+        self._lock          = threading.Lock()
+        self._schemas       = {
+            config_params.get("ADULTS_STORE"):      ADULT_SCHEMA,
+            config_params.get("CHILDREN_STORE"):    CHILD_SCHEMA,
+            config_params.get("FAMILY_STORE"):      FAMILY_SCHEMA
+        }
+        
+        if self.format not in ("parquet", "arrow"):
+            raise ValueError(f"Unsupported file format: {self.format}")
+        #end if
+    #end __init__
+    
+    
+    def connect(self) -> bool:
+        
+        """Check pyarrow is there and create the output directory"""
+        
+        if pa is None:
+            raise DatabaseConnectionError("Parquet sink needs the pyarrow package, pip install pyarrow")
+        
+        #end if
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            
+        except OSError as err:
+            raise DatabaseConnectionError(f"Parquet output directory {self.directory} unavailable: {err}")
+        #end try
+        
+        self._is_connected = True
+        self.mylogger.info('Parquet sink writing {format} files to: {directory}'.format(
+            format    = self.format,
+            directory = self.directory
+        ))
+        
+        return True
+    #end connect
+    
+    
+    def _store(self, store_name: str) -> Dict[str, Any]:
+        
+        """Per store state, created on first use"""
+        
+        with self._lock:
+            if store_name not in self._stores:
+                if store_name not in self._schemas:
+                    raise DatabaseOperationError(f"No schema for store: {store_name}")
+                
+                #end if
+                self._stores[store_name] = {
+                    "schema":   pa.schema(list(_arrow_type(self._schemas[store_name], {}))),
+                    "buffer":   [],
+                    "writer":   None,
+                    "rows":     0,                      # rows in the open file
+                    "total":    0,
+                    "files":    0,
+                    "lock":     threading.Lock()
+                }
+            #end if
+            
+            return self._stores[store_name]
+        #end with
+    #end _store
+    
+    
+    def _open(self, store_name: str, store: Dict[str, Any]):
+        
+        """Start the next part file for a store"""
+        
+        directory = os.path.join(self.directory, store_name)
+        os.makedirs(directory, exist_ok=True)
+        
+        extension = "parquet" if self.format == "parquet" else "arrow"
+        path      = os.path.join(directory, f"part-{self._part}-{store['files']:05d}.{extension}")
+        
+        if self.format == "parquet":
+            store["writer"] = pq.ParquetWriter(path, store["schema"], compression=self.compression)
+        
+        else:
+            options         = pa.ipc.IpcWriteOptions(compression=None if self.compression == "none" else self.compression)
+            store["writer"] = pa.ipc.new_file(path, store["schema"], options=options)
+        
+        #end if
+        store["files"] += 1
+        store["rows"]   = 0
+        
+        self.mylogger.debug('Parquet file opened: {path}'.format(
+            path = path
+        ))
+    #end _open
+    
+    
+    def _write(self, store_name: str, store: Dict[str, Any]):
+        
+        """Write the buffered rows as one row group, caller holds the store lock"""
+        
+        rows            = store["buffer"]
+        store["buffer"] = []
+        
+        if not rows:
+            return
+        
+        #end if
+        if store["writer"] is None:
+            self._open(store_name, store)
+        
+        #end if
+        table = pa.Table.from_pylist(rows, schema=store["schema"])
+        
+        if self.format == "parquet":
+            store["writer"].write_table(table, row_group_size=len(rows))
+        
+        else:
+            store["writer"].write_table(table, max_chunksize=len(rows))
+        
+        #end if
+        store["rows"]  += len(rows)
+        store["total"] += len(rows)
+        
+        if self.file_rows and store["rows"] >= self.file_rows:
+            store["writer"].close()
+            store["writer"] = None
+        #end if
+    #end _write
+    
+    
+    def insert_multiple(self, 
+                        data:       List[Dict[str, Any]], 
+                        store_name: str, 
+                        **kwargs) -> int:
+        
+        """
+        Buffer rows for a store, writing a row group whenever PARQUET_ROW_GROUP rows are waiting.
+        
+        Returns:
+            Number of rows accepted
+        """
+        
+        store = self._store(store_name)
+        
+        try:
+            with store["lock"]:
+                store["buffer"].extend(data)
+                
+                if len(store["buffer"]) >= self.row_group:
+                    self._write(store_name, store)
+                #end if
+            #end with
+            
+        except (pa.ArrowException, OSError) as err:
+            self.mylogger.error('Parquet write error for {store_name}: {err}'.format(
+                store_name = store_name,
+                err        = err
+            ))
+            raise DatabaseOperationError(f"Parquet write failed: {err}")
+        #end try
+        
+        return len(data)
+    #end insert_multiple
+    
+    
+    def insert_single(self, 
+                      data:         Dict[str, Any], 
+                      store_name:   str, 
+                      **kwargs) -> int:
+        
+        return self.insert_multiple([data], store_name)
+    #end insert_single
+    
+    
+    def insert(self, data: Union[Dict[str, Any], List[Dict[str, Any]]], **kwargs) -> Any:
+        
+        """Universal insert method, everything is buffered the same way"""
+        
+        if isinstance(data, list):
+            return self.insert_multiple(data, **kwargs)
+        
+        #end if
+        return self.insert_single(data, **kwargs)
+    #end insert
+    
+    
+    def disconnect(self):
+        
+        """Write what is still buffered and close the files"""
+        
+        for store_name, store in self._stores.items():
+            with store["lock"]:
+                try:
+                    self._write(store_name, store)
+                    
+                finally:
+                    if store["writer"] is not None:
+                        store["writer"].close()
+                        store["writer"] = None
+                    #end if
+                #end try
+            #end with
+            
+            self.mylogger.info('Parquet {store_name}: {rows} rows in {files} file(s)'.format(
+                store_name = store_name,
+                rows       = store["total"],
+                files      = store["files"]
+            ))
+        #end for
+        
+        self._is_connected = False
+    #end disconnect
+#end ParquetConnection
+
+
+class JsonlFileConnection(DatabaseConnection):
+    
+    """
+    Compressed newline delimited JSON file sink, DEST=7, one directory per store under FILE_DIR/<store>/.
+    
+    insert() only JSON encodes the rows (nothing to do for CachedRecords, see JSON_PRECODE) and hands the chunk to
+    a JSONL_THREADS thread pool, which compresses it into a self contained zstd frame / gzip member and appends it
+    to the store's current file. Concatenated frames/members are valid .zst/.gz files, so chunks compress in
+    parallel (zlib and zstd release the GIL); chunks may land in the file in a different order than they were
+    inserted. Files rotate once they pass JSONL_ROTATE_MB, every connection (process/shard) writes its own files.
+    
+    At most 2 x JSONL_THREADS chunks are waiting to be compressed, beyond that insert() blocks. A failed chunk
+    fails only its own Future with a DatabaseOperationError, flush()/disconnect() report the chunks that were still
+    queued when they were called.
+    """
+    
+    def __init__(self, 
+                 config_params: Dict[str, Any], 
+                 mylogger):
+        
+        super().__init__(config_params, mylogger)
+        
+        self.directory      = config_params.get("FILE_DIR",             "output")
+        self.compression    = config_params.get("JSONL_COMPRESSION",    "zstd").lower()         # zstd, gzip or none
+        self.level          = int(config_params.get("JSONL_LEVEL",      3))
+        self.rotate_bytes   = int(config_params.get("JSONL_ROTATE_MB",  256)) * 1024 * 1024
+        self.threads        = max(1, int(config_params.get("JSONL_THREADS", 2)))
+        self._part          = f"{socket.gethostname()}-{os.getpid()}-{os.urandom(4).hex()}"   # Unique per connection
+        self._stores        = {}                        # store_name -> {file, bytes, rows, total_bytes, total, files, lock}
+        self._lock          = threading.Lock()
+        self._local         = threading.local()
+        self._executor      = None
+        self._slots         = threading.BoundedSemaphore(self.threads * 2)
+        self._pending       = set()
+        
+        if self.compression not in ("zstd", "gzip", "none"):
+            raise ValueError(f"Unsupported JSONL compression: {self.compression}")
+        #end if
+        
+        self.extension      = {"zstd": ".jsonl.zst", "gzip": ".jsonl.gz", "none": ".jsonl"}[self.compression]
+    #end __init__
+    
+    
+    def connect(self) -> bool:
+        
+        """Create the output directory and start the compression threads"""
+        
+        if self.compression == "zstd" and zstandard is None:
+            raise DatabaseConnectionError("JSONL zstd compression needs the zstandard package, pip install zstandard")
+        
+        #end if
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            
+        except OSError as err:
+            raise DatabaseConnectionError(f"JSONL output directory {self.directory} unavailable: {err}")
+        #end try
+        
+        self._executor     = concurrent.futures.ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="Jsonl")
+        self._is_connected = True
+        self.mylogger.info('JSONL sink writing {compression} files to: {directory}'.format(
+            compression = self.compression,
+            directory   = self.directory
+        ))
+        
+        return True
+    #end connect
+    
+    
+    def _store(self, store_name: str) -> Dict[str, Any]:
+        
+        """Per store state, created on first use"""
+        
+        with self._lock:
+            if store_name not in self._stores:
+                self._stores[store_name] = {
+                    "file":         None,
+                    "bytes":        0,                  # compressed bytes in the open file
+                    "total_bytes":  0,
+                    "total":        0,
+                    "files":        0,
+                    "lock":         threading.Lock()
+                }
+            #end if
+            
+            return self._stores[store_name]
+        #end with
+    #end _store
+    
+    
+    def _compress(self, payload: bytes) -> bytes:
+        
+        """One complete zstd frame / gzip member, zstd compressors are kept per thread"""
+        
+        if self.compression == "zstd":
+            compressor = getattr(self._local, "compressor", None)
+            if compressor is None:
+                compressor = self._local.compressor = zstandard.ZstdCompressor(level=self.level)
+            
+            #end if
+            return compressor.compress(payload)
+        
+        elif self.compression == "gzip":
+            return gzip.compress(payload, compresslevel=self.level)
+        
+        #end if
+        return payload
+    #end _compress
+    
+    
+    def _write(self, 
+               store_name:  str, 
+               payload:     bytes, 
+               rows:        int):
+        
+        """
+        Compression thread, compress a chunk and append it to the store's file, rotating as needed.
+        
+        Returns:
+            Number of rows written
+        
+        Raises:
+            DatabaseOperationError: Via the chunk's Future, if it could not be written
+        """
+        
+        try:
+            frame = self._compress(payload)
+            store = self._store(store_name)
+            
+            with store["lock"]:
+                if store["file"] is None:
+                    directory = os.path.join(self.directory, store_name)
+                    os.makedirs(directory, exist_ok=True)
+                    
+                    store["file"]   = open(os.path.join(directory, f"part-{self._part}-{store['files']:05d}{self.extension}"), "wb")
+                    store["files"] += 1
+                    store["bytes"]  = 0
+                
+                #end if
+                store["file"].write(frame)
+                store["bytes"]       += len(frame)
+                store["total_bytes"] += len(frame)
+                store["total"]       += rows
+                
+                if store["bytes"] >= self.rotate_bytes:
+                    store["file"].close()
+                    store["file"] = None
+                #end if
+            #end with
+            
+        except Exception as err:
+            self.mylogger.error('JSONL write error for {store_name}: {err}'.format(
+                store_name = store_name,
+                err        = err
+            ))
+            raise DatabaseOperationError(f"JSONL chunk write for {store_name} failed: {err}") from err
+        #end try
+        
+        return rows
+    #end _write
+    
+    
+    def insert_multiple(self, 
+                        data:       List[Dict[str, Any]], 
+                        store_name: str, 
+                        **kwargs) -> concurrent.futures.Future:
+        
+        """
+        Queue rows for compression and writing, blocks while 2 x JSONL_THREADS chunks are waiting.
+        
+        Returns:
+            The chunk's Future, resolving to the number of rows written or failing with a DatabaseOperationError
+        """
+        
+        if not self._executor:
+            raise DatabaseConnectionError("JSONL sink not connected")
+        
+        #end if
+        if not data:
+            future = concurrent.futures.Future()
+            future.set_result(0)
+            
+            return future
+        #end if
+        payload = b"\n".join([json_codec.dumpb(record) for record in data]) + b"\n"
+        
+        self._slots.acquire()
+        future = self._executor.submit(self._write, store_name, payload, len(data))
+        
+        with self._lock:
+            self._pending.add(future)
+        #end with
+        
+        def _done(done):
+            with self._lock:
+                self._pending.discard(done)
+            #end with
+            self._slots.release()
+        #end _done
+        
+        future.add_done_callback(_done)
+        
+        return future
+    #end insert_multiple
+    
+    
+    def insert_single(self, 
+                      data:         Dict[str, Any], 
+                      store_name:   str, 
+                      **kwargs) -> concurrent.futures.Future:
+        
+        return self.insert_multiple([data], store_name)
+    #end insert_single
+    
+    
+    def insert(self, data: Union[Dict[str, Any], List[Dict[str, Any]]], **kwargs) -> Any:
+        
+        """Universal insert method, everything is queued the same way"""
+        
+        if isinstance(data, list):
+            return self.insert_multiple(data, **kwargs)
+        
+        #end if
+        return self.insert_single(data, **kwargs)
+    #end insert
+    
+    
+    def flush(self):
+        
+        """
+        Wait for every queued chunk to be written.
+        
+        Raises:
+            DatabaseOperationError: If any chunk still queued failed, earlier failures are on their chunk's Future
+        """
+        
+        with self._lock:
+            pending = list(self._pending)
+        #end with
+        
+        concurrent.futures.wait(pending)
+        
+        failed = [future.exception() for future in pending if future.exception()]
+        if failed:
+            raise DatabaseOperationError(f"JSONL {len(failed)} chunk write(s) failed: {failed[0]}")
+        #end if
+    #end flush
+    
+    
+    def disconnect(self):
+        
+        """Write what is still queued, close the files"""
+        
+        try:
+            self.flush()
+        
+        except DatabaseOperationError as err:
+            self.mylogger.error('JSONL chunks failed before disconnect: {err}'.format(
+                err = err
+            ))
+        #end try
+        
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        #end if
+        for store_name, store in self._stores.items():
+            with store["lock"]:
+                if store["file"] is not None:
+                    store["file"].close()
+                    store["file"] = None
+                #end if
+            #end with
+            
+            self.mylogger.info('JSONL {store_name}: {rows} rows, {size} bytes in {files} file(s)'.format(
+                store_name = store_name,
+                rows       = store["total"],
+                size       = store["total_bytes"],
+                files      = store["files"]
+            ))
+        #end for
+        
+        self._is_connected = False
+    #end disconnect
+#end JsonlFileConnection
+
+
+class DatabaseManager:
+    
+    """Factory class for managing different database connections"""
+    
+    @staticmethod
+    def create_connection(db_type:       str, 
+                          config_params: Dict[str, Any], 
+                          mylogger) -> DatabaseConnection:
+        
+        """
+        Factory method to create appropriate database connection
+        
+        Args:
+            db_type:        Type of database ('mongodb', 'postgresql', 'postgresql_async', 'redis', 'kafka', 'parquet' or 'jsonl')
+            config_params:  Configuration parameters
+            mylogger:       mylogger instance
             
         Returns:
             DatabaseConnection instance
@@ -1489,11 +3491,20 @@ class DatabaseManager:
         elif db_type.lower() == 'postgresql':
             conn =  PostgreSQLConnection(config_params, mylogger)
         
+        elif db_type.lower() == 'postgresql_async':
+            conn =  AsyncPostgreSQLConnection(config_params, mylogger)
+        
         elif db_type.lower() == 'redis':
             conn =  RedisConnection(config_params,      mylogger)
         
         elif db_type.lower() == 'kafka':
             conn =  KafkaConnection(config_params,      mylogger)
+        
+        elif db_type.lower() == 'parquet':
+            conn =  ParquetConnection(config_params,    mylogger)
+        
+        elif db_type.lower() == 'jsonl':
+            conn =  JsonlFileConnection(config_params,  mylogger)
     
         else:
             raise ValueError(f"Unsupported database type: {db_type}")
@@ -14,9 +14,13 @@
 #   Methods         :   __init__ - Initialize with data file path
 #                   :   load_data - Load JSON data from file
 #                   :   generate_address - Generate complete address
+#                   :   generate_addresses - Generate N addresses in bulk, street/postcode parts drawn as NumPy index arrays
+#                   :   configure_address_partition - Restrict post codes to a partition, disjoint addresses per worker
 #                   :   get_provinces - Get provinces data with population values
 #                   :   get_counties - Get counties for a specific province
 #                   :   get_cities_towns - Get cities/towns for a specific province and county
+#                   :   get_location - Draw a (province, county, city) tuple in one step
+#                   :   get_locations - Draw N (province, county, city) tuples in one vectorised call
 #
 #
 # ########################################################################################################################
@@ -25,8 +29,12 @@ __email__       = "georgelza@gmail.com"
 __version__     = "0.2"
 __copyright__   = "Copyright 2025, - George Leonard"
     
-import json
+import json, re, string
+import numpy as np
+from types import MappingProxyType
 from faker.providers import BaseProvider
+from faker.providers.address import Provider as AddressProvider
+from weighted_random import WeightedRandomSelector
 
 
 class GeographicDataProvider(BaseProvider):
@@ -54,6 +62,13 @@ class GeographicDataProvider(BaseProvider):
         self.data                       = None
         self.provinces_cache            = None
         self.total_province_population  = 0
+        self.locations_cache            = None
+        self.location_selector          = None
+        self._geo_index                 = None
+        self._county_options_cache      = {}
+        self._city_options_cache        = {}
+        self._address_columns           = None
+        self._address_partition         = (0, 1)        # (partition, partitions), see configure_address_partition()
         
         if file_path:
             self.load_data(file_path)
@@ -82,6 +97,14 @@ class GeographicDataProvider(BaseProvider):
             # Cache provinces data for efficiency
             self.provinces_cache, self.total_province_population = self._extract_provinces()
             
+            # Case folded name indexes, get_counties/get_cities_towns results are cached against these
+            self._geo_index             = _build_geo_index(self.data)
+            self._county_options_cache  = {}
+            self._city_options_cache    = {}
+            
+            # Flatten province -> county -> city into one weighted table
+            self.locations_cache, self.location_selector = self._compile_locations()
+            
             if self.mylogger:
                 self.mylogger.info("Successfully loaded geographic data from {file_path}".format(
                     file_path = file_path
@@ -143,6 +166,91 @@ class GeographicDataProvider(BaseProvider):
     #end _extract_provinces
     
     
+    def _compile_locations(self):
+        
+        """
+        Flatten the province -> county -> city/town hierarchy into a single city level table.
+        
+        Each row's weight is the joint probability of the three separate draws, i.e.
+        P(province) * P(county | province) * P(city | county), so one draw from the table is distributed
+        exactly like drawing a province, then a county within it, then a city within that.
+        
+        Counties without cities/towns yield the county name as the city, provinces without counties
+        yield 'Unknown County' / 'Unknown City'.
+        
+        Returns:
+            tuple: (locations_list, WeightedRandomSelector) where locations are (province, county, city) tuples
+        """
+        
+        locations = []
+        
+        if not self.data or self.total_province_population <= 0:
+            return locations, None
+        #end if
+        
+        for province in self.data['provinces']:
+            province_name = province['name']
+            province_prob = province.get('population', 0) / self.total_province_population
+            
+            if province_prob <= 0:
+                continue
+            #end if
+            
+            counties      = province.get('counties', [])
+            county_total  = sum(county.get('population', 0) for county in counties)
+            
+            if county_total <= 0:
+                if self.mylogger:
+                    self.mylogger.warning("No counties found for province {province_name}, using default".format(
+                        province_name = province_name
+                    ))
+                #end if
+                locations.append({'name': (province_name, "Unknown County", "Unknown City"), 'value': province_prob})
+                
+                continue
+            #end if
+            
+            for county in counties:
+                county_name = county['name']
+                county_prob = province_prob * county.get('population', 0) / county_total
+                
+                if county_prob <= 0:
+                    continue
+                #end if
+                
+                cities_towns = county.get('cities_towns', [])
+                city_total   = sum(city_town.get('population', 0) for city_town in cities_towns)
+                
+                if city_total <= 0:
+                    if self.mylogger:
+                        self.mylogger.warning("No cities found for {county_name}, {province_name}, using county name".format(
+                            county_name   = county_name,
+                            province_name = province_name
+                        ))
+                    #end if
+                    locations.append({'name': (province_name, county_name, county_name), 'value': county_prob})
+                    
+                    continue
+                #end if
+                
+                for city_town in cities_towns:
+                    city_prob = county_prob * city_town.get('population', 0) / city_total
+                    
+                    if city_prob > 0:
+                        locations.append({'name': (province_name, county_name, city_town['name']), 'value': city_prob})
+                    #end if
+                #end for
+            #end for
+        #end for
+        
+        if not locations:
+            return locations, None
+        #end if
+        
+        return locations, WeightedRandomSelector(locations, scale=1.0)
+    #end _compile_locations
+    
+    
     def generate_address(self, town=None, county=None, province_state=None, country=None):
         
         """
@@ -182,6 +290,285 @@ class GeographicDataProvider(BaseProvider):
     #end generate_address
     
     
+    def generate_addresses(self, n, locations=None, country=None, columnar=False, rng=None, unique_index=None, max_retries=100):
+        
+        """
+        Generate n addresses in one pass.
+        
+        Street numbers, street names, suffixes and post codes are drawn per column from the locale's formats and
+        word lists using NumPy index arrays, instead of n round trips through Faker's proxy per component.
+        Components the locale builds in a way we can't vectorise fall back to the matching Faker call per row.
+        
+        Args:
+            n (int):                        Number of addresses
+            locations (sequence, optional): n (province, county, town) tuples, e.g. from get_locations(),
+                                            drawn here when not provided
+            country (str, optional):        Specific country to use
+            columnar (bool):                True returns a dict of columns instead of a list of address dicts
+            rng (numpy.random.Generator):   Optional generator, see WeightedRandomSelector.sample()
+            unique_index (UniqueIndex):     Optional, see unique_index.py, addresses already in the index are redrawn
+            max_retries (int):              Redraw rounds before giving up on the remaining duplicates
+            
+        Returns:
+            list: n address dicts as per generate_address(), or
+            dict: {'street': [...], 'town': [...], 'county': [...], 'state': [...], 'post_code': [...], 'country': [...]}
+        """
+        
+        if not self.data:
+            raise ValueError("No geographic data loaded. Call load_data() first.")
+        #end if
+        
+        if rng is None:
+            rng = np.random.default_rng()
+        #end if
+        
+        if locations is None:
+            locations = self.get_locations(n, rng)
+        
+        elif len(locations) != n:
+            raise ValueError(f"Expected {n} locations, got {len(locations)}")
+        #end if
+        
+        final_country        = country or self.data.get('country', 'Unknown')
+        streets, post_codes  = self._draw_street_columns(n, rng)
+        
+        if unique_index is not None:
+            pending = np.arange(n)
+            retries = 0
+            
+            while pending.size:
+                is_new  = unique_index.add_many(
+                    "|".join((streets[i], post_codes[i], *map(str, locations[i]))) for i in pending
+                )
+                pending = pending[~is_new]
+                
+                if not pending.size:
+                    break
+                #end if
+                
+                retries += 1
+                if retries > max_retries:
+                    raise ValueError(f"Could not generate {pending.size} unique addresses after {max_retries} retries")
+                #end if
+                
+                streets[pending], post_codes[pending] = self._draw_street_columns(pending.size, rng)
+            #end while
+        #end if
+        
+        streets              = streets.tolist()
+        post_codes           = post_codes.tolist()
+        
+        if columnar:
+            return {
+                'street':       streets,
+                'town':         [location[2] or 'Unknown Town'   for location in locations],
+                'county':       [location[1] or 'Unknown County' for location in locations],
+                'state':        [location[0] or 'Unknown State'  for location in locations],
+                'post_code':    post_codes,
+                'country':      [final_country] * n
+            }
+        #end if
+        
+        return [
+            {
+                'street':       street,
+                'town':         town or 'Unknown Town',
+                'county':       county or 'Unknown County',
+                'state':        province_state or 'Unknown State',
+                'post_code':    post_code,
+                'country':      final_country
+            }
+            for street, post_code, (province_state, county, town) in zip(streets, post_codes, locations)
+        ]
+    #end generate_addresses
+    
+    
+    def configure_address_partition(self, partition=0, partitions=1):
+        
+        """
+        Only draw post codes from one partition of the post code space, (a hash of) every post code belongs to
+        exactly one of partitions. Processes that each keep their own unique index (parallel workers) take distinct
+        partitions, so no two of them can produce the same address.
+        
+        Args:
+            partition (int):  This provider's partition, 0 .. partitions-1
+            partitions (int): Number of partitions, 1 => no restriction
+        """
+        
+        if not 0 <= partition < partitions:
+            raise ValueError(f"Address partition must be within 0 .. {partitions - 1}, got {partition}")
+        #end if
+        
+        self._address_partition = (partition, partitions)
+    #end configure_address_partition
+    
+    
+    def _draw_street_columns(self, n, rng):
+        
+        """
+        Draw n street lines and post codes.
+        
+        Returns:
+            tuple: (streets, post_codes) object ndarrays
+        """
+        
+        if self._address_columns is None:
+            self._address_columns = self._compile_address_columns()
+        #end if
+        
+        columns = self._address_columns
+        streets = (columns['building_number'](n, rng) + " " + 
+                   columns['street_name'](n, rng)     + " " + 
+                   columns['street_suffix'](n, rng))
+        
+        return streets, self._draw_post_codes(n, rng)
+    #end _draw_street_columns
+    
+    
+    def _draw_post_codes(self, n, rng, max_rounds=100):
+        
+        """
+        Draw n post codes from this provider's partition, see configure_address_partition(). Every row draws
+        partitions candidates at a time and keeps the first one in the partition.
+        
+        Raises:
+            ValueError: When the locale's post codes don't spread over the partitions
+        """
+        
+        column                = self._address_columns['postcode']
+        partition, partitions = self._address_partition
+        
+        if partitions == 1:
+            return column(n, rng)
+        #end if
+        
+        post_codes = np.empty(n, dtype=object)
+        pending    = np.arange(n)
+        
+        for _ in range(max_rounds):
+            if not pending.size:
+                return post_codes
+            #end if
+            
+            candidates = column(pending.size * partitions, rng).reshape(pending.size, partitions)
+            owned      = (_string_partitions(candidates.ravel(), partitions) == partition).reshape(pending.size, partitions)
+            hit        = owned.any(axis=1)
+            
+            post_codes[pending[hit]] = candidates[hit, owned[hit].argmax(axis=1)]
+            pending                  = pending[~hit]
+        #end for
+        
+        if pending.size:
+            raise ValueError(f"Could not draw {pending.size} post codes in address partition {partition} of {partitions}")
+        #end if
+        
+        return post_codes
+    #end _draw_post_codes
+    
+    
+    def _compile_address_columns(self):
+        
+        """
+        Work out, once, how to draw each address component for the generator's locale in bulk.
+        
+        Returns:
+            dict: component name -> callable(n, rng) returning an object ndarray of n strings
+        """
+        
+        address  = self.generator.street_suffix.__self__          # The locale's address provider instance
+        columns  = {}
+        
+        # Building number, numerify() over building_number_formats
+        formats  = getattr(address, 'building_number_formats', None)
+        if formats and not any(char in pattern for pattern in formats for char in "!@"):
+            columns['building_number'] = _pattern_column(formats, _NUMERIFY_SETS)
+        else:
+            columns['building_number'] = _fallback_column(self.generator.building_number)
+        #end if
+        
+        # Street suffix, random_element() over street_suffixes
+        if getattr(address, 'street_suffixes', None):
+            columns['street_suffix'] = _word_column(address.street_suffixes)
+        else:
+            columns['street_suffix'] = _fallback_column(self.generator.street_suffix)
+        #end if
+        
+        # Street name, either parse() over street_name_formats or random_element() over street_names
+        if type(address).street_name is AddressProvider.street_name:
+            columns['street_name'] = self._street_name_column(address.street_name_formats, columns['street_suffix'])
+        
+        elif getattr(address, 'street_names', None):
+            columns['street_name'] = _word_column(address.street_names)
+        
+        else:
+            columns['street_name'] = _fallback_column(self.generator.street_name)
+        #end if
+        
+        # Post code, either a placeholder pattern with per placeholder sets (en_IE, ...) or bothify().upper()
+        if getattr(address, 'postcode_pattern', None) and getattr(address, '_postcode_sets', None):
+            columns['postcode'] = _pattern_column([address.postcode_pattern], address._postcode_sets, literals_only=True)
+        
+        elif type(address).postcode is AddressProvider.postcode and not any(
+                char in pattern for pattern in address.postcode_formats for char in "!@"):
+            columns['postcode'] = _pattern_column([pattern.upper() for pattern in address.postcode_formats], _BOTHIFY_UPPER_SETS)
+        
+        else:
+            columns['postcode'] = _fallback_column(self.generator.postcode)
+        #end if
+        
+        return columns
+    #end _compile_address_columns
+    
+    
+    def _street_name_column(self, formats, suffix_column):
+        
+        """
+        Bulk version of parse() over street_name_formats, resolving {{last_name}}, {{first_name}} and {{street_suffix}}
+        from their word lists, any other token is parsed per row by Faker.
+        """
+        
+        token_columns = {'street_suffix': suffix_column}
+        
+        for token in ('last_name', 'first_name'):
+            words = getattr(getattr(self.generator, token).__self__, token + 's', None)
+            if words:
+                token_columns[token] = _word_column(words)
+            #end if
+        #end for
+        
+        def column(n, rng):
+            out   = np.empty(n, dtype=object)
+            picks = rng.integers(0, len(formats), size=n)
+            
+            for f_idx, pattern in enumerate(formats):
+                rows = np.flatnonzero(picks == f_idx)
+                if rows.size == 0:
+                    continue
+                #end if
+                
+                tokens = _TOKEN_RE.findall(pattern)
+                if any(token not in token_columns for token in tokens):
+                    out[rows] = [self.generator.parse(pattern) for _ in range(rows.size)]
+                    
+                    continue
+                #end if
+                
+                parts  = _TOKEN_RE.split(pattern)                  # literal, token, literal, token, ..., literal
+                values = np.full(rows.size, parts[0], dtype=object)
+                for i in range(1, len(parts), 2):
+                    values = values + token_columns[parts[i]](rows.size, rng) + parts[i + 1]
+                #end for
+                
+                out[rows] = values
+            #end for
+            
+            return out
+        #end column
+        
+        return column
+    #end _street_name_column
+    
+    
     def get_provinces(self):
 
         """
@@ -211,7 +598,8 @@ class GeographicDataProvider(BaseProvider):
             province_name (str): Name of the province (e.g., "Leinster")
             
         Returns:
-            tuple: (counties_list, total_population) or (None, None) if province not found
+            tuple: (counties_list, total_population) or (None, None) if province not found,
+                   counties_list is a cached, read only tuple of read only dicts
             
         Raises:
             ValueError: If no data is loaded
@@ -221,41 +609,32 @@ class GeographicDataProvider(BaseProvider):
             raise ValueError("No geographic data loaded. Call load_data() first.")
         #end if
         
-        counties         = []
-        total_population = 0
+        province_key = province_name.casefold()
+        cached       = self._county_options_cache.get(province_key)
         
-        # Find the specified province
-        target_province = None
-        for province in self.data['provinces']:
-            if province['name'].lower() == province_name.lower():
-                target_province = province
-                
-                break
-            #enf if
-        #end for
+        if cached is not None:
+            return cached
+        #end if
+        
+        target_province = self._geo_index['provinces'].get(province_key)
         
         if not target_province:
             if self.mylogger:
-                self.mylogger.warning(f"Province '{province_name}' not found in data".format(
+                self.mylogger.warning("Province '{province_name}' not found in data".format(
                     province_name = province_name
                 ))
             #end if
             return None, None
         #end if
         
-        # Extract counties data
-        if 'counties' in target_province:
-            for county in target_province['counties']:
-                county_data = {
-                    'name':  county['name'],
-                    'value': county.get('population', 0)
-                }
-                 
-                counties.append(county_data)
-                total_population += county_data['value']
-            #end for
-        #end if
-        return counties, total_population
+        # Extract counties data, once per province
+        cached = _freeze_options(
+            {'name': county['name'], 'value': county.get('population', 0)}
+            for county in target_province.get('counties', [])
+        )
+        self._county_options_cache[province_key] = cached
+        
+        return cached
     #end get_counties
     
     
@@ -269,7 +648,8 @@ class GeographicDataProvider(BaseProvider):
             county_name (str):   Name of the county (e.g., "Dublin")
             
         Returns:
-            tuple: (cities_towns_list, total_population) or (None, None) if not found
+            tuple: (cities_towns_list, total_population) or (None, None) if not found,
+                   cities_towns_list is a cached, read only tuple of read only dicts
             
         Raises:
             ValueError: If no data is loaded
@@ -279,19 +659,14 @@ class GeographicDataProvider(BaseProvider):
             raise ValueError("No geographic data loaded. Call load_data() first.")
         #end if
         
-        cities_towns     = []
-        total_population = 0
+        county_key = (province_name.casefold(), county_name.casefold())
+        cached     = self._city_options_cache.get(county_key)
         
-        # Find the specified province
-        target_province = None
-        for province in self.data['provinces']:
-            if province['name'].lower() == province_name.lower():
-                target_province = province
-                break
-            #end if
-        #end for
+        if cached is not None:
+            return cached
+        #end if
         
-        if not target_province:
+        if county_key[0] not in self._geo_index['provinces']:
             if self.mylogger:
                 self.mylogger.warning("Province '{province_name}' not found in data".format(
                     province_name = province_name
@@ -300,16 +675,7 @@ class GeographicDataProvider(BaseProvider):
             return None, None
         #end if
         
-        
-        # Find the specified county
-        target_county = None
-        for county in target_province.get('counties', []):
-            if county['name'].lower() == county_name.lower():
-                target_county = county
-                break
-            #end if
-        #end for
-        
+        target_county = self._geo_index['counties'].get(county_key)
         
         if not target_county:
             if self.mylogger:
@@ -321,22 +687,59 @@ class GeographicDataProvider(BaseProvider):
             return None, None
         #end if
         
+        # Extract cities/towns data, once per county
+        cached = _freeze_options(
+            {'name': city_town['name'], 'value': city_town.get('population', 0)}
+            for city_town in target_county.get('cities_towns', [])
+        )
+        self._city_options_cache[county_key] = cached
         
-        # Extract cities/towns data
-        if 'cities_towns' in target_county:
-            for city_town in target_county['cities_towns']:
-                city_town_data = {
-                    'name':  city_town['name'],
-                    'value': city_town.get('population', 0)
-                }
-                                
-                cities_towns.append(city_town_data)
-                total_population += city_town_data['value']
-            #end for
+        return cached
+    #end get_cities_towns
+    
+    
+    def get_location(self):
+        
+        """
+        Draw a location from the precompiled city level table.
+        
+        Returns:
+            tuple: (province, county, city)
+            
+        Raises:
+            ValueError: If no data is loaded
+        """
+        
+        if not self.location_selector:
+            raise ValueError("No geographic data loaded. Call load_data() first.")
         #end if
         
-        return cities_towns, total_population
-    #end get_cities_towns
+        return self.location_selector.get_random()
+    #end get_location
+    
+    
+    def get_locations(self, n, rng=None):
+        
+        """
+        Draw n locations from the precompiled city level table in one vectorised call.
+        
+        Args:
+            n (int):                        Number of locations to draw
+            rng (numpy.random.Generator):   Optional generator, see WeightedRandomSelector.sample()
+            
+        Returns:
+            np.ndarray: n (province, county, city) tuples (object dtype)
+            
+        Raises:
+            ValueError: If no data is loaded
+        """
+        
+        if not self.location_selector:
+            raise ValueError("No geographic data loaded. Call load_data() first.")
+        #end if
+        
+        return self.location_selector.sample(n, rng, names=True)
+    #end get_locations
     
     
     def get_country_info(self):
@@ -444,27 +847,26 @@ def get_counties(data, province_name):
         province_name (str): Name of the province
         
     Returns:
-        tuple: (counties_list, total_population) or (None, None)
+        tuple: (counties_list, total_population) or (None, None),
+               counties_list is a cached, read only tuple of read only dicts
     """
     
-    counties         = []
-    total_population = 0
+    geo_index    = _get_geo_index(data)
+    province_key = province_name.casefold()
+    cached       = geo_index['county_options'].get(province_key)
     
-    # Find the specified province
-    target_province = None
-    for province in data.get('provinces', []):
-        if province['name'].lower() == province_name.lower():
-            target_province = province
-            
-            break
-        #end if
-    #end for
+    if cached is not None:
+        return cached
+    #end if
+    
+    target_province = geo_index['provinces'].get(province_key)
     
     if not target_province:
         return None, None
     #end if
     
     # Extract counties data
+    counties = []
     for county in target_province.get('counties', []):
         county_data = {
             'name':  county['name'],
@@ -476,10 +878,12 @@ def get_counties(data, province_name):
         #end if
         
         counties.append(county_data)
-        total_population += county_data['value']
-    #end fo
+    #end for
+    
+    cached = _freeze_options(counties)
+    geo_index['county_options'][province_key] = cached
     
-    return counties, total_population
+    return cached
 #end get_counties
 
 def get_cities_towns(data, province_name, county_name):
@@ -493,64 +897,257 @@ def get_cities_towns(data, province_name, county_name):
         county_name (str):   Name of the county
         
     Returns:
-        tuple: (cities_towns_list, total_population) or (None, None)
+        tuple: (cities_towns_list, total_population) or (None, None),
+               cities_towns_list is a cached, read only tuple of read only dicts
     """
     
-    cities_towns     = []
-    total_population = 0
-    
-    # Find the specified province
-    target_province = None
-    for province in data.get('provinces', []):
-        if province['name'].lower() == province_name.lower():
-            target_province = province
-            break
-        #end if
-    #end for
+    geo_index  = _get_geo_index(data)
+    county_key = (province_name.casefold(), county_name.casefold())
+    cached     = geo_index['city_options'].get(county_key)
     
-    if not target_province:
-        return None, None
+    if cached is not None:
+        return cached
     #end if
     
-    # Find the specified county
-    target_county = None
-    for county in target_province.get('counties', []):
-        if county['name'].lower() == county_name.lower():
-            target_county = county
-            
-            break
-        #end if
-    #end for
+    target_county = geo_index['counties'].get(county_key)
     
     if not target_county:
         return None, None
     #end if
     
     # Extract cities/towns data
-    if 'cities_towns' in target_county:
-        for city_town in target_county['cities_towns']:
-            city_town_data = {
-                'name':  city_town['name'],
-                'value': city_town.get('population', city_town.get('value', 0))
-            }
+    cities_towns = []
+    for city_town in target_county.get('cities_towns', []):
+        city_town_data = {
+            'name':  city_town['name'],
+            'value': city_town.get('population', city_town.get('value', 0))
+        }
+        
+        # Add optional fields if they exist
+        optional_fields = [
+            'average_age', 
+            'male_population', 
+            'female_population', 
+            'male_children', 
+            'female_children', 
+            'marital_status_percentages'
+        ]
+        for field in optional_fields:
+            if field in city_town:
+                city_town_data[field] = city_town[field]
+        #end for
+        
+        cities_towns.append(city_town_data)
+    #end for
+    
+    cached = _freeze_options(cities_towns)
+    geo_index['city_options'][county_key] = cached
+    
+    return cached
+#end get_cities_towns
+
+
+def _string_partitions(values, partitions):
+    
+    """
+    Partition, 0 .. partitions-1, of each string. A vectorised hash over the UTF-8 bytes (8 at a time, multiply
+    xor, then the splitmix64 finaliser), stable across processes unlike hash().
+    
+    Returns:
+        np.ndarray: uint64 partition per value
+    """
+    
+    raw    = np.array([value.encode('utf-8') for value in values], dtype=bytes)
+    width  = max(8, -(-raw.dtype.itemsize // 8) * 8)
+    words  = raw.astype(f'S{width}').view(np.uint64).reshape(raw.size, width // 8)
+    hashes = np.full(raw.size, 0xCBF29CE484222325, dtype=np.uint64)
+    
+    for column in words.T:
+        hashes = (hashes ^ column) * np.uint64(0x100000001B3)
+    #end for
+    
+    hashes = (hashes ^ (hashes >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    hashes = (hashes ^ (hashes >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    hashes =  hashes ^ (hashes >> np.uint64(31))
+    
+    return hashes % np.uint64(partitions)
+#end _string_partitions
+
+
+# Placeholder sets used by the bulk address columns, see Faker's numerify() and bothify().upper()
+_NUMERIFY_SETS      = {'#': string.digits, '%': string.digits[1:]}
+_BOTHIFY_UPPER_SETS = {'#': string.digits, '%': string.digits[1:], '?': string.ascii_uppercase}
+_TOKEN_RE           = re.compile(r"{{\s*(\w+)\s*}}")
+
+
+def _pattern_column(formats, char_sets, literals_only=False):
+    
+    """
+    Bulk pattern fill, each row picks one of formats and every placeholder character is replaced by a uniform
+    draw from its set, all other characters are kept as is.
+    
+    Args:
+        formats (list):         Patterns, e.g. ['%##'] or ['LNN AAAA']
+        char_sets (dict):       Placeholder character -> sequence of replacement strings
+        literals_only (bool):   True when every character of the pattern is a placeholder (_postcode_sets style)
+        
+    Returns:
+        callable(n, rng) returning an object ndarray of n strings
+    """
+    
+    compiled = []
+    for pattern in formats:
+        parts = []
+        for char in pattern:
+            choices = char_sets.get(char)
+            if choices is None and not literals_only:
+                parts.append(char)
+            else:
+                choices_array    = np.empty(len(choices), dtype=object)
+                choices_array[:] = list(choices)
+                parts.append(choices_array)
+            #end if
+        #end for
+        compiled.append(parts)
+    #end for
+    
+    def column(n, rng):
+        out   = np.empty(n, dtype=object)
+        picks = rng.integers(0, len(compiled), size=n) if len(compiled) > 1 else np.zeros(n, dtype=np.int64)
+        
+        for f_idx, parts in enumerate(compiled):
+            rows = np.flatnonzero(picks == f_idx)
+            if rows.size == 0:
+                continue
+            #end if
             
-            # Add optional fields if they exist
-            optional_fields = [
-                'average_age', 
-                'male_population', 
-                'female_population', 
-                'male_children', 
-                'female_children', 
-                'marital_status_percentages'
-            ]
-            for field in optional_fields:
-                if field in city_town:
-                    city_town_data[field] = city_town[field]
+            values = np.full(rows.size, "", dtype=object)
+            for part in parts:
+                if isinstance(part, str):
+                    values = values + part
+                else:
+                    values = values + part[rng.integers(0, len(part), size=rows.size)]
+                #end if
             #end for
             
-            cities_towns.append(city_town_data)
-            total_population += city_town_data['value']
+            out[rows] = values
         #end for
+        
+        return out
+    #end column
+    
+    return column
+#end _pattern_column
+
+
+def _word_column(elements):
+    
+    """
+    Bulk random_element(), elements can be a plain sequence (uniform) or a {word: weight} mapping as Faker uses.
+    
+    Returns:
+        callable(n, rng) returning an object ndarray of n strings
+    """
+    
+    if hasattr(elements, 'items'):
+        options = [{'name': word, 'value': weight} for word, weight in elements.items()]
+    else:
+        options = [{'name': word, 'value': 1.0} for word in elements]
     #end if
-    return cities_towns, total_population
-#end get_cities_towns
\ No newline at end of file
+    
+    selector = WeightedRandomSelector(options, scale=sum(option['value'] for option in options))
+    
+    def column(n, rng):
+        return selector.sample(n, rng, names=True)
+    #end column
+    
+    return column
+#end _word_column
+
+
+def _fallback_column(method):
+    
+    """Per row Faker call, for address components the locale builds in a way we don't vectorise"""
+    
+    def column(n, rng):
+        out    = np.empty(n, dtype=object)
+        out[:] = [method() for _ in range(n)]
+        
+        return out
+    #end column
+    
+    return column
+#end _fallback_column
+
+
+# Name index of the data set the standalone helpers last saw, one slot only, so a data set isn't kept alive
+# after the caller moves on to another one. The provider keeps its own index, see load_data().
+_last_geo_index = {"data": None, "index": None}
+
+
+def _get_geo_index(data):
+    
+    """
+    Return the case folded name indexes for a geographic data set, for the standalone helpers, rebuilt when they
+    are called with a different data set than last time.
+    """
+    
+    if _last_geo_index["data"] is not data:
+        _last_geo_index["index"] = _build_geo_index(data)
+        _last_geo_index["data"]  = data
+    #end if
+    
+    return _last_geo_index["index"]
+#end _get_geo_index
+
+
+def _build_geo_index(data):
+    
+    """
+    Build the case folded name indexes for a geographic data set.
+    
+    Args:
+        data (dict): Raw JSON data
+        
+    Returns:
+        dict: 'provinces'      {province_key: province}
+              'counties'       {(province_key, county_key): county}
+              'county_options' / 'city_options' result caches for the standalone helpers
+    """
+    
+    provinces = {}
+    counties  = {}
+    
+    for province in data.get('provinces', []):
+        province_key = province['name'].casefold()
+        provinces.setdefault(province_key, province)            # First match wins, as with the old linear scan
+        
+        for county in province.get('counties', []):
+            counties.setdefault((province_key, county['name'].casefold()), county)
+        #end for
+    #end for
+    
+    geo_index = {
+        'provinces':      provinces,
+        'counties':       counties,
+        'county_options': {},
+        'city_options':   {}
+    }
+    
+    return geo_index
+#end _build_geo_index
+
+
+def _freeze_options(options):
+    
+    """
+    Freeze an options list for caching.
+    
+    Returns:
+        tuple: (tuple of read only option dicts, total_population)
+    """
+    
+    frozen = tuple(MappingProxyType(option) for option in options)
+    
+    return frozen, sum(option['value'] for option in frozen)
+#end _freeze_options
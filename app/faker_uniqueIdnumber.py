@@ -16,10 +16,23 @@
 #
 #   Created     	:   06 Aug 2025
 #
-#   Functions       :   IrishPpsNumberProvider
+#   Functions       :   FeistelPermutation
+#                   :       permute
+#                   :       permute_many
+#                   :   IrishPpsNumberProvider
 #                   :       pps_number
+#                   :       configure_pps_stream
+#                   :       unique_pps_number
+#                   :       unique_pps_numbers
+#                   :       _pps_check_letter
+#                   :   SASequenceAllocator
+#                   :       allocate
+#                   :       remaining
 #                   :   SAIdNumberProvider
 #                   :       sa_id_number
+#                   :       configure_sa_allocator
+#                   :       unique_sa_id_number
+#                   :       sa_id_numbers
 #                   :       _calculate_luhn_check_digit
 #                   :       validate_sa_id
 #                   
@@ -34,6 +47,124 @@ __copyright__   = "Copyright 2025, - George Leonard"
 from faker.providers import BaseProvider
 import random
 from datetime import datetime
+from hashlib import blake2b
+import numpy as np
+
+
+class FeistelPermutation:
+    
+    """
+    Keyed pseudo random bijection on the integers 0 .. domain-1.
+    
+    A balanced Feistel network over the smallest even number of bits covering the domain, with cycle walking:
+    values that land outside the domain are permuted again until they fall inside, which keeps it a bijection
+    on the domain itself. Walking a counter 0, 1, 2, ... through permute() therefore yields every value in the
+    domain exactly once, in a scrambled order, with nothing to remember but the counter.
+    
+    The round function only uses 32 bit multiply/xor/shift so the same permutation is evaluated on NumPy
+    uint64 arrays by permute_many().
+    """
+    
+    ROUNDS = 4
+    
+    def __init__(self, domain, seed):
+        
+        """
+        Args:
+            domain (int): Size of the domain, e.g. 10**7 for 7 digit numbers
+            seed (int):   Key, the same seed always gives the same permutation
+        """
+        
+        self.domain    = domain
+        half_bits      = max(1, ((domain - 1).bit_length() + 1) // 2)
+        self.half_bits = half_bits
+        self.half_mask = (1 << half_bits) - 1
+        
+        digest         = blake2b(str(seed).encode('utf-8'), digest_size=4 * self.ROUNDS).digest()
+        self.keys      = [int.from_bytes(digest[i * 4:(i + 1) * 4], 'little') for i in range(self.ROUNDS)]
+    #end __init__
+    
+    
+    @staticmethod
+    def _round(value, key):
+        
+        """32 bit integer mix of one Feistel half with a round key"""
+        
+        x = ((value ^ key) * 0x45D9F3B) & 0xFFFFFFFF
+        x = ((x ^ (x >> 16)) * 0x45D9F3B) & 0xFFFFFFFF
+        
+        return x ^ (x >> 16)
+    #end _round
+    
+    
+    def permute(self, value):
+        
+        """Map value (0 <= value < domain) to its position in the permutation"""
+        
+        while True:
+            left  = value >> self.half_bits
+            right = value & self.half_mask
+            
+            for key in self.keys:
+                left, right = right, left ^ (self._round(right, key) & self.half_mask)
+            #end for
+            
+            value = (left << self.half_bits) | right
+            
+            if value < self.domain:
+                return value
+            #end if
+        #end while
+    #end permute
+    
+    
+    def permute_many(self, values):
+        
+        """
+        Vectorised permute(), same permutation, for a NumPy array of values.
+        
+        Returns:
+            np.ndarray: uint64 permuted values
+        """
+        
+        values    = np.array(values, dtype=np.uint64)
+        half_bits = np.uint64(self.half_bits)
+        half_mask = np.uint64(self.half_mask)
+        mask32    = np.uint64(0xFFFFFFFF)
+        mult      = np.uint64(0x45D9F3B)
+        shift16   = np.uint64(16)
+        pending   = np.arange(values.size)
+        
+        # Cycle walk, only the values still outside the domain go round again
+        while pending.size:
+            current = values[pending]
+            left    = current >> half_bits
+            right   = current & half_mask
+            
+            for key in self.keys:
+                x           = ((right ^ np.uint64(key)) * mult) & mask32
+                x           = ((x ^ (x >> shift16)) * mult) & mask32
+                x           = x ^ (x >> shift16)
+                left, right = right, left ^ (x & half_mask)
+            #end for
+            
+            current         = (left << half_bits) | right
+            values[pending] = current
+            pending         = pending[current >= np.uint64(self.domain)]
+        #end while
+        
+        return values
+    #end permute_many
+#end FeistelPermutation
+
+
+PPS_DOMAIN            = 10 ** 7                         # 7 digit numerical part
+PPS_CHECKSUM_ALPHABET = "WABCDEFGHIJKLMNOPQRSTUV"
+
+# Vectorised checksum helpers, see unique_pps_numbers()
+_PPS_POWERS           = np.array([10 ** i for i in range(6, -1, -1)], dtype=np.uint64)
+_PPS_WEIGHTS          = np.arange(8, 1, -1, dtype=np.int64)
+_PPS_ALPHABET_CODES   = np.frombuffer(PPS_CHECKSUM_ALPHABET.encode('ascii'), dtype=np.uint8)
 
 
 class IrishPpsNumberProvider(BaseProvider):
@@ -54,30 +185,245 @@ class IrishPpsNumberProvider(BaseProvider):
         # We ensure these are actual digits (0-9)
         digits = [random.randint(0, 9) for _ in range(7)]
 
-        # Calculate the checksum letter(s)
-        # The weights for the first 7 digits are 8, 7, 6, 5, 4, 3, 2 respectively.
-        checksum_sum = sum(digits[i] * (8 - i) for i in range(7))
-
-        # The checksum algorithm maps remainders to specific letters.
-        # This custom alphabet ensures the correct mapping for modulo 23.
-        # 'W' corresponds to 0, 'A' to 1, 'B' to 2, ..., 'V' to 22.
-        # This is a specific sequence to match the official algorithm.
-        checksum_alphabet = "WABCDEFGHIJKLMNOPQRSTUV"
-
-        # Calculate the remainder when the sum is divided by 23
-        remainder = checksum_sum % 23
-
-        # Get the checksum letter using the remainder as an index
-        checksum_letter = checksum_alphabet[remainder]
-
         # Format the PPS number as a string
-        pps_number_str = "".join(map(str, digits)) + checksum_letter
+        pps_number_str = "".join(map(str, digits)) + self._pps_check_letter(digits)
 
         return pps_number_str
     #end pps_number
+    
+    
+    def configure_pps_stream(self, seed=None, start=0, stop=PPS_DOMAIN):
+        
+        """
+        (Re)configure the collision free PPS stream used by unique_pps_number().
+        
+        Args:
+            seed (int, optional): Permutation key, random if not given. Streams that must not overlap
+                                  (e.g. parallel workers) share the seed and take disjoint [start, stop) ranges.
+            start (int):          First counter value of this stream
+            stop (int):           Counter value at which this stream is exhausted (max 10,000,000)
+        """
+        
+        if not 0 <= start <= stop <= PPS_DOMAIN:
+            raise ValueError(f"PPS stream range must be within 0 .. {PPS_DOMAIN}, got {start} .. {stop}")
+        #end if
+        
+        if seed is None:
+            seed = random.getrandbits(64)
+        #end if
+        
+        self._pps_permutation = FeistelPermutation(PPS_DOMAIN, seed)
+        self._pps_counter     = start
+        self._pps_stop        = stop
+    #end configure_pps_stream
+    
+    
+    def unique_pps_number(self):
+        
+        """
+        Generates a PPS number that is guaranteed unique within this stream, no uniqueness set needed.
+        
+        Walks a counter through a keyed permutation of 0 .. 9,999,999, see FeistelPermutation, so the numbers look
+        random but never repeat until the 10 million (or configured range) are used up.
+        
+        Raises:
+            OverflowError: When the stream is exhausted
+        """
+        
+        if getattr(self, '_pps_permutation', None) is None:
+            self.configure_pps_stream()
+        #end if
+        
+        if self._pps_counter >= self._pps_stop:
+            raise OverflowError(f"PPS number stream exhausted at {self._pps_stop} numbers")
+        #end if
+        
+        value              = self._pps_permutation.permute(self._pps_counter)
+        self._pps_counter += 1
+        digits             = f"{value:07d}"
+        
+        return digits + self._pps_check_letter(int(digit) for digit in digits)
+    #end unique_pps_number
+    
+    
+    def unique_pps_numbers(self, n):
+        
+        """
+        Batch version of unique_pps_number(), same stream, generated as a NumPy digit matrix.
+        
+        The counters are permuted in one vectorised pass, split into a (n, 7) digit matrix, the 8..2 weighted
+        mod 23 checksum is a matrix product and the strings are assembled as one (n, 8) byte matrix.
+        
+        Returns:
+            list: n PPS number strings
+            
+        Raises:
+            OverflowError: When the stream can't supply n more numbers
+        """
+        
+        if getattr(self, '_pps_permutation', None) is None:
+            self.configure_pps_stream()
+        #end if
+        
+        if self._pps_counter + n > self._pps_stop:
+            raise OverflowError(f"PPS number stream exhausted at {self._pps_stop} numbers")
+        #end if
+        
+        values             = self._pps_permutation.permute_many(np.arange(self._pps_counter, self._pps_counter + n))
+        self._pps_counter += n
+        
+        digits             = ((values[:, None] // _PPS_POWERS[None, :]) % np.uint64(10)).astype(np.int64)
+        remainders         = (digits @ _PPS_WEIGHTS) % 23
+        
+        raw                = np.empty((n, 8), dtype=np.uint8)
+        raw[:, :7]         = digits + ord('0')
+        raw[:, 7]          = _PPS_ALPHABET_CODES[remainders]
+        
+        return raw.view('S8').ravel().astype('U8').tolist()
+    #end unique_pps_numbers
+    
+    
+    @staticmethod
+    def _pps_check_letter(digits):
+        
+        """
+        Calculate the PPS checksum letter for 7 digits.
+        
+        The weights for the first 7 digits are 8, 7, 6, 5, 4, 3, 2 respectively.
+        The checksum algorithm maps remainders (modulo 23) to specific letters, 'W' corresponds to 0, 
+        'A' to 1, 'B' to 2, ..., 'V' to 22. This is a specific sequence to match the official algorithm.
+        """
+        
+        checksum_sum = sum(digit * (8 - i) for i, digit in enumerate(digits))
+        
+        return PPS_CHECKSUM_ALPHABET[checksum_sum % 23]
+    #end _pps_check_letter
 #end IrishPpsNumberProvider
 
 
+SA_BAND_COMBINATIONS  = 5 * 1000                       # Gender digits per band x SSS sequence numbers
+SA_SHARED_COMBINATIONS = 1000                          # Tail of every key shared out between partitions, see below
+
+
+class SASequenceAllocator:
+    
+    """
+    Hands out unique gender digit/sequence combinations per (YYMMDD, gender band, citizenship) key.
+    
+    Only 5,000 combinations exist per birth date and gender, so on a busy date drawing them at random and
+    checking a uniqueness set retries more and more until it fails outright. Instead each key walks a counter
+    through its own FeistelPermutation of 0 .. 4,999: O(1) per ID, never a collision, and a clear error once the
+    key is used up. State is one permutation and counters per key seen.
+    
+    With partitions > 1 (parallel workers) a key's counters are split in two. The owner of a birth date, the one
+    shard generating that day's households, takes counters 0 .. 3,999 for the day's own IDs (owned=True). IDs for
+    derived dates (wives, children), which any worker can land on, share the last SA_SHARED_COMBINATIONS counters,
+    every partitions-th one per partition.
+    """
+    
+    def __init__(self, seed, partition=0, partitions=1):
+        
+        """
+        Args:
+            seed (int):       Allocator key, each (date, band, citizenship) key gets its own permutation derived from it
+            partition (int):  This allocator's share of the shared counters, allocators that must not overlap (e.g.
+            partitions (int): parallel workers) share the seed and take shared counters partition, partition + partitions, ...
+        """
+        
+        if not 0 <= partition < partitions:
+            raise ValueError(f"SA allocator partition must be within 0 .. {partitions - 1}, got {partition}")
+        #end if
+        
+        if partitions > SA_SHARED_COMBINATIONS:
+            raise ValueError(f"SA allocator supports at most {SA_SHARED_COMBINATIONS} partitions, got {partitions}")
+        #end if
+        
+        self.seed       = seed
+        self.partition  = partition
+        self.partitions = partitions
+        
+        if partitions == 1:
+            self.owned_capacity  = SA_BAND_COMBINATIONS     # One counter for everything, owned and shared alike
+            self.shared_capacity = SA_BAND_COMBINATIONS
+            
+        else:
+            self.owned_capacity  = SA_BAND_COMBINATIONS - SA_SHARED_COMBINATIONS
+            self.shared_capacity = len(range(partition, SA_SHARED_COMBINATIONS, partitions))
+        
+        #end if
+        self._keys      = {}                            # key -> [FeistelPermutation, next owned counter, next shared counter]
+    #end __init__
+    
+    
+    def _entry(self, key):
+        
+        entry = self._keys.get(key)
+        if entry is None:
+            entry           = [FeistelPermutation(SA_BAND_COMBINATIONS, f"{self.seed}:{key}"), 0, 0]
+            self._keys[key] = entry
+        #end if
+        
+        return entry
+    #end _entry
+    
+    
+    def allocate(self, key, n, owned=False):
+        
+        """
+        Allocate n combinations for a key.
+        
+        Args:
+            key (tuple):  (YYMMDD, band low gender digit, citizenship digit)
+            n (int):      Number of combinations
+            owned (bool): The caller owns the birth date, see the class docstring, ignored with 1 partition
+            
+        Returns:
+            np.ndarray: n combinations in 0 .. 4,999, gender digit = band low + value // 1000, SSS = value % 1000
+            
+        Raises:
+            OverflowError: When the key has fewer than n combinations left
+        """
+        
+        entry = self._entry(key)
+        
+        if owned or self.partitions == 1:
+            slot, capacity = 1, self.owned_capacity
+        
+        else:
+            slot, capacity = 2, self.shared_capacity
+        
+        #end if
+        counter = entry[slot]
+        if counter + n > capacity:
+            raise OverflowError(f"SA ID capacity exhausted for birth date {key[0]}, gender digits {key[1]}-{key[1] + 4}: "
+                                f"{capacity - counter} of {capacity} {'owned' if slot == 1 else 'shared'} left, {n} requested")
+        #end if
+        
+        entry[slot] = counter + n
+        counters    = np.arange(counter, counter + n)
+        if slot == 2:
+            counters = self.owned_capacity + counters * self.partitions + self.partition
+        #end if
+        
+        return entry[0].permute_many(counters).astype(np.int64)
+    #end allocate
+    
+    
+    def remaining(self, key, owned=False):
+        
+        """Combinations still free for a key, owned or shared"""
+        
+        entry = self._keys.get(key)
+        
+        if owned or self.partitions == 1:
+            return self.owned_capacity - (entry[1] if entry else 0)
+        
+        #end if
+        return self.shared_capacity - (entry[2] if entry else 0)
+    #end remaining
+#end SASequenceAllocator
+
+
 class SAIdNumberProvider(BaseProvider):
     
     """
@@ -106,21 +452,8 @@ class SAIdNumberProvider(BaseProvider):
             str: 13-digit South African ID number
         """
         
-        # Handle birth date
-        if birth_date is None:
-            # Use faker's random for consistency with unique functionality
-            birth_date = self.generator.date_of_birth(minimum_age=18, maximum_age=80)
-            
-        elif isinstance(birth_date, str):
-            # Parse string date
-            if len(birth_date.split('/')[0]) == 2:  # YY/MM/DD format
-                birth_date = datetime.strptime(birth_date, '%y/%m/%d')
-                
-            else:  # YYYY/MM/DD format
-                birth_date = datetime.strptime(birth_date, '%Y/%m/%d')
-        
-        # Format date part (YYMMDD)
-        date_part = birth_date.strftime('%y%m%d')
+        # Handle birth date, format date part (YYMMDD)
+        date_part = self._sa_date_part(birth_date)
         
         # Handle gender digit (G) - use faker's random for uniqueness support
         if gender is None:
@@ -157,6 +490,167 @@ class SAIdNumberProvider(BaseProvider):
     #end sa_id_number
     
     
+    def configure_sa_allocator(self, seed=None, partition=0, partitions=1):
+        
+        """
+        (Re)configure the sequence allocator used by sa_id_numbers() / unique_sa_id_number().
+        
+        Args:
+            seed (int, optional): Allocator key, random if not given, the same seed hands out the same IDs
+                                  in the same order.
+            partition (int):      See SASequenceAllocator, each partition gets 1/partitions of the shared
+            partitions (int):     part of every (date, gender band) key
+        """
+        
+        if seed is None:
+            seed = self.generator.random.getrandbits(64)
+        #end if
+        
+        self._sa_allocator = SASequenceAllocator(seed, partition, partitions)
+        self._sa_rng       = np.random.default_rng([seed, partition])
+    #end configure_sa_allocator
+    
+    
+    def unique_sa_id_number(self, birth_date=None, gender=None, citizen=True, owned=False):
+        
+        """
+        Generates a South African ID number that is guaranteed unique within this provider, see sa_id_numbers().
+        
+        Raises:
+            OverflowError: When the birth date/gender band has no combinations left
+        """
+        
+        return self.sa_id_numbers(1, birth_date=birth_date, gender=gender, citizen=citizen, owned=owned)[0]
+    #end unique_sa_id_number
+    
+    
+    def sa_id_numbers(self, n, birth_date=None, gender=None, citizen=True, owned=False):
+        
+        """
+        Generate n unique South African ID numbers for one birth date/gender in one vectorised pass.
+        
+        The gender digit/sequence combinations come from the SASequenceAllocator, which hands out the next free
+        combinations of the (YYMMDD, gender band) in a shuffled order, so there is nothing to check and nothing
+        to retry. The race digit is drawn as a NumPy column, the Luhn check digit is computed with array ops and
+        the strings are assembled as one (n, 13) byte matrix.
+        
+        Args:
+            n (int):                        Number of ID numbers
+            birth_date (str or datetime):   As per sa_id_number()
+            gender (str):                   As per sa_id_number(), if not given each ID picks a band at random
+            citizen (bool):                 As per sa_id_number()
+            owned (bool):                   This worker owns the birth date, see SASequenceAllocator
+            
+        Returns:
+            list: n 13-digit South African ID numbers
+            
+        Raises:
+            OverflowError: When the birth date/gender band has fewer than n combinations left
+        """
+        
+        if getattr(self, '_sa_allocator', None) is None:
+            self.configure_sa_allocator()
+        #end if
+        
+        rng                     = self._sa_rng
+        date_part               = self._sa_date_part(birth_date)
+        citizenship_digit       = 0 if citizen else 1
+        gender_low, gender_high = self._sa_gender_range(gender)
+        
+        gender_digits           = np.empty(n, dtype=np.int64)
+        sequences               = np.empty(n, dtype=np.int64)
+        
+        if gender_high - gender_low == 9:
+            # No gender given, split the batch over the female (0-4) and male (5-9) bands
+            band_lows = np.where(rng.random(n) < 0.5, 0, 5)
+        
+        else:
+            band_lows = np.full(n, gender_low)
+        
+        #end if
+        for band_low in np.unique(band_lows):
+            rows                = np.flatnonzero(band_lows == band_low)
+            combos              = self._sa_allocator.allocate((date_part, int(band_low), citizenship_digit), rows.size, owned)
+            gender_digits[rows] = band_low + combos // 1000
+            sequences[rows]     = combos % 1000
+        #end for
+        
+        digits                  = np.empty((n, 12), dtype=np.int64)
+        digits[:, 0:6]          = [int(digit) for digit in date_part]
+        digits[:, 6]            = gender_digits
+        digits[:, 7]            = sequences // 100
+        digits[:, 8]            = (sequences // 10) % 10
+        digits[:, 9]            = sequences % 10
+        digits[:, 10]           = citizenship_digit
+        digits[:, 11]           = rng.integers(8, 10, size=n)
+        
+        return self._sa_id_bytes(digits).view('S13').ravel().astype('U13').tolist()
+    #end sa_id_numbers
+    
+    
+    def _sa_id_bytes(self, digits):
+        
+        """
+        Vectorised Luhn check digit and byte assembly for a (n, 12) digit matrix.
+        
+        Returns:
+            np.ndarray: (n, 13) uint8 ASCII matrix, view as 'S13' for the strings
+        """
+        
+        # Every second digit from the right of the 12, i.e. the odd (0 based) columns, is doubled
+        weighted          = digits.copy()
+        weighted[:, 1::2] *= 2
+        weighted          = np.where(weighted > 9, weighted - 9, weighted)
+        check             = (10 - weighted.sum(axis=1) % 10) % 10
+        
+        raw               = np.empty((digits.shape[0], 13), dtype=np.uint8)
+        raw[:, :12]       = digits + ord('0')
+        raw[:, 12]        = check + ord('0')
+        
+        return raw
+    #end _sa_id_bytes
+    
+    
+    def _sa_date_part(self, birth_date):
+        
+        """
+        Birth date as the YYMMDD date part, accepts 'YY/MM/DD', 'YYYY/MM/DD', a datetime or None (random)
+        """
+        
+        if birth_date is None:
+            # Use faker's random for consistency with unique functionality
+            birth_date = self.generator.date_of_birth(minimum_age=18, maximum_age=80)
+            
+        elif isinstance(birth_date, str):
+            # Parse string date
+            if len(birth_date.split('/')[0]) == 2:  # YY/MM/DD format
+                birth_date = datetime.strptime(birth_date, '%y/%m/%d')
+                
+            else:  # YYYY/MM/DD format
+                birth_date = datetime.strptime(birth_date, '%Y/%m/%d')
+        
+        return birth_date.strftime('%y%m%d')
+    #end _sa_date_part
+    
+    
+    @staticmethod
+    def _sa_gender_range(gender):
+        
+        """Gender digit range (inclusive), 0-4 female, 5-9 male, 0-9 if not given/invalid"""
+        
+        gender_lower = str(gender).lower() if gender is not None else None
+        
+        if gender_lower in ['female', 'f']:
+            return 0, 4
+        
+        elif gender_lower in ['male', 'm']:
+            return 5, 9
+        #end if
+        
+        return 0, 9
+    #end _sa_gender_range
+    
+    
     def _calculate_luhn_check_digit(self, id_number):
         
         """
@@ -201,8 +695,8 @@ class SAIdNumberProvider(BaseProvider):
         # Extract components
         date_part         = id_number[:6]
         gender_digit      = int(id_number[6])
-        citizenship_digit = int(id_number[9])
-        race_digit        = int(id_number[10])
+        citizenship_digit = int(id_number[10])
+        race_digit        = int(id_number[11])
         check_digit       = int(id_number[12])
         
         # Validate date
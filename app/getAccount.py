@@ -28,11 +28,11 @@ def createBankAccount(fake, init, surname):
     
     arAccounts        = []
     x                 = 0
-    NumberOfAccounts  = WeightedRandomSelector(bank_accounts_per_person, scale=1).get_random()
+    NumberOfAccounts  = bank_accounts_per_person_selector.get_random()
     
     while x < NumberOfAccounts:
         
-        bank_name     = WeightedRandomSelector(banks_options,  scale=1.33).get_random()            
+        bank_name     = banks_selector.get_random()            
         bank_record   = fake.get_bank_info(bank_name)
         genAccount    = fake.unique.irish_iban_account_number(bank_record["iban_structure"])
 
@@ -42,7 +42,7 @@ def createBankAccount(fake, init, surname):
             "swift_code":       bank_record["swift_code"],
             "iban_structure":   bank_record["iban_structure"],          # Basically our unique bank id/reference
             "accountNumber":    genAccount,
-            "accountType":      WeightedRandomSelector(accountTypes_options, scale=1).get_random()
+            "accountType":      accountTypes_selector.get_random()
         }
         arAccounts.append(account)
         x += 1
@@ -54,15 +54,15 @@ def createBankAccount(fake, init, surname):
 def createCCAccount(fake, init, surname, arAccounts):
     
     x           = 0
-    NumberOfCC  = WeightedRandomSelector(credit_cards_per_person, scale=1).get_random()
+    NumberOfCC  = credit_cards_per_person_selector.get_random()
     
     while x < NumberOfCC:
         
-        bank_name     = WeightedRandomSelector(banks_options,  scale=1.33).get_random()    
+        bank_name     = banks_selector.get_random()    
         bank_record   = fake.get_bank_info(bank_name)
         
         card_network_options = bank_record["card_network"]
-        cardNetwork          = WeightedRandomSelector(card_network_options, scale=1).get_random()
+        cardNetwork          = compiled_selector(card_network_options, scale=1).get_random()
         
         if cardNetwork == "Mastercard":    # Generate a Mastercard number
             ccNum = fake.unique.credit_card_number(card_type='mastercard')
@@ -17,24 +17,33 @@ __version__     = "0.1"
 __copyright__   = "Copyright 2025, - George Leonard"
 
 
-def generate_IdNumbers(fake, config_params, dob, gender, cnt):
+def generate_IdNumbers(fake, config_params, dob, gender, cnt, owned=False):
+
+    """
+    Generate cnt unique national ID numbers for the locale.
+    
+    Batches go through the vectorised providers, unique_pps_numbers() / sa_id_numbers(), which build the IDs as
+    NumPy digit matrices, a single PPS number takes the scalar path as the array setup isn't worth it for one.
+    
+    owned marks the day's own date of birth, its SA IDs come from the date owner's share, see SASequenceAllocator.
+    """
 
     idNumbers = []
-    x         = 0
 
     if config_params["LOCALE"] == "en_IE":
-         while x < cnt:
-             idNumbers.append(fake.unique.pps_number())
-             x += 1
-            
-        # #end while
+        if cnt == 1:
+            idNumbers.append(fake.unique_pps_number())          # Collision free by construction, no fake.unique set
+        
+        elif cnt > 1:
+            idNumbers = fake.unique_pps_numbers(cnt)
+        
+        #end if
     elif config_params["LOCALE"] == "zu_ZA":
-         while x < cnt:
-             idNumbers.append(fake.unique.sa_id_number(birth_date=dob, gender=gender))
-             x += 1
-
-        # #end while
+        if cnt > 0:
+            idNumbers = fake.sa_id_numbers(cnt, birth_date=dob, gender=gender, owned=owned)
+        
+        #end if
     #end if
 
     return idNumbers
-#enf generate_IdNumbers
\ No newline at end of file
+#enf generate_IdNumbers
@@ -0,0 +1,141 @@
+#######################################################################################################################
+#
+#
+#  	Project     	: 	Generic Data generator.
+#
+#   File            :   json_codec.py
+#
+#   Description     :   JSON encoding shared by the persistent stores, orjson or msgspec when installed, json otherwise.
+#
+#   Created     	:   17 Oct 2026
+#
+#                   :   Every sink used to call json.dumps itself, per record for Kafka and Redis, per row for the
+#                       PostgreSQL loaders. They now all go through dumpb()/dumps(), which use the fastest backend
+#                       available. Output is compact UTF-8 JSON whichever backend is used.
+#
+#                       CachedRecord is a dict that keeps its own encoding, the first dumpb() encodes it, later ones
+#                       (retries, a second store, ...) reuse the bytes. cache_records() converts a batch and encodes it
+#                       up front, which generate_day() does where the batch is generated, see JSON_PRECODE. A
+#                       CachedRecord must not be changed after it has been encoded.
+#
+#   Usage:
+#       payload = dumpb(record)                         # bytes
+#       text    = dumps(record)                         # str
+#       records = cache_records(records)                # encoded once, reused by every dumpb()/dumps()
+#
+#   Classes         :   CachedRecord
+#
+#   Functions       :   dumpb
+#                   :   dumpb_array
+#                   :   dumps
+#                   :   loads
+#                   :   cache_records
+#
+#
+########################################################################################################################
+__author__      = "Generic Data playground"
+__email__       = "georgelza@gmail.com"
+__version__     = "0.1"
+__copyright__   = "Copyright 2025, - George Leonard"
+
+
+import json
+from typing import Any, Dict, List
+
+try:
+    import orjson
+    BACKEND = "orjson"
+
+except ImportError:
+    orjson = None
+
+    try:
+        import msgspec
+        BACKEND = "msgspec"
+
+    except ImportError:
+        msgspec = None
+        BACKEND = "json"
+
+    #end try
+#end try
+
+
+if BACKEND == "orjson":
+    def _encode(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+    #end _encode
+
+    loads = orjson.loads
+
+elif BACKEND == "msgspec":
+    _msgspec_encoder = msgspec.json.Encoder(enc_hook=str)
+    _encode          = _msgspec_encoder.encode
+    loads            = msgspec.json.decode
+
+else:
+    def _encode(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+    #end _encode
+
+    loads = json.loads
+
+#end if
+
+
+class CachedRecord(dict):
+
+    """A document that remembers its JSON encoding, see dumpb()"""
+
+    __slots__ = ("encoded",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.encoded = None
+    #end __init__
+#end CachedRecord
+
+
+def dumpb(obj: Any) -> bytes:
+
+    """JSON encode to UTF-8 bytes, a CachedRecord is encoded once"""
+
+    if type(obj) is CachedRecord:
+        if obj.encoded is None:
+            obj.encoded = _encode(obj)
+        #end if
+
+        return obj.encoded
+    #end if
+
+    return _encode(obj)
+#end dumpb
+
+
+def dumpb_array(records: List[Any]) -> bytes:
+
+    """JSON array of records, reusing the CachedRecord encodings"""
+
+    return b"[" + b",".join([dumpb(record) for record in records]) + b"]"
+#end dumpb_array
+
+
+def dumps(obj: Any) -> str:
+
+    """JSON encode to str"""
+
+    return dumpb(obj).decode("utf-8")
+#end dumps
+
+
+def cache_records(records: List[Dict[str, Any]]) -> List[CachedRecord]:
+
+    """Convert a batch to CachedRecords and encode them now"""
+
+    cached = [CachedRecord(record) for record in records]
+    for record in cached:
+        dumpb(record)
+    #end for
+
+    return cached
+#end cache_records
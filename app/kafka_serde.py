@@ -0,0 +1,350 @@
+#######################################################################################################################
+#
+#
+#  	Project     	: 	Generic Data generator.
+#
+#   File            :   kafka_serde.py
+#
+#   Description     :   Avro value serialisation for the Kafka topics, with schema registration.
+#
+#   Created     	:   17 Oct 2026
+#
+#                   :   The adult, child and family documents built in packager.py are encoded as schemaless Avro
+#                       binary in the Confluent wire format: magic byte 0, 4 byte big endian schema id, Avro body.
+#                       Field names are carried by the schema instead of every message, roughly halving the
+#                       payload compared with JSON.
+#
+#                       Schemas are registered under <topic>-value (TopicNameStrategy) with either a Confluent
+#                       compatible schema registry (http(s)://...) or, for tests and local runs without a registry,
+#                       a JSON file stand-in (file://path/to/registry.json) that hands out ids the same way.
+#
+#   Usage:
+#       registry   = create_schema_registry(config_params["SCHEMAREGISTRY_SERVERS"])
+#       serializer = AvroSerializer(ADULT_SCHEMA, registry.register("adults-value", ADULT_SCHEMA))
+#       payload    = serializer(record)                 # bytes
+#
+#   Classes         :   SchemaRegistry (Abstract Class)
+#                   :       register
+#                   :   HttpSchemaRegistry
+#                   :   FileSchemaRegistry
+#                   :   AvroSerializer
+#
+#   Functions       :   create_schema_registry
+#
+#
+########################################################################################################################
+__author__      = "Generic Data playground"
+__email__       = "georgelza@gmail.com"
+__version__     = "0.1"
+__copyright__   = "Copyright 2025, - George Leonard"
+
+
+import io, json, os, struct, threading
+import urllib.request
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+try:
+    import fastavro
+
+except ImportError:
+    fastavro = None                                     # Only needed for KAFKA_FORMAT=avro
+
+#end try
+
+
+def _nullable(name: str, kind: Any = "string") -> Dict[str, Any]:
+    return {"name": name, "type": ["null", kind], "default": None}
+#end _nullable
+
+
+ADDRESS_SCHEMA = {
+    "type":         "record",
+    "name":         "Address",
+    "fields": [
+        {"name": "street",      "type": "string"},
+        {"name": "town",        "type": "string"},
+        {"name": "county",      "type": "string"},
+        {"name": "state",       "type": "string"},
+        {"name": "post_code",   "type": "string"},
+        {"name": "country",     "type": "string"}
+    ]
+}
+
+# Bank accounts and cards share the account list, only iban_structure is common to both
+ACCOUNT_SCHEMA = {
+    "type":         "record",
+    "name":         "Account",
+    "fields": [
+        {"name": "iban_structure", "type": "string"},
+        _nullable("accountNumber"),
+        _nullable("accountType"),
+        _nullable("bank"),
+        _nullable("bicfi_code"),
+        _nullable("swift_code"),
+        _nullable("card_holder"),
+        _nullable("card_network"),
+        _nullable("card_number"),
+        _nullable("exp_date"),
+        _nullable("issuing_bank")
+    ]
+}
+
+# packageAdults() _b record, family_id/partner/marital_status are missing for some
+ADULT_SCHEMA = {
+    "type":         "record",
+    "name":         "Adult",
+    "namespace":    "generic.datagen",
+    "fields": [
+        {"name": "_id",         "type": "string"},
+        {"name": "name",        "type": "string"},
+        {"name": "surname",     "type": "string"},
+        {"name": "uniqueId",    "type": "string"},
+        {"name": "gender",      "type": "string"},
+        {"name": "dob",         "type": "string"},
+        _nullable("marital_status"),
+        _nullable("partner"),
+        {"name": "status",      "type": "string"},
+        {"name": "account",     "type": {"type": "array", "items": ACCOUNT_SCHEMA}},
+        {"name": "address",     "type": ADDRESS_SCHEMA},
+        _nullable("family_id")
+    ]
+}
+
+# packageChild() _b record
+CHILD_SCHEMA = {
+    "type":         "record",
+    "name":         "Child",
+    "namespace":    "generic.datagen",
+    "fields": [
+        {"name": "_id",             "type": "string"},
+        {"name": "name",            "type": "string"},
+        {"name": "surname",         "type": "string"},
+        {"name": "gender",          "type": "string"},
+        {"name": "dob",             "type": "string"},
+        {"name": "uniqueId",        "type": "string"},
+        {"name": "father_idNumber", "type": "string"},
+        {"name": "mother_idNumber", "type": "string"},
+        {"name": "address",         "type": ADDRESS_SCHEMA},
+        {"name": "family_id",       "type": "string"}
+    ]
+}
+
+# Family document, the _a adult and child records nested
+FAMILY_SCHEMA = {
+    "type":         "record",
+    "name":         "Family",
+    "namespace":    "generic.datagen",
+    "fields": [
+        {"name": "_id",         "type": "string"},
+        _nullable("husband", {
+            "type":     "record",
+            "name":     "Partner",
+            "fields": [
+                {"name": "name",            "type": "string"},
+                {"name": "surname",         "type": "string"},
+                {"name": "uniqueId",        "type": "string"},
+                {"name": "gender",          "type": "string"},
+                {"name": "dob",             "type": "string"},
+                {"name": "marital_status",  "type": "string"},
+                {"name": "partner",         "type": "string"},
+                {"name": "status",          "type": "string"},
+                {"name": "account",         "type": {"type": "array", "items": ACCOUNT_SCHEMA}}
+            ]
+        }),
+        _nullable("wife", "Partner"),
+        _nullable("children", {
+            "type":     "array",
+            "items": {
+                "type":     "record",
+                "name":     "FamilyChild",
+                "fields": [
+                    {"name": "name",            "type": "string"},
+                    {"name": "surname",         "type": "string"},
+                    {"name": "gender",          "type": "string"},
+                    {"name": "dob",             "type": "string"},
+                    {"name": "uniqueId",        "type": "string"},
+                    {"name": "father_idNumber", "type": "string"},
+                    {"name": "mother_idNumber", "type": "string"}
+                ]
+            }
+        }),
+        {"name": "address",     "type": ADDRESS_SCHEMA}
+    ]
+}
+
+
+class SchemaRegistry(ABC):
+
+    """Abstract base class for the schema registries"""
+
+    def __init__(self):
+        self._ids   = {}                                # (subject, canonical schema) -> id
+        self._lock  = threading.Lock()
+    #end __init__
+
+
+    @abstractmethod
+    def _register(self, subject: str, schema_str: str) -> int:
+
+        """Register a schema under a subject, returns its id, the same schema gets the same id again"""
+
+        pass
+    #end _register
+
+
+    def register(self, subject: str, schema: Dict[str, Any]) -> int:
+
+        """
+        Register a schema, answered from memory after the first call per subject/schema.
+
+        Returns:
+            Schema id, as carried in the message header
+        """
+
+        schema_str = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+
+        with self._lock:
+            if (subject, schema_str) not in self._ids:
+                self._ids[(subject, schema_str)] = self._register(subject, schema_str)
+            #end if
+
+            return self._ids[(subject, schema_str)]
+        #end with
+    #end register
+#end SchemaRegistry
+
+
+class HttpSchemaRegistry(SchemaRegistry):
+
+    """Confluent compatible schema registry, POST /subjects/<subject>/versions"""
+
+    def __init__(self, url: str, timeout: float = 10):
+
+        super().__init__()
+        self.url        = url.rstrip("/")
+        self.timeout    = timeout
+    #end __init__
+
+
+    def _register(self, subject: str, schema_str: str) -> int:
+
+        request = urllib.request.Request(
+            f"{self.url}/subjects/{subject}/versions",
+            data    = json.dumps({"schema": schema_str}).encode("utf-8"),
+            headers = {"Content-Type": "application/vnd.schemaregistry.v1+json"},
+            method  = "POST"
+        )
+
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return int(json.loads(response.read())["id"])
+        #end with
+    #end _register
+#end HttpSchemaRegistry
+
+
+class FileSchemaRegistry(SchemaRegistry):
+
+    """
+    Local stand-in for a schema registry, subjects, versions and ids kept in a JSON file.
+
+    The file is read and rewritten under an exclusive lock, so parallel worker processes agree on the ids.
+    """
+
+    def __init__(self, path: str):
+
+        super().__init__()
+        self.path = path
+    #end __init__
+
+
+    def _register(self, subject: str, schema_str: str) -> int:
+
+        import fcntl
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        with open(self.path + ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            registry = {"next_id": 1, "subjects": {}}
+            if os.path.exists(self.path):
+                with open(self.path) as registry_file:
+                    registry = json.load(registry_file)
+                #end with
+            #end if
+
+            versions = registry["subjects"].setdefault(subject, [])
+            for version in versions:
+                if version["schema"] == schema_str:
+                    return version["id"]
+                #end if
+            #end for
+
+            schema_id            = registry["next_id"]
+            registry["next_id"] += 1
+            versions.append({"version": len(versions) + 1, "id": schema_id, "schema": schema_str})
+
+            # Write aside and rename, a reader never sees half a file
+            with open(self.path + ".tmp", "w") as registry_file:
+                json.dump(registry, registry_file, indent=2)
+            #end with
+            os.replace(self.path + ".tmp", self.path)
+
+            return schema_id
+        #end with
+    #end _register
+#end FileSchemaRegistry
+
+
+def create_schema_registry(url: str) -> SchemaRegistry:
+
+    """
+    Factory for the schema registries.
+
+    Args:
+        url:    http(s)://host:port for a schema registry, file://path for the local JSON file stand-in
+
+    Returns:
+        SchemaRegistry instance
+    """
+
+    if url.startswith("file://"):
+        return FileSchemaRegistry(url[len("file://"):])
+
+    elif url.startswith(("http://", "https://")):
+        return HttpSchemaRegistry(url)
+
+    else:
+        raise ValueError(f"Unsupported schema registry url: {url}")
+
+    #end if
+#end create_schema_registry
+
+
+class AvroSerializer:
+
+    """Record -> Confluent wire format Avro bytes, for one schema/id. Safe to share between threads."""
+
+    def __init__(self, schema: Dict[str, Any], schema_id: int):
+
+        if fastavro is None:
+            raise ImportError("fastavro is required for Avro serialisation, pip install fastavro")
+        #end if
+
+        self.schema_id  = schema_id
+        self._schema    = fastavro.parse_schema(schema)
+        self._header    = struct.pack(">bI", 0, schema_id)
+    #end __init__
+
+
+    def __call__(self, record: Dict[str, Any]) -> bytes:
+
+        buffer = io.BytesIO()
+        buffer.write(self._header)
+        fastavro.schemaless_writer(buffer, self._schema, record)
+
+        return buffer.getvalue()
+    #end __call__
+#end AvroSerializer
@@ -14,6 +14,10 @@
 #                       https://towardsdatascience.com/fake-almost-everything-with-faker-a88429c500f1/
 #                       https://fakerjs.dev/guide/localization
 #
+#                   :   WORKERS > 1 runs the generation in parallel, (age bracket, date range) shards are handed to a
+#                       ProcessPoolExecutor, each worker owns its Faker instance and a disjoint slice of the ID
+#                       namespaces, see seed_namespace(). SEED makes a run repeatable.
+#
 #
 ########################################################################################################################
 __author__      = "Generic Data playground"
@@ -22,7 +26,10 @@ __version__     = "0.2"
 __copyright__   = "Copyright 2025, - George Leonard"
 
 
-import uuid, sys
+import uuid, sys, math, random, logging, multiprocessing, itertools
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from time import perf_counter
@@ -30,7 +37,7 @@ from faker import Faker
 
 # My Packages/Functions
 from utils import *
-from connections import DatabaseManager, DatabaseConnectionError, DatabaseOperationError
+from connections import DatabaseManager, DatabaseConnectionError, DatabaseOperationError, encode_documents
 from packager import *
 from weighted_random import *
 from option_lists import *
@@ -39,6 +46,9 @@ from faker_bankAccount import *
 from faker_address import *
 from faker_bank import *
 from faker_expdate import *
+from unique_index import create_unique_index
+from batch_writer import BatchWriter
+from json_codec import cache_records
 
 
 def getDataStoreConnection(config_params, mylogger):
@@ -48,7 +58,10 @@ def getDataStoreConnection(config_params, mylogger):
         2 - PostgreSQL
         3 - Redis
         4 - Kafka
-        5 - ... Future ...
+        5 - PostgreSQL, asyncpg based, several batches in flight
+        6 - Parquet/Arrow IPC files
+        7 - Compressed JSONL files
+        8 - ... Future ...
     """    
 
     persist_connection = None
@@ -61,6 +74,10 @@ def getDataStoreConnection(config_params, mylogger):
             persist_connection = DatabaseManager.create_connection('postgresql', config_params, mylogger)
             persist_connection.connect()
 
+        elif config_params["DEST"] == 5:  # PostgreSQL, async
+            persist_connection = DatabaseManager.create_connection('postgresql_async', config_params, mylogger)
+            persist_connection.connect()
+
         elif config_params["DEST"] == 3:  # Redis
             persist_connection = DatabaseManager.create_connection('redis',      config_params, mylogger)
             persist_connection.connect()
@@ -71,6 +88,14 @@ def getDataStoreConnection(config_params, mylogger):
             # The connect method for KafkaConnection now handles retries internally
             persist_connection.connect()
         
+        elif config_params["DEST"] == 6:  # Parquet/Arrow files
+            persist_connection = DatabaseManager.create_connection('parquet',    config_params, mylogger)
+            persist_connection.connect()
+        
+        elif config_params["DEST"] == 7:  # JSONL files
+            persist_connection = DatabaseManager.create_connection('jsonl',      config_params, mylogger)
+            persist_connection.connect()
+        
         else:
             raise ValueError(f"Invalid persistent store destination: {config_params['DEST']}")
 
@@ -88,558 +113,1028 @@ def getDataStoreConnection(config_params, mylogger):
 #end getDataStoreConnection
 
 
-def generate_population(config_params, mylogger):
+def build_faker(config_params, mylogger):
     
-    try:
-        mylogger.info("STARTING run, logfile => {logfile}".format(
-            logfile=config_params["LOGGINGFILE"]
-        ))
-        print("")
+    """
+    Faker instance with our custom providers and seed data loaded, one per process.
+    """
+    
+    # Faker and custom providers    
+    fake = Faker(config_params["LOCALE"])                   # en_IE used for demo
+    fake.add_provider(SAIdNumberProvider)                   # => Local South Africa
+    fake.add_provider(IrishPpsNumberProvider)               # => Local Ireland
+    fake.add_provider(IrishBankAccountProvider)             # => Irish Bank numbers based on IBAN number
+    fake.add_provider(DateMMYYProvider)                     # used by getAccount.createCCAccount()
 
-        # Our Global timer, for the entire generation 
-        step0starttime  = datetime.now()
-        step0start      = perf_counter()
+    # load seed data
+    seedfull_path    = config_params["DATASEEDFILE"]
+    geo_provider     = GeographicDataProvider(fake, file_path=seedfull_path, mylogger=mylogger)
+    fake.add_provider(geo_provider)
 
-        # This will record our getDataStoreConnection execution/creation time
-        step1starttime  = datetime.now()
-        step1start      = perf_counter()
+    # load banks based data
+    bankfull_path    = config_params["BANKSEEDFILE"]
+    bank_provider    = BankProvider(fake, file_path=bankfull_path, mylogger=mylogger)
+    fake.add_provider(bank_provider)
+    
+    return fake
+#end build_faker
 
-        persist_connection = getDataStoreConnection(config_params, mylogger)        
 
-        step1endtime    = datetime.now()
-        step1end        = perf_counter()
-        step1time       = round((step1end - step1start),2)        
-        
-        
-        # Faker and custom providers    
-        fake = Faker(config_params["LOCALE"])                   # en_IE used for demo
-        fake.add_provider(SAIdNumberProvider)                   # => Local South Africa
-        fake.add_provider(IrishPpsNumberProvider)               # => Local Ireland
-        fake.add_provider(IrishBankAccountProvider)             # => Irish Bank numbers based on IBAN number
-        fake.add_provider(DateMMYYProvider)                     # used by getAccount.createCCAccount()
+def seed_namespace(fake, seed, worker_id=0, workers=1):
+    
+    """
+    Seed a process's random sources and give it its own slice of the ID namespaces.
+    
+    Every worker shares the seed, so they walk the same PPS permutation and SA allocator permutations, but each
+    takes a disjoint part: PPS counters [worker_id * span, (worker_id + 1) * span), every workers-th shared SA
+    combination of each (date, gender band) key and one partition of the post codes, so the workers' own address
+    indexes never accept the same address. Same seed and worker count => same IDs per worker.
+    
+    In parallel runs generate_shard() then moves the PPS stream to the shard's own span, see shard_pps_spans().
+    
+    Returns:
+        np.random.Generator for the per day bulk draws
+    """
+    
+    span = PPS_DOMAIN // workers
+    
+    random.seed(f"{seed}:{worker_id}")                      # generate_birth_date(), pps_number() etc.
+    fake.seed_instance(f"{seed}:{worker_id}")
+    fake.configure_pps_stream(seed=seed, start=worker_id * span, stop=(worker_id + 1) * span)
+    fake.configure_sa_allocator(seed=seed, partition=worker_id, partitions=workers)
+    fake.configure_address_partition(partition=worker_id, partitions=workers)
+
+    return np.random.default_rng([seed, worker_id])
+#end seed_namespace
+
+
+def select_dates(age_bracket, config_params, todayDate):
+    
+    """
+    Pick the dates of birth we generate households for within an age bracket, one per batch_size people,
+    uniformly spaced with a bit of jitter.
+    
+    Returns:
+        (start_age, end_age, people_count, selected_dates)
+    """
+    
+    start_age           = age_bracket["name"]                           # e.g., 20
+    end_age             = start_age + config_params["BLOCKSIZE"]        # e.g., 20 + 10 = 30
+    people_count        = age_bracket["count"]                          # e.g., total number of ppl to create for age_bracket (including kids)
+    
+    # Calculate the number of dates to pick
+    number_of_dates     = int(people_count / config_params["BATCHSIZE"])
 
-        # load seed data
-        seedfull_path    = config_params["DATASEEDFILE"]
-        geo_provider     = GeographicDataProvider(fake, file_path=seedfull_path, mylogger=mylogger)
-        fake.add_provider(geo_provider)
+    # Calculate the date range for the entire block
+    start_date_range    = todayDate - relativedelta(years=end_age)
+    end_date_range      = todayDate - relativedelta(years=start_age)
+    total_days_in_block = (end_date_range - start_date_range).days
 
-        # load banks based data
-        bankfull_path    = config_params["BANKSEEDFILE"]
-        bank_provider    = BankProvider(fake, file_path=bankfull_path, mylogger=mylogger)
-        fake.add_provider(bank_provider)
+    # Calculate the uniform interval
+    interval            = total_days_in_block / number_of_dates
 
-        ageBlockSize     = config_params["BLOCKSIZE"]           # 10 yrs, this needs to align with age_distribution => option_list.py
-        batch_size       = config_params["BATCHSIZE"]           # i.e.: 100 minimum per batch
+    selected_dates      = []
+    current_date        = start_date_range        
+    
+    # build/pick our selected dates 
+    for _ in range(number_of_dates):
+        jitter          = random.randint(-5, 5) 
+        current_date   += timedelta(days=interval + jitter)
+        selected_dates.append(current_date)
 
-        cntTotalAdults   = 0
-        cntTotalChildren = 0
-        cntTotalFamilies = 0
-        cntTotal         = 0
+    #end for
+    
+    return start_age, end_age, people_count, selected_dates
+#end select_dates
 
-        todayDate        = datetime.now()
-            
-        province_options, total_province_population = fake.get_provinces()
+
+def address_capacity(config_params):
     
-        # Kids                                                            
-        ageGap           = config_params["AGE_GAP"]
-        variation        = config_params["VARIATION"]/config_params["VARIATION_PERC"]        # VARIATIONPERC implies %
-            
-        # Generate people for each age bracket
-        for age_bracket in age_distribution:                    # age_distribution comes from option_list.py
-             
-            # Our per Age bracket execution timer
-            step2starttime      = datetime.now()
-            step2start          = perf_counter()
-
-            start_age           = age_bracket["name"]           # e.g., 20
-            end_age             = start_age + ageBlockSize      # e.g., 20 + 10 = 30
-            people_count        = age_bracket["count"]          # e.g., total number of ppl to create for age_bracket (including kids)
+    """
+    Addresses a run can need, one per household so at most one per person, every age bracket stops at AGECAP plus
+    the day that crosses it. Sizes the address index, capped at ADDRESS_CAPACITY.
+    """
+    
+    expected = sum(min(age_bracket["count"], config_params["AGECAP"] + config_params["BATCHSIZE"]) for age_bracket in age_distribution)
+    
+    return max(1, min(config_params["ADDRESS_CAPACITY"], expected))
+#end address_capacity
+
+
+def persist_batch(persist_connection, config_params, mylogger, batch):
+
+    """
+    Flush one day's batch to the persistent store, runs on the BatchWriter thread(s).
+    
+    Returns:
+        The insert results, the asynchronous sinks return Futures the writer waits on before the day counts as
+        flushed, see flushed_batch()
+    
+    Raises:
+        DatabaseOperationError: The writer logs it, counts the day as failed and carries on
+    """
+    
+    arAdults        = batch["adults"]
+    arChildren      = batch["children"]
+    arFamilies      = batch["families"]
+    results         = []
+
+    if config_params["DEST"] == 1:     # Post to MongoDB, with MONGO_STREAMS > 0 returns once the inserts are queued
+        if len(arAdults) > 0:
+            results.append(persist_connection.insert(arAdults, store_name=config_params["ADULTS_STORE"]))
+        
+        #end if 
+        if len(arChildren) > 0:
+            results.append(persist_connection.insert(arChildren, store_name=config_params["CHILDREN_STORE"]))
+        
+        #end if 
+        if len(arFamilies) > 0:
+            results.append(persist_connection.insert(arFamilies, store_name=config_params["FAMILY_STORE"]))
+
+        #end if 
+    elif config_params["DEST"] in (2, 5):   # Post to PostgreSQL, DEST 5 returns once the load is scheduled
+        if len(arAdults) > 0:
+            results.append(persist_connection.insert(arAdults, store_name=config_params["ADULTS_STORE"], extract_unique_id=True))
+        
+        #end if 
+        if len(arChildren) > 0:
+            results.append(persist_connection.insert(arChildren, store_name=config_params["CHILDREN_STORE"], extract_unique_id=True))
+        
+        #end if 
+        if len(arFamilies) > 0:
+            results.append(persist_connection.insert(arFamilies, store_name=config_params["FAMILY_STORE"], extract_unique_id=False))
             
-            cntAdultsBlock      = 0
-            cntChildrenBlock    = 0
-            cntFamiliesBlock    = 0
-            cntTotalBlock       = 0
+        #end if 
             
-            # Calculate the number of dates to pick
-            number_of_dates     = int(people_count / batch_size)
+    elif config_params["DEST"] == 3:   # Post to Redis
+        if len(arAdults) > 0:
+            results.append(persist_connection.insert(arAdults, store_name=config_params["ADULTS_STORE"], key_field="uniqueId"))        # PPS/IDNumber/SSN
+        
+        #end if 
+        if len(arChildren) > 0:
+            results.append(persist_connection.insert(arChildren, store_name=config_params["CHILDREN_STORE"], key_field="uniqueId"))    # PPS/IDNumber/SSN
+        
+        #end if 
+        if len(arFamilies) > 0:
+            results.append(persist_connection.insert(arFamilies, store_name=config_params["FAMILY_STORE"], key_field="_id"))           # UUID used to Id the family
 
-            # Calculate the date range for the entire block
-            start_date_range    = todayDate - relativedelta(years=end_age)
-            end_date_range      = todayDate - relativedelta(years=start_age)
-            total_days_in_block = (end_date_range - start_date_range).days
+        #end if 
+    elif config_params["DEST"] == 4:   # Post to Kafka
+        if len(arAdults) > 0:
+            results.append(persist_connection.insert(arAdults, store_name=config_params["ADULTS_STORE"], key="uniqueId"))              # ?
+        
+        #end if 
+        if len(arChildren) > 0:
+            results.append(persist_connection.insert(arChildren, store_name=config_params["CHILDREN_STORE"], key="uniqueId"))          # ?
+        
+        #end if 
+        if len(arFamilies) > 0:
+            results.append(persist_connection.insert(arFamilies, store_name=config_params["FAMILY_STORE"], key="_id"))                 # ?
 
-            # Calculate the uniform interval
-            interval            = total_days_in_block / number_of_dates
+        #end if                     
+    elif config_params["DEST"] in (6, 7):   # Write to Parquet/Arrow (buffered into row groups) or JSONL files
+        if len(arAdults) > 0:
+            results.append(persist_connection.insert(arAdults, store_name=config_params["ADULTS_STORE"]))
+        
+        #end if 
+        if len(arChildren) > 0:
+            results.append(persist_connection.insert(arChildren, store_name=config_params["CHILDREN_STORE"]))
+        
+        #end if 
+        if len(arFamilies) > 0:
+            results.append(persist_connection.insert(arFamilies, store_name=config_params["FAMILY_STORE"]))
 
-            selected_dates      = []
-            current_date        = start_date_range        
-            
-            # build/pick our selected dates 
-            for _ in range(number_of_dates):
-                jitter          = random.randint(-5, 5) 
-                current_date   += timedelta(days=interval + jitter)
-                selected_dates.append(current_date)
+        #end if 
+    #end if           
+
+    return results
+#end persist_batch
+
+
+def flushed_batch(mylogger, persisted, batch):
     
-            #end for
-                    
-            print("")
-            mylogger.info("Creating {people_count} people for age bracket {start_age}-{end_age} across {number_of_dates} dates in batches of {batch_size}".format(
-                people_count    = people_count,
-                start_age       = start_age,
-                end_age         = end_age,
-                number_of_dates = number_of_dates,
-                batch_size      = batch_size
-            ))
+    """
+    BatchWriter on_flushed callback, logs a day once it has been persisted and adds it to persisted, the
+    {"adults", "children", "families", "total"} counters the run reports.
+    """
+    
+    dob             = batch["day"]
+    step3starttime  = batch["starttime"]
+    step3start      = batch["start"]
+    
+    cntAdultsDay    = len(batch["adults"])
+    cntChildrenDay  = len(batch["children"])
+    cntFamiliesDay  = len(batch["families"])
+    cntDay          = cntAdultsDay + cntChildrenDay
+
+    step3endtime    = datetime.now()
+    step3end        = perf_counter()
+    step3time       = round((step3end - step3start),2)
+        
+    mylogger.info("Record Flushed - St:{start} Et:{end} Rt:{runtime} for {day}: Adults {cntAdultsDay}, Children {cntChildrenDay}, Families {cntFamiliesDay}, Total {cntDay}".format(
+        start           = str(step3starttime.strftime("%Y-%m-%d %H:%M:%S")),
+        end             = str(step3endtime.strftime("%Y-%m-%d %H:%M:%S")),
+        runtime         = str(step3time),
+        day             = dob,
+        cntAdultsDay    = cntAdultsDay,                    
+        cntChildrenDay  = cntChildrenDay,
+        cntFamiliesDay  = cntFamiliesDay,
+        cntDay          = cntDay
+    ))
+    
+    persisted["adults"]   += cntAdultsDay
+    persisted["children"] += cntChildrenDay
+    persisted["families"] += cntFamiliesDay
+    persisted["total"]    += cntDay
+#end flushed_batch
+
+
+def create_writer(persist_connection, config_params, mylogger, persisted):
+    
+    """
+    BatchWriter in front of persist_batch() for this connection, WRITERS threads (0 => flush inline) and up to
+    WRITE_QUEUE day batches waiting before generation blocks. Persisted days are added to persisted, see
+    flushed_batch().
+    """
+    
+    return BatchWriter(partial(persist_batch, persist_connection, config_params, mylogger), 
+                       mylogger, 
+                       writers    = config_params["WRITERS"], 
+                       queue_size = config_params["WRITE_QUEUE"],
+                       on_flushed = partial(flushed_batch, mylogger, persisted))
+#end create_writer
+
+
+def generate_day(fake, config_params, dob_date, rng, address_index, writer, mylogger, limit=None):
+
+    """
+    Generate the households for one pre-selected date of birth and submit them to the writer for flushing.
+    
+    Shared by the serial loop in generate_population() and the parallel shards, see generate_shard(). A date is
+    only ever generated by one shard, so its male SA IDs come from the date owner's share of the allocator.
+    
+    limit, when given, stops the day at the first household that would start at or past limit people, i.e. what
+    is left of the Age Cap.
+    
+    Returns:
+        (cntAdultsDay, cntChildrenDay, cntFamiliesDay, cntDay) generated
+    """
+    
+    batch_size = config_params["BATCHSIZE"]
+    ageGap     = config_params["AGE_GAP"]
+    variation  = config_params["VARIATION"]/config_params["VARIATION_PERC"]        # VARIATIONPERC implies %
+
+    # Per day execution timer
+    step3starttime  = datetime.now()
+    step3start      = perf_counter()
+    
+    cntAdultsDay    = 0
+    cntChildrenDay  = 0
+    cntFamiliesDay  = 0
+    cntDay          = 0          
+    
+    n               = 0
+    idx_index       = 0
+                
+    arAdults        = []
+    arChildren      = [] 
+    arFamilies      = []
+    
+    dob             = dob_date.strftime('%y/%m/%d')
+
+    # Every household adds at least 1 person, so batch_size draws always covers the day
+    hh_index        = 0
+    maritalDraws    = marital_selector.sample(batch_size,     rng, names=True)
+    childrenYnDraws = children_yn_selector.sample(batch_size, rng, names=True)
+    kidsDraws       = kids_selector.sample(batch_size,        rng, names=True)
+    genderDraws     = gender_selector.sample(batch_size,      rng, names=True)
+    locationDraws   = fake.get_locations(batch_size, rng)
+
+    # Household sizes follow from the draws above, so we know up front how many households, and thus
+    # addresses, the loop below will consume
+    hhSizes         = np.where(maritalDraws == "Single", 1, 2 + np.where(childrenYnDraws == 1, kidsDraws, 0)).astype(np.int64)
+    hhStarts        = np.cumsum(hhSizes) - hhSizes
+    hhLimit         = min(batch_size, limit) if limit is not None else batch_size
+    hhCount         = int(np.count_nonzero((hhStarts < hhLimit) & (hhStarts <= config_params["DAYCAP"])))
+    iDNumbers       = generate_IdNumbers(fake, config_params,  dob, "male", hhCount, owned=True)     # One male Id per household
+    dayAddresses    = fake.generate_addresses(hhCount, 
+                                              locationDraws[:hhCount], 
+                                              country      = config_params["COUNTRY"], 
+                                              rng          = rng, 
+                                              unique_index = address_index)
+
+    # Inner loop: create the batch of people for this single, pre-selected date
+    while n < hhLimit:
+        
+        if n > config_params["DAYCAP"]:
+            break
+        
+        # if n > config_params["RECCAP"]:
+        #     break
+        
+        # Get a batch of ID Numbers
+        maleId      = iDNumbers[idx_index]      
+        idx_index  += 1
+        arKids      = []
+           
+        # Province/County/Town - drawn together from the precompiled city level table
+        province_selected, county_selected, city_selected = locationDraws[hh_index]
+
+        address = dayAddresses[hh_index]
                     
-            # Loop over the pre-selected dates instead of every single day
-            for dob_date in selected_dates:
+        marital_status  = maritalDraws[hh_index]
+            
+        # Calculate/Keep track of people this iteration has created
+        if marital_status == "Single":
+            n += 1                  # Single adult
+            
+        else:                    
+            n += 2                  # husband + wife
+            # Check for children
+            if childrenYnDraws[hh_index] == 1:
+                kids_result = kidsDraws[hh_index]
+
+            else: 
+                kids_result = 0
                 
-                if cntTotalBlock > config_params["AGECAP"]:             # Block = Age Cap
-                    break
+            #end if 
+            n += kids_result
+        #end if - Married or ... => marital_status
+
+
+        # Single Adult
+        if marital_status == "Single":
+            
+            cntAdultsDay += 1
+            cntDay       += 1
+            
+            surname       = fake.last_name()
+            
+            if genderDraws[hh_index] == "Male":           # Male Adult
+                firstName           = fake.first_name_male()
+                adultDOB            = dob
+                adultId             = maleId
+                adultGender         = "M"
+
+            else:                                                                           # Female Adult
+                firstName           = fake.first_name_female()
+                adultDOB            = generate_birth_date(dob, 4, 4)            
+                adultId             = generate_IdNumbers(fake, config_params, adultDOB, "Female", 1)[0]
+                adultGender         = "F"
                 
-                # Per day execution timer
-                step3starttime  = datetime.now()
-                step3start      = perf_counter()
+            #end if
+
+            single_adult = {
+                "_id":              str(uuid.uuid4()),
+                "surname":          surname,
+                "name":             firstName,
+                "uniqueId":         adultId,
+                "marital_status":   "Single",
+                "status":           "Living",
+                "dob":              adultDOB,
+                "gender":           adultGender,
+                "address":          address,
+                "account":          createBankAccount(fake, firstName[0], surname)
+            }
+
+            arAdults.append(single_adult)
                 
-                cntAdultsDay    = 0
-                cntChildrenDay  = 0
-                cntFamiliesDay  = 0
-                cntDay          = 0          
+        else:    # Family Logic, so either Married, Divorced, Seperated or Widowed with or without Children
+            
+            # Generate a unique ID for the family at the beginning of the loop
+            family_unique_id = str(uuid.uuid4())
+            
+            cntAdultsDay   += 2         # Husband and Wife
+            cntDay         += 2         # Total count for the day, mildy simalar to variable n
+
+            surname    = fake.last_name()
+            femaleDOB  = generate_birth_date(dob, 4, 4)            
+            femaleId   = generate_IdNumbers(fake, config_params, femaleDOB, "Female", 1)[0]
+            
+            motherCustody_status  = motherCustody_selector.get_random()
+            
+            childPackage = {
+                "surname":      surname,
+                "femaleDOB":    femaleDOB,
+                "femaleId":     femaleId,
+                "maleId":       maleId,
+                "ageGap":       ageGap,
+                "variation":    variation, 
+                "address":      address,
+                "family_id":    family_unique_id
+            }
+            
+            if kids_result > 0:
+                for i in range(kids_result):
+
+                    cntChildrenDay += 1
+                    cntDay         += 1
+
+                    child_a, child_b = packageChild(fake, config_params, childPackage)
+
+                    arKids.append(child_a)                  # We split "child" record into 2 copies, one without address as it's being added to family that has a address 
+                    arChildren.append(child_b)              # and one with a address as per family which is inserted into it's own children collection/table.
+                                
+            #end if
+            
+                                
+            # Widowed - No Children - Adults     
+            if marital_status == "Widowed":
                 
-                n               = 0
-                idx_index       = 0
-                            
-                arAdults        = []
-                arChildren      = [] 
-                arFamilies      = []
+                male_livingstatus_status    = livingstatus_yn_selector.get_random()
+                female_livingstatus_status  = livingstatus_yn_selector.get_random() 
                 
-                dob             = dob_date.strftime('%y/%m/%d')
-                iDNumbers       = generate_IdNumbers(fake, config_params,  dob, "male", batch_size)      
+                # Just in case we some how get both as Deceased, let miraculously resurect ;) the Male
+                if male_livingstatus_status == "Deceased" and female_livingstatus_status == "Deceased":
+                    female_livingstatus_status = "Deceased"
+                    male_livingstatus_status   = "Living"
 
-                # Inner loop: create the batch of people for this single, pre-selected date
-                while n < batch_size:
-                    
-                    if n > config_params["DAYCAP"]:
-                        break
-                    
-                    # if n > config_params["RECCAP"]:
-                    #     break
+                elif male_livingstatus_status == "Living" and female_livingstatus_status == "Living":
+                    female_livingstatus_status = "Living"
+                    male_livingstatus_status   = "Deceased"
                     
-                    # Get a batch of ID Numbers
-                    maleId      = iDNumbers[idx_index]      
-                    idx_index  += 1
-                    arKids      = []
-                       
-                    # Provincees - For every loop lets pick a new random province
-                    province_selected = WeightedRandomSelector(province_options, scale=total_province_population).get_random()
-                                        
-                    # Counties - For every loop lets pick a new random County
-                    county_options, total_county_population = fake.get_counties(province_selected)
-                    
-                    if county_options is None:
-                        mylogger.warning("No counties found for province {province_selected}, using default".format(
-                            province_selected = province_selected
-                        ))
-                        
-                        county_selected = "Unknown County"
-                        city_selected   = "Unknown City"
-                        
-                    else:
-                        county_selected = WeightedRandomSelector(county_options, scale=total_county_population).get_random()
-
-                        # Towns/Cities - For every loop lets pick a new random Town/City
-                        city_options, total_city_population = fake.get_cities_towns(province_selected, county_selected)
-                        if city_options is None:
-                            mylogger.warning("No cities found for {county_selected}, {province_selected}, using county name".format(
-                                county_selected   = county_selected,
-                                province_selected = province_selected
-                            ))
-                            city_selected = county_selected
+                familyPackage = {
+                    "m_surname":                    surname,
+                    "f_surname":                    surname,
+                    "m_address":                    address,
+                    "f_address":                    address,
+                    "maleId":                       maleId,
+                    "maleDOB":                      dob,
+                    "femaleId":                     femaleId,
+                    "femaleDOB":                    femaleDOB,
+                    "marital_status":               marital_status,
+                    "male_livingstatus_status":     male_livingstatus_status,
+                    "female_livingstatus_status":   female_livingstatus_status,
+                    "family_id":                    family_unique_id
+                }   
+                                                        
+                family_male_a, \
+                family_female_a, \
+                family_male_b, \
+                family_female_b = \
+                    packageAdults(fake, familyPackage, mylogger)
+
+                
+                if kids_result > 0:
+                    family = {
+                        "_id":      family_unique_id,  # Use the generated UUID
+                        "husband":  family_male_a,
+                        "wife":     family_female_a,
+                        "address":  address,
+                        "children": arKids
+                    }
+                else:
+                    family = {
+                        "_id":      family_unique_id,  # Use the generated UUID
+                        "husband":  family_male_a,
+                        "wife":     family_female_a,
+                        "address":  address    
+                    }
+                #end if
+                arAdults.append(family_male_b)
+                arAdults.append(family_female_b)
+                arFamilies.append(family)
+                cntFamiliesDay += 1                    
+            #end if
                         
-                        else:
-                            city_selected = WeightedRandomSelector(city_options, scale=total_city_population).get_random()
-                        #end if
-                    #end if
+            male_livingstatus_status   = "Living"
+            female_livingstatus_status = "Living"
+        
+            if marital_status == "Seperated" or marital_status == "Divorced":
                     
+                femSurname = fake.last_name()
+        
+                femAddress = fake.generate_address(
+                    town           = city_selected, 
+                    county         = county_selected, 
+                    province_state = province_selected, 
+                    country        = config_params["COUNTRY"]
+                )
+                
+                familyPackage = {
+                    "m_surname":                    surname,
+                    "f_surname":                    femSurname,
+                    "m_address":                    address,
+                    "f_address":                    femAddress,
+                    "maleId":                       maleId,
+                    "maleDOB":                      dob,
+                    "femaleId":                     femaleId,
+                    "femaleDOB":                    femaleDOB,
+                    "marital_status":               marital_status,
+                    "male_livingstatus_status":     male_livingstatus_status,
+                    "female_livingstatus_status":   female_livingstatus_status,
+                    "family_id":                    family_unique_id
+                }   
 
-                    address = fake.unique.generate_address(
-                        town            = city_selected, 
-                        county          = county_selected, 
-                        province_state  = province_selected, 
-                        country         = config_params["COUNTRY"]
-                    )
-                                
-                    marital_status  = WeightedRandomSelector(marital_options, scale=1.0).get_random()
-                        
-                    # Calculate/Keep track of people this iteration has created
-                    if marital_status == "Single":
-                        n += 1                  # Single adult
-                        
-                    else:                    
-                        n += 2                  # husband + wife
-                        # Check for children
-                        if WeightedRandomSelector(children_yn_options, scale=1.0).get_random() == 1:
-                            kids_result = WeightedRandomSelector(kids_options, scale=1.0).get_random()
-
-                        else: 
-                            kids_result = 0
-                            
-                        #end if 
-                        n += kids_result
-                    #end if - Married or ... => marital_status
-
-
-                    # Single Adult
-                    if marital_status == "Single":
-                        
-                        cntAdultsDay += 1
-                        cntDay       += 1
-                        
-                        surname       = fake.last_name()
-                        
-                        if WeightedRandomSelector(gender_options, scale=1.0).get_random() == "Male":    # Male Adult
-                            firstName           = fake.first_name_male()
-                            adultDOB            = dob
-                            adultId             = maleId
-                            adultGender         = "M"
-
-                        else:                                                                           # Female Adult
-                            firstName           = fake.first_name_female()
-                            adultDOB            = generate_birth_date(dob, 4, 4)            
-                            adultId             = generate_IdNumbers(fake, config_params, adultDOB, "Female", 1)[0]
-                            adultGender         = "F"
-                            
-                        #end if
-
-                        single_adult = {
-                            "_id":              str(uuid.uuid4()),
-                            "surname":          surname,
-                            "name":             firstName,
-                            "uniqueId":         adultId,
-                            "marital_status":   "Single",
-                            "status":           "Living",
-                            "dob":              adultDOB,
-                            "gender":           adultGender,
-                            "address":          address,
-                            "account":          createBankAccount(fake, firstName[0], surname)
+                family_male_a, \
+                family_female_a, \
+                family_male_b, \
+                family_female_b = \
+                    packageAdults(fake, familyPackage, mylogger)
+
+                if kids_result > 0:
+                    if motherCustody_status == 1:
+                        family = {
+                            "_id":      family_unique_id,  # Use the generated UUID
+                            "wife":     family_female_a,
+                            "address":  femAddress,
+                            "children": arKids
                         }
+                    else:
+                        family = {
+                            "_id":      family_unique_id,  # Use the generated UUID
+                            "husband":  family_male_a,
+                            "address":  address,
+                            "children": arKids
+                        }
+                    #end if   
+                    arFamilies.append(family) 
+                    cntFamiliesDay += 1                    
+                #end if                  
+                arAdults.append(family_male_b)
+                arAdults.append(family_female_b)
+                                            
+            elif marital_status == "Married":
 
-                        arAdults.append(single_adult)
-                            
-                    else:    # Family Logic, so either Married, Divorced, Seperated or Widowed with or without Children
-                        
-                        # Generate a unique ID for the family at the beginning of the loop
-                        family_unique_id = str(uuid.uuid4())
-                        
-                        cntAdultsDay   += 2         # Husband and Wife
-                        cntDay         += 2         # Total count for the day, mildy simalar to variable n
+                familyPackage = {
+                    "m_surname":                    surname,
+                    "f_surname":                    surname,
+                    "m_address":                    address,
+                    "f_address":                    address,
+                    "maleId":                       maleId,
+                    "maleDOB":                      dob,
+                    "femaleId":                     femaleId,
+                    "femaleDOB":                    femaleDOB,
+                    "marital_status":               marital_status,
+                    "male_livingstatus_status":     male_livingstatus_status,
+                    "female_livingstatus_status":   female_livingstatus_status,
+                    "family_id":                    family_unique_id
+                }
 
-                        surname    = fake.last_name()
-                        femaleDOB  = generate_birth_date(dob, 4, 4)            
-                        femaleId   = generate_IdNumbers(fake, config_params, femaleDOB, "Female", 1)[0]
-                        
-                        motherCustody_status  = WeightedRandomSelector(motherCustody_options, scale=1.0).get_random()
-                        
-                        childPackage = {
-                            "surname":      surname,
-                            "femaleDOB":    femaleDOB,
-                            "femaleId":     femaleId,
-                            "maleId":       maleId,
-                            "ageGap":       ageGap,
-                            "variation":    variation, 
-                            "address":      address,
-                            "family_id":    family_unique_id
-                        }
-                        
-                        if kids_result > 0:
-                            for i in range(kids_result):
+                family_male_a, \
+                family_female_a, \
+                family_male_b, \
+                family_female_b = \
+                    packageAdults(fake, familyPackage, mylogger)
+                                    
+                if kids_result > 0:                                                            
+                    family = {
+                        "_id":      family_unique_id,  # Use the generated UUID
+                        "husband":  family_male_a,
+                        "wife":     family_female_a,
+                        "address":  address,
+                        "children": arKids
+                    }
+                else:
+                    family = {
+                        "_id":      family_unique_id,  # Use the generated UUID
+                        "husband":  family_male_a,
+                        "wife":     family_female_a,
+                        "address":  address
+                        }                                            
+                #end if
 
-                                cntChildrenDay += 1
-                                cntDay         += 1
+                arAdults.append(family_male_b)
+                arAdults.append(family_female_b)
+                arFamilies.append(family) 
+                cntFamiliesDay += 1                    
 
-                                child_a, child_b = packageChild(fake, config_params, childPackage)
+            #end if Married                                       
+        #end if
+        
+        hh_index += 1
+    #end for
+    
+    
+    # MongoDB, encode here, in the generating process, rather than on the writer
+    if config_params["DEST"] == 1 and config_params.get("MONGO_RAW_BSON", 0):
+        arAdults   = encode_documents(arAdults)
+        arChildren = encode_documents(arChildren)
+        arFamilies = encode_documents(arFamilies)
+    
+    # JSON stores, encode once here as well, the stores reuse the bytes, see json_codec.CachedRecord
+    elif config_params["DEST"] in (2, 3, 4, 5, 7) and config_params.get("JSON_PRECODE", 0) and config_params.get("KAFKA_FORMAT", "json") == "json":
+        arAdults   = cache_records(arAdults)
+        arChildren = cache_records(arChildren)
+        arFamilies = cache_records(arFamilies)
+    
+    #end if
+    # Hand the day to the writer(s), see BatchWriter, this blocks only when the writers are behind
+    writer.submit({
+        "day":          dob,
+        "adults":       arAdults,
+        "children":     arChildren,
+        "families":     arFamilies,
+        "starttime":    step3starttime,
+        "start":        step3start
+    })
 
-                                arKids.append(child_a)                  # We split "child" record into 2 copies, one without address as it's being added to family that has a address 
-                                arChildren.append(child_b)              # and one with a address as per family which is inserted into it's own children collection/table.
-                                            
-                        #end if
-                        
-                                            
-                        # Widowed - No Children - Adults     
-                        if marital_status == "Widowed":
-                            
-                            male_livingstatus_status    = WeightedRandomSelector(livingstatus_yn_options, scale=1.0).get_random()
-                            female_livingstatus_status  = WeightedRandomSelector(livingstatus_yn_options, scale=1.0).get_random() 
-                            
-                            # Just in case we some how get both as Deceased, let miraculously resurect ;) the Male
-                            if male_livingstatus_status == "Deceased" and female_livingstatus_status == "Deceased":
-                                female_livingstatus_status = "Deceased"
-                                male_livingstatus_status   = "Living"
-
-                            elif male_livingstatus_status == "Living" and female_livingstatus_status == "Living":
-                                female_livingstatus_status = "Living"
-                                male_livingstatus_status   = "Deceased"
-                                
-                            familyPackage = {
-                                "m_surname":                    surname,
-                                "f_surname":                    surname,
-                                "m_address":                    address,
-                                "f_address":                    address,
-                                "maleId":                       maleId,
-                                "maleDOB":                      dob,
-                                "femaleId":                     femaleId,
-                                "femaleDOB":                    femaleDOB,
-                                "marital_status":               marital_status,
-                                "male_livingstatus_status":     male_livingstatus_status,
-                                "female_livingstatus_status":   female_livingstatus_status,
-                                "family_id":                    family_unique_id
-                            }   
-                                                                    
-                            family_male_a, \
-                            family_female_a, \
-                            family_male_b, \
-                            family_female_b = \
-                                packageAdults(fake, familyPackage, mylogger)
-
-                            
-                            if kids_result > 0:
-                                family = {
-                                    "_id":      family_unique_id,  # Use the generated UUID
-                                    "husband":  family_male_a,
-                                    "wife":     family_female_a,
-                                    "address":  address,
-                                    "children": arKids
-                                }
-                            else:
-                                family = {
-                                    "_id":      family_unique_id,  # Use the generated UUID
-                                    "husband":  family_male_a,
-                                    "wife":     family_female_a,
-                                    "address":  address    
-                                }
-                            #end if
-                            arAdults.append(family_male_b)
-                            arAdults.append(family_female_b)
-                            arFamilies.append(family)
-                            cntFamiliesDay += 1                    
-                        #end if
-                                    
-                        male_livingstatus_status   = "Living"
-                        female_livingstatus_status = "Living"
-                    
-                        if marital_status == "Seperated" or marital_status == "Divorced":
-                                
-                            femSurname = fake.last_name()
-                    
-                            femAddress = fake.generate_address(
-                                town           = city_selected, 
-                                county         = county_selected, 
-                                province_state = province_selected, 
-                                country        = config_params["COUNTRY"]
-                            )
-                            
-                            familyPackage = {
-                                "m_surname":                    surname,
-                                "f_surname":                    femSurname,
-                                "m_address":                    address,
-                                "f_address":                    femAddress,
-                                "maleId":                       maleId,
-                                "maleDOB":                      dob,
-                                "femaleId":                     femaleId,
-                                "femaleDOB":                    femaleDOB,
-                                "marital_status":               marital_status,
-                                "male_livingstatus_status":     male_livingstatus_status,
-                                "female_livingstatus_status":   female_livingstatus_status,
-                                "family_id":                    family_unique_id
-                            }   
-
-                            family_male_a, \
-                            family_female_a, \
-                            family_male_b, \
-                            family_female_b = \
-                                packageAdults(fake, familyPackage, mylogger)
-
-                            if kids_result > 0:
-                                if motherCustody_status == 1:
-                                    family = {
-                                        "_id":      family_unique_id,  # Use the generated UUID
-                                        "wife":     family_female_a,
-                                        "address":  femAddress,
-                                        "children": arKids
-                                    }
-                                else:
-                                    family = {
-                                        "_id":      family_unique_id,  # Use the generated UUID
-                                        "husband":  family_male_a,
-                                        "address":  address,
-                                        "children": arKids
-                                    }
-                                #end if   
-                                arFamilies.append(family) 
-                                cntFamiliesDay += 1                    
-                            #end if                  
-                            arAdults.append(family_male_b)
-                            arAdults.append(family_female_b)
-                                                        
-                        elif marital_status == "Married":
-
-                            familyPackage = {
-                                "m_surname":                    surname,
-                                "f_surname":                    surname,
-                                "m_address":                    address,
-                                "f_address":                    address,
-                                "maleId":                       maleId,
-                                "maleDOB":                      dob,
-                                "femaleId":                     femaleId,
-                                "femaleDOB":                    femaleDOB,
-                                "marital_status":               marital_status,
-                                "male_livingstatus_status":     male_livingstatus_status,
-                                "female_livingstatus_status":   female_livingstatus_status,
-                                "family_id":                    family_unique_id
-                            }
-
-                            family_male_a, \
-                            family_female_a, \
-                            family_male_b, \
-                            family_female_b = \
-                                packageAdults(fake, familyPackage, mylogger)
-                                                
-                            if kids_result > 0:                                                            
-                                family = {
-                                    "_id":      family_unique_id,  # Use the generated UUID
-                                    "husband":  family_male_a,
-                                    "wife":     family_female_a,
-                                    "address":  address,
-                                    "children": arKids
-                                }
-                            else:
-                                family = {
-                                    "_id":      family_unique_id,  # Use the generated UUID
-                                    "husband":  family_male_a,
-                                    "wife":     family_female_a,
-                                    "address":  address
-                                    }                                            
-                            #end if
-        
-                            arAdults.append(family_male_b)
-                            arAdults.append(family_female_b)
-                            arFamilies.append(family) 
-                            cntFamiliesDay += 1                    
-
-                        #end if Married                                       
-                    #end if
+    return cntAdultsDay, cntChildrenDay, cntFamiliesDay, cntDay
+#end generate_day
+
+
+# Per worker process state, set up once by init_worker() and reused by every shard the worker runs
+_worker = {}
+
+
+def init_worker(config_params, seed, worker_counter):
+    
+    """
+    ProcessPoolExecutor initializer, each worker process builds its own Faker instance, seed data and address
+    index, and claims a worker id which selects its slice of the ID namespaces, see seed_namespace().
+    """
+    
+    with worker_counter.get_lock():
+        worker_id             = worker_counter.value
+        worker_counter.value += 1
+    #end with
+    
+    # Forked workers inherit the parent's handlers, spawned ones need their own
+    worker_logger = logging.getLogger(mylogger.__module__)
+    if not worker_logger.handlers:
+        worker_logger = mylogger(config_params["LOGGINGFILE"] + "_common.log", 
+                                 config_params["CONSOLE_DEBUGLEVEL"], 
+                                 config_params["FILE_DEBUGLEVEL"])
+    #end if
+    
+    fake = build_faker(config_params, worker_logger)
+    
+    _worker["id"]            = worker_id
+    _worker["seed"]          = seed
+    _worker["logger"]        = worker_logger
+    _worker["fake"]          = fake
+    _worker["rng"]           = seed_namespace(fake, seed, worker_id, config_params["WORKERS"])
+    _worker["address_index"] = create_unique_index(config_params["ADDRESS_UNIQUE"], 
+                                                   capacity   = max(1, address_capacity(config_params) // config_params["WORKERS"]), 
+                                                   error_rate = config_params["ADDRESS_ERROR_RATE"])
+#end init_worker
+
+
+def generate_shard(config_params, shard):
+    
+    """
+    Generate one (age bracket, date range) shard inside a worker process.
+    
+    Each shard opens and closes its own persistent store connection, connections can't be shared across processes.
+    
+    Returns:
+        dict with the bracket index, the shard's persisted counts and the worker's address index stats
+    """
+    
+    worker_logger      = _worker["logger"]
+    address_index      = _worker["address_index"]
+    checks             = address_index.checks
+    collisions         = address_index.collisions
+    
+    cntGenerated       = 0                              # Against the cap, days that fail to persist still used it up
+    persisted          = {"adults": 0, "children": 0, "families": 0, "total": 0}
+    
+    # Workers pick up shards as they free up, so PPS numbers are reserved per shard rather than per worker
+    _worker["fake"].configure_pps_stream(seed=_worker["seed"], start=shard["pps"][0], stop=shard["pps"][1])
+    
+    persist_connection = getDataStoreConnection(config_params, worker_logger)
+    writer             = create_writer(persist_connection, config_params, worker_logger, persisted)
+    
+    try:
+        for dob_date in shard["dates"]:
+            
+            if cntGenerated >= shard["cap"]:                # This shard's share of the Age Cap
+                break
+            
+            counts = generate_day(_worker["fake"], config_params, dob_date, _worker["rng"], address_index, writer, worker_logger, 
+                                  limit = shard["cap"] - cntGenerated)
+            
+            cntGenerated += counts[3]
+        #end for
+        
+        writer.close()
+    
+    finally:
+        writer.close(raise_error=False)
+        if persist_connection:
+            persist_connection.disconnect()
+        
+        #end if
+    #end try
+    
+    return {
+        "bracket":      shard["bracket"],
+        "worker":       _worker["id"],
+        "adults":       persisted["adults"],
+        "children":     persisted["children"],
+        "families":     persisted["families"],
+        "total":        persisted["total"],
+        "checks":       address_index.checks - checks,
+        "collisions":   address_index.collisions - collisions,
+        "mode":         address_index.stats()["mode"],
+        "nbytes":       address_index.nbytes,
+        "writer":       writer.stats()
+    }
+#end generate_shard
+
+
+def shard_pps_spans(shards, config_params):
+    
+    """
+    Split the PPS counter range over the shards, in proportion to the people each can generate: its cap plus
+    one day's overrun (the cap is checked before every day).
+    
+    Returns:
+        [(start, stop), ...] per shard, disjoint
+    """
+    
+    weights = [shard["cap"] + config_params["BATCHSIZE"] + config_params["DAYCAP"] for shard in shards]
+    total   = sum(weights)
+    bounds  = [0]
+    for weight in itertools.accumulate(weights):
+        bounds.append(PPS_DOMAIN * weight // total)
+    #end for
+    
+    return list(zip(bounds[:-1], bounds[1:]))
+#end shard_pps_spans
+
+
+def generate_population_parallel(config_params, mylogger, seed, todayDate):
+    
+    """
+    Parallel mode: every age bracket's selected dates are split into WORKERS contiguous date ranges, and the
+    (bracket, date range) shards are handed to a ProcessPoolExecutor. Per day logging happens in the workers,
+    the shard counts are merged back here into the per bracket (step2) reporting as brackets complete.
+    
+    Each date is owned by exactly one shard, which generates every occurrence of it, a date at the edge of a
+    bracket that the previous bracket already selected is generated, and counted, by that bracket's shard.
+    
+    Returns:
+        (cntTotalAdults, cntTotalChildren, cntTotalFamilies, cntTotal, address_stats, writer_stats)
+    """
+    
+    workers        = config_params["WORKERS"]
+    brackets       = []
+    shards         = []
+    date_shards    = {}                                 # date -> the shard that owns it
+    
+    for bracket_index, age_bracket in enumerate(age_distribution):                    # age_distribution comes from option_list.py
+        start_age, end_age, people_count, selected_dates = select_dates(age_bracket, config_params, todayDate)
+        
+        # Split by date value rather than position, the jitter repeats dates and every occurrence of a date has to
+        # land in the same shard, the one that owns its SA IDs. A date an earlier bracket already owns stays there.
+        new_dates = sorted({dob_date.date() for dob_date in selected_dates} - date_shards.keys())
+        chunks    = [chunk for chunk in np.array_split(np.arange(len(new_dates)), workers) if chunk.size]
+        date_cap  = config_params["AGECAP"] / len(selected_dates)
+        
+        brackets.append({
+            "start_age":    start_age,
+            "end_age":      end_age,
+            "pending":      len(chunks),
+            "starttime":    datetime.now(),
+            "start":        perf_counter(),
+            "adults":       0,
+            "children":     0,
+            "families":     0,
+            "total":        0
+        })
+        
+        mylogger.info("Creating {people_count} people for age bracket {start_age}-{end_age} across {number_of_dates} dates in {shards} shards".format(
+            people_count    = people_count,
+            start_age       = start_age,
+            end_age         = end_age,
+            number_of_dates = len(selected_dates),
+            shards          = len(chunks)
+        ))
+        
+        for chunk in chunks:
+            shard = {
+                "bracket":  bracket_index,
+                "dates":    [],
+                "cap":      0
+            }
+            for i in chunk:
+                date_shards[new_dates[i]] = shard
+            #end for
+            
+            shards.append(shard)
+        #end for
+        
+        for dob_date in selected_dates:
+            shard           = date_shards[dob_date.date()]
+            shard["dates"].append(dob_date)
+            shard["cap"]   += date_cap                      # This shard's share of the Age Cap
+        #end for
+    #end for
+    
+    # Whole shard caps adding up to the brackets' Age Caps, the largest remainders get the odd records
+    shares    = [shard["cap"] for shard in shards]
+    for shard in shards:
+        shard["cap"] = math.floor(shard["cap"])
+    #end for
+    
+    remainder = round(sum(shares)) - sum(shard["cap"] for shard in shards)
+    for i in sorted(range(len(shards)), key=lambda i: shares[i] - shards[i]["cap"], reverse=True)[:remainder]:
+        shards[i]["cap"] += 1
+    #end for
+    
+    for shard, span in zip(shards, shard_pps_spans(shards, config_params)):
+        shard["pps"] = span
+    #end for
+    
+    cntTotalAdults   = 0
+    cntTotalChildren = 0
+    cntTotalFamilies = 0
+    cntTotal         = 0
+    address_stats    = {"mode": None, "checks": 0, "collisions": 0, "nbytes": {}}
+    writer_stats     = {"writers": config_params["WRITERS"], "submitted": 0, "flushed": 0, "failed": 0}
+    
+    worker_counter   = multiprocessing.Value('i', 0)
+    
+    with ProcessPoolExecutor(max_workers = workers, 
+                             initializer = init_worker, 
+                             initargs    = (config_params, seed, worker_counter)) as executor:
+        
+        futures = {executor.submit(generate_shard, config_params, shard): shard for shard in shards}
+        
+        for future in as_completed(futures):
+            bracket = brackets[futures[future]["bracket"]]
+            bracket["pending"] -= 1
+            
+            try:
+                result = future.result()
+                
+                bracket["adults"]   += result["adults"]
+                bracket["children"] += result["children"]
+                bracket["families"] += result["families"]
+                bracket["total"]    += result["total"]
+
+                address_stats["checks"]                     += result["checks"]
+                address_stats["collisions"]                 += result["collisions"]
+                address_stats["nbytes"][result["worker"]]    = result["nbytes"]
+                address_stats["mode"]                        = result["mode"]
+                
+                for counter in ("submitted", "flushed", "failed"):
+                    writer_stats[counter] += result["writer"][counter]
                 #end for
+            
+            except Exception as err:
+                mylogger.error("Shard failed for age bracket {start_age} - {end_age}: {err}".format(
+                    start_age = bracket["start_age"],
+                    end_age   = bracket["end_age"],
+                    err       = err
+                ))
+            #end try
+            
+            if bracket["pending"] == 0:
+                step2endtime    = datetime.now()
+                step2time       = round((perf_counter() - bracket["start"]),2)
                 
+                mylogger.info("Record Flushed - St:{start} Et:{end} Rt:{runtime} for Age Bracket {start_age} - {end_age}: Adults {cntAdultsBlock}, Children {cntChildrenBlock}, Families {cntFamiliesBlock}, Total {cntTotalBlock}".format(
+                    start            = str(bracket["starttime"].strftime("%Y-%m-%d %H:%M:%S")),
+                    end              = str(step2endtime.strftime("%Y-%m-%d %H:%M:%S")),
+                    runtime          = str(step2time),
+                    start_age        = bracket["start_age"],
+                    end_age          = bracket["end_age"],
+                    cntAdultsBlock   = bracket["adults"],                      
+                    cntChildrenBlock = bracket["children"],
+                    cntFamiliesBlock = bracket["families"],
+                    cntTotalBlock    = bracket["total"]
+                ))
                 
-                # Flush at end of a day
-                try:
-                    if config_params["DEST"] == 1:     # Post to MongoDB
-                        if len(arAdults) > 0:
-                            result = persist_connection.insert(arAdults, store_name=config_params["ADULTS_STORE"])
-                        
-                        #end if 
-                        if len(arChildren) > 0:
-                            result = persist_connection.insert(arChildren, store_name=config_params["CHILDREN_STORE"])
-                        
-                        #end if 
-                        if len(arFamilies) > 0:
-                            result = persist_connection.insert(arFamilies, store_name=config_params["FAMILY_STORE"])
-
-                        #end if 
-                    elif config_params["DEST"] == 2:   # Post to PostgreSQL
-                        if len(arAdults) > 0:
-                            result = persist_connection.insert(arAdults, store_name=config_params["ADULTS_STORE"], extract_unique_id=True)
-                        
-                        #end if 
-                        if len(arChildren) > 0:
-                            result = persist_connection.insert(arChildren, store_name=config_params["CHILDREN_STORE"], extract_unique_id=True)
-                        
-                        #end if 
-                        if len(arFamilies) > 0:
-                            result = persist_connection.insert(arFamilies, store_name=config_params["FAMILY_STORE"], extract_unique_id=False)
-                            
-                        #end if 
-                            
-                    elif config_params["DEST"] == 3:   # Post to Redis
-                        if len(arAdults) > 0:
-                            result = persist_connection.insert(arAdults, store_name=config_params["ADULTS_STORE"], key_field="uniqueId")        # PPS/IDNumber/SSN
-                        
-                        #end if 
-                        if len(arChildren) > 0:
-                            result = persist_connection.insert(arChildren, store_name=config_params["CHILDREN_STORE"], key_field="uniqueId")    # PPS/IDNumber/SSN
-                        
-                        #end if 
-                        if len(arFamilies) > 0:
-                            result = persist_connection.insert(arFamilies, store_name=config_params["FAMILY_STORE"], key_field="_id")           # UUID used to Id the family
-
-                        #end if 
-                    elif config_params["DEST"] == 4:   # Post to Kafka
-                        if len(arAdults) > 0:
-                            result = persist_connection.insert(arAdults, store_name=config_params["ADULTS_STORE"], key="uniqueId")              # ?
+                cntTotalAdults   += bracket["adults"]
+                cntTotalChildren += bracket["children"]
+                cntTotalFamilies += bracket["families"]
+                cntTotal         += bracket["total"]
+            #end if
+        #end for
+    #end with
+    
+    address_stats["nbytes"]         = sum(address_stats["nbytes"].values())
+    address_stats["collision_rate"] = round(address_stats["collisions"] / address_stats["checks"], 6) if address_stats["checks"] else 0.0
+    
+    return cntTotalAdults, cntTotalChildren, cntTotalFamilies, cntTotal, address_stats, writer_stats
+#end generate_population_parallel
+
+
+def generate_population(config_params, mylogger):
+    
+    try:
+        mylogger.info("STARTING run, logfile => {logfile}".format(
+            logfile=config_params["LOGGINGFILE"]
+        ))
+        print("")
+
+        # Our Global timer, for the entire generation 
+        step0starttime  = datetime.now()
+        step0start      = perf_counter()
+
+        # This will record our getDataStoreConnection execution/creation time
+        step1starttime  = datetime.now()
+        step1start      = perf_counter()
+
+        persist_connection = getDataStoreConnection(config_params, mylogger)        
+
+        step1endtime    = datetime.now()
+        step1end        = perf_counter()
+        step1time       = round((step1end - step1start),2)        
+        
+        # One seed drives every random source, and with it the per worker ID namespaces, see seed_namespace()
+        seed             = config_params["SEED"] if config_params["SEED"] is not None else random.getrandbits(64)
+        todayDate        = datetime.now()
+        
+        if config_params["WORKERS"] > 1:
+            
+            # The workers open their own connections, ours only served to check the persistent store is reachable
+            if persist_connection:
+                persist_connection.disconnect()
+            
+            #end if
+            persist_connection = None
+            random.seed(seed)                                   # select_dates() jitter
+            
+            cntTotalAdults, cntTotalChildren, cntTotalFamilies, cntTotal, address_stats, writer_stats = \
+                generate_population_parallel(config_params, mylogger, seed, todayDate)
+                
+        else:
+            fake             = build_faker(config_params, mylogger)
+            rng              = seed_namespace(fake, seed)       # Used for the per day bulk draws, see WeightedRandomSelector.sample()
+
+            # Address uniqueness, replaces fake.unique.generate_address and it's ever growing set
+            address_index    = create_unique_index(config_params["ADDRESS_UNIQUE"], 
+                                                   capacity   = address_capacity(config_params), 
+                                                   error_rate = config_params["ADDRESS_ERROR_RATE"])
+            
+            # Generation overlaps with the database round trips, see batch_writer.py, only persisted days are counted
+            persisted        = {"adults": 0, "children": 0, "families": 0, "total": 0}
+            writer           = create_writer(persist_connection, config_params, mylogger, persisted)
+
+            # Generate people for each age bracket
+            for age_bracket in age_distribution:                    # age_distribution comes from option_list.py
+                
+                # Our per Age bracket execution timer
+                step2starttime      = datetime.now()
+                step2start          = perf_counter()
+
+                start_age, end_age, people_count, selected_dates = select_dates(age_bracket, config_params, todayDate)
+                
+                cntGeneratedBlock   = 0                     # Against the Age Cap, days that fail to persist still used it up
+                persistedBefore     = dict(persisted)
                         
-                        #end if 
-                        if len(arChildren) > 0:
-                            result = persist_connection.insert(arChildren, store_name=config_params["CHILDREN_STORE"], key="uniqueId")          # ?
+                print("")
+                mylogger.info("Creating {people_count} people for age bracket {start_age}-{end_age} across {number_of_dates} dates in batches of {batch_size}".format(
+                    people_count    = people_count,
+                    start_age       = start_age,
+                    end_age         = end_age,
+                    number_of_dates = len(selected_dates),
+                    batch_size      = config_params["BATCHSIZE"]
+                ))
                         
-                        #end if 
-                        if len(arFamilies) > 0:
-                            result = persist_connection.insert(arFamilies, store_name=config_params["FAMILY_STORE"], key="_id")                 # ?
-
-                        #end if                     
-                    #end if           
-                except DatabaseOperationError as err:
-                    mylogger.error("Database operation failed during flush: {dest} - {err}".format(
-                        dest = config_params["DEST"],
-                        err  = err
-                    ))
-                    continue
-
-                #end try
-
-                cntAdultsBlock   += cntAdultsDay
-                cntChildrenBlock += cntChildrenDay
-                cntFamiliesBlock += cntFamiliesDay
-                cntTotalBlock    += cntDay
-
-                cntTotalAdults   += cntAdultsDay
-                cntTotalChildren += cntChildrenDay
-                cntTotalFamilies += cntFamiliesDay      
-                cntTotal         += cntDay
+                # Loop over the pre-selected dates instead of every single day
+                for dob_date in selected_dates:
+                    
+                    if cntGeneratedBlock >= config_params["AGECAP"]:        # Block = Age Cap
+                        break
                     
-                step3endtime    = datetime.now()
-                step3end        = perf_counter()
-                step3time       = round((step3end - step3start),2)
+                    counts = generate_day(fake, config_params, dob_date, rng, address_index, writer, mylogger, 
+                                          limit = config_params["AGECAP"] - cntGeneratedBlock)
                     
-                mylogger.info("Record Flushed - St:{start} Et:{end} Rt:{runtime} for {day}: Adults {cntAdultsDay}, Children {cntChildrenDay}, Families {cntFamiliesDay}, Total {cntDay}".format(
-                    start           = str(step3starttime.strftime("%Y-%m-%d %H:%M:%S")),
-                    end             = str(step3endtime.strftime("%Y-%m-%d %H:%M:%S")),
-                    runtime         = str(step3time),
-                    day             = dob,
-                    cntAdultsDay    = cntAdultsDay,                    
-                    cntChildrenDay  = cntChildrenDay,
-                    cntFamiliesDay  = cntFamiliesDay,
-                    cntDay          = cntDay
-                ))
+                    cntGeneratedBlock += counts[3]
 
-            #end for - Do next day's loops
+                #end for - Do next day's loops
 
-            step2endtime    = datetime.now()
-            step2end        = perf_counter()
-            step2time       = round((step2end - step2start),2)
+                # The bracket's days that made it into the persistent store
+                writer.drain()
+                
+                cntAdultsBlock   = persisted["adults"]   - persistedBefore["adults"]
+                cntChildrenBlock = persisted["children"] - persistedBefore["children"]
+                cntFamiliesBlock = persisted["families"] - persistedBefore["families"]
+                cntTotalBlock    = persisted["total"]    - persistedBefore["total"]
+
+                step2endtime    = datetime.now()
+                step2end        = perf_counter()
+                step2time       = round((step2end - step2start),2)
+                
+                mylogger.info("Record Flushed - St:{start} Et:{end} Rt:{runtime} for Age Bracket {start_age} - {end_age}: Adults {cntAdultsBlock}, Children {cntChildrenBlock}, Families {cntFamiliesBlock}, Total {cntTotalBlock}".format(
+                    start            = str(step2starttime.strftime("%Y-%m-%d %H:%M:%S")),
+                    end              = str(step2endtime.strftime("%Y-%m-%d %H:%M:%S")),
+                    runtime          = str(step2time),
+                    start_age        = start_age,
+                    end_age          = end_age,
+                    cntAdultsBlock   = cntAdultsBlock,                      
+                    cntChildrenBlock = cntChildrenBlock,
+                    cntFamiliesBlock = cntFamiliesBlock,
+                    cntTotalBlock    = cntTotalBlock
+                ))
+                
+            #end for
             
-            mylogger.info("Record Flushed - St:{start} Et:{end} Rt:{runtime} for Age Bracket {start_age} - {end_age}: Adults {cntAdultsBlock}, Children {cntChildrenBlock}, Families {cntFamiliesBlock}, Total {cntTotalBlock}".format(
-                start            = str(step2starttime.strftime("%Y-%m-%d %H:%M:%S")),
-                end              = str(step2endtime.strftime("%Y-%m-%d %H:%M:%S")),
-                runtime          = str(step2time),
-                start_age        = start_age,
-                end_age          = end_age,
-                cntAdultsBlock   = cntAdultsBlock,                      
-                cntChildrenBlock = cntChildrenBlock,
-                cntFamiliesBlock = cntFamiliesBlock,
-                cntTotalBlock    = cntTotalBlock
-            ))
+            # Wait for the writers to drain before we disconnect
+            writer.close()
             
-        #end for
+            cntTotalAdults   = persisted["adults"]
+            cntTotalChildren = persisted["children"]
+            cntTotalFamilies = persisted["families"]
+            cntTotal         = persisted["total"]
+            
+            address_stats = address_index.stats()
+            writer_stats  = writer.stats()
+        #end if
         
         # Cleanup database connection
         try:
@@ -677,6 +1172,21 @@ def generate_population(config_params, mylogger):
             currate             = str(currate)
         ))
         
+        mylogger.info("Address Uniqueness     - Mode:{mode} Checks:{checks} Collisions:{collisions} Collision Rate:{rate} Memory:{memory} MB".format(
+            mode        = address_stats["mode"],
+            checks      = address_stats["checks"],
+            collisions  = address_stats["collisions"],
+            rate        = address_stats["collision_rate"],
+            memory      = round(address_stats["nbytes"] / (1024 * 1024), 2)
+        ))
+        
+        mylogger.info("Batch Writer           - Writers:{writers} Batches:{submitted} Flushed:{flushed} Failed:{failed}".format(
+            writers     = writer_stats["writers"],
+            submitted   = writer_stats["submitted"],
+            flushed     = writer_stats["flushed"],
+            failed      = writer_stats["failed"]
+        ))
+        
     except Exception as err:
         mylogger.err("Undefined Error: {err}".format(
             err = err
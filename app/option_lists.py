@@ -59,6 +59,10 @@
 #       0.16 -  60-69 years - 823862
 #       0.11 -  70-79 years - 566405
 #
+#   *_selector      - Each option list is compiled into a WeightedRandomSelector exactly once at import and registered
+#                       under the list's name, see weighted_random.register_selector(). Use these instead of building
+#                       a new WeightedRandomSelector per draw.
+#
 #
 ########################################################################################################################
 __author__      = "Generic Data playground"
@@ -67,6 +71,9 @@ __version__     = "0.1"
 __copyright__   = "Copyright 2025, - George Leonard"
 
 
+from weighted_random import register_selector
+
+
 gender_options = [
     {"name": "Male",    "value": 0.494},
     {"name": "Female",  "value": 0.506}
@@ -159,3 +166,17 @@ age_distribution = [
     {"name": 60, "value": 0.16, "count": 823862},
     {"name": 70, "value": 0.11, "count": 566405}
 ]
+
+
+# Compiled once at import, see weighted_random.py
+gender_selector                     = register_selector("gender_options",            gender_options,            scale=1.0)
+marital_selector                    = register_selector("marital_options",           marital_options,           scale=1.0)
+children_yn_selector                = register_selector("children_yn_options",       children_yn_options,       scale=1.0)
+kids_selector                       = register_selector("kids_options",              kids_options,              scale=1.0)
+motherCustody_selector              = register_selector("motherCustody_options",     motherCustody_options,     scale=1.0)
+livingstatus_yn_selector            = register_selector("livingstatus_yn_options",   livingstatus_yn_options,   scale=1.0)
+banks_selector                      = register_selector("banks_options",             banks_options,             scale=1.33)
+cc_selector                         = register_selector("cc_options",                cc_options,                scale=1.0)
+accountTypes_selector               = register_selector("accountTypes_options",      accountTypes_options,      scale=1.0)
+bank_accounts_per_person_selector   = register_selector("bank_accounts_per_person",  bank_accounts_per_person,  scale=1.0)
+credit_cards_per_person_selector    = register_selector("credit_cards_per_person",   credit_cards_per_person,   scale=1.0)
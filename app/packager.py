@@ -30,7 +30,7 @@ from weighted_random import *
 
 def packageChild(fake, config_params, childPackage):
     
-    childGender        = WeightedRandomSelector(gender_options, scale=1.0).get_random()
+    childGender        = gender_selector.get_random()
     childDOB           = generate_birth_date(childPackage["femaleDOB"], childPackage["ageGap"], childPackage["variation"])
     
     if childGender == "Male":
@@ -0,0 +1,347 @@
+#######################################################################################################################
+#
+#
+#  	Project     	: 	Generic Data generator.
+#
+#   File            :   unique_index.py
+#
+#   Description     :   Memory bounded uniqueness tracking, replacing fake.unique for high volume values like addresses.
+#
+#   Created     	:   17 Oct 2026
+#
+#                   :   Faker's fake.unique keeps every (args, result) it has seen in a Python set, which for a multi
+#                       million person run grows to gigabytes. Here values are reduced to a 64 bit fingerprint and kept
+#                       either in a NumPy open addressing table (8 bytes per slot, exact up to fingerprint collisions)
+#                       or in a fixed size Bloom filter (memory fixed up front, small false positive rate, a false
+#                       positive simply means a value gets redrawn).
+#
+#   Usage:
+#       address_index = create_unique_index("fingerprint")
+#       is_new        = address_index.add_many(["1 Main Street|Cork", "2 Main Street|Cork"])     # np bool array
+#       address_index.stats()                                                                   # collision rate etc.
+#
+#   Classes         :   UniqueIndex (Abstract Class)
+#                   :       add
+#                   :       add_many
+#                   :       stats
+#                   :   FingerprintSet
+#                   :   BloomFilter
+#
+#   Functions       :   fingerprint
+#                   :   fingerprints
+#                   :   create_unique_index
+#
+#
+########################################################################################################################
+__author__      = "Generic Data playground"
+__email__       = "georgelza@gmail.com"
+__version__     = "0.1"
+__copyright__   = "Copyright 2025, - George Leonard"
+
+
+import math
+from abc import ABC, abstractmethod
+from hashlib import blake2b
+from typing import Any, Dict, Iterable
+import numpy as np
+
+
+def fingerprint(value: str) -> int:
+
+    """
+    64 bit fingerprint of a string, stable across processes (unlike hash(), which is salted per process).
+    """
+
+    return int.from_bytes(blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+#end fingerprint
+
+
+def fingerprints(values: Iterable[str]) -> np.ndarray:
+
+    """
+    64 bit fingerprints for a batch of strings.
+
+    Returns:
+        np.ndarray: uint64 fingerprints, 0 is remapped to 1 as 0 marks an empty slot
+    """
+
+    hashes = np.fromiter((fingerprint(value) for value in values), dtype=np.uint64)
+    hashes[hashes == 0] = 1
+
+    return hashes
+#end fingerprints
+
+
+class UniqueIndex(ABC):
+
+    """Abstract base class for the uniqueness indexes"""
+
+    def __init__(self):
+        self.checks     = 0         # Values offered
+        self.collisions = 0         # Values rejected as already seen
+    #end __init__
+
+
+    @abstractmethod
+    def _add_fingerprints(self, hashes: np.ndarray) -> np.ndarray:
+
+        """Add uint64 fingerprints, returns a bool array, True where the value was new"""
+
+        pass
+    #end _add_fingerprints
+
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+
+        """Memory held by the index"""
+
+        pass
+    #end nbytes
+
+
+    def add(self, value: str) -> bool:
+
+        """
+        Add a single value.
+
+        Returns:
+            True if the value was new, False if it was seen before
+        """
+
+        return bool(self.add_many([value])[0])
+    #end add
+
+
+    def add_many(self, values: Iterable[str]) -> np.ndarray:
+
+        """
+        Add a batch of values, duplicates within the batch count as collisions too (first one wins).
+
+        Returns:
+            np.ndarray: bool per value, True where the value was new
+        """
+
+        hashes = fingerprints(values)
+
+        if hashes.size == 0:
+            return np.zeros(0, dtype=bool)
+        #end if
+
+        # Only the first occurrence of a fingerprint within the batch is offered to the index
+        _, first = np.unique(hashes, return_index=True)
+        is_new   = np.zeros(hashes.size, dtype=bool)
+        is_new[first] = self._add_fingerprints(hashes[first])
+
+        self.checks     += int(hashes.size)
+        self.collisions += int(hashes.size - np.count_nonzero(is_new))
+
+        return is_new
+    #end add_many
+
+
+    def stats(self) -> Dict[str, Any]:
+
+        """Counters for reporting"""
+
+        return {
+            'mode':             type(self).__name__,
+            'checks':           self.checks,
+            'collisions':       self.collisions,
+            'collision_rate':   round(self.collisions / self.checks, 6) if self.checks else 0.0,
+            'nbytes':           self.nbytes
+        }
+    #end stats
+#end UniqueIndex
+
+
+class FingerprintSet(UniqueIndex):
+
+    """
+    Open addressing (linear probing) hash set of 64 bit fingerprints held in a NumPy uint64 array.
+
+    8 bytes per slot, the table doubles when it passes max_load, so memory is roughly 16-32 bytes per value
+    versus well over 100 bytes per value for a Python set of tuples/strings. Exact, bar 64 bit fingerprint
+    collisions (~n^2 / 2^65, negligible for our population sizes).
+    """
+
+    def __init__(self, initial_capacity: int = 1 << 16, max_load: float = 0.5):
+
+        super().__init__()
+        capacity        = 1 << max(4, int(initial_capacity - 1).bit_length())
+        self.max_load   = max_load
+        self.size       = 0
+        self._table     = np.zeros(capacity, dtype=np.uint64)
+        self._mask      = np.uint64(capacity - 1)
+    #end __init__
+
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._table.nbytes)
+    #end nbytes
+
+
+    def __len__(self) -> int:
+        return self.size
+    #end __len__
+
+
+    def _grow(self, required: int):
+
+        """Double the table until required entries fit under max_load, re-inserting what we have"""
+
+        capacity = self._table.size
+        while required > capacity * self.max_load:
+            capacity <<= 1
+        #end while
+
+        if capacity == self._table.size:
+            return
+        #end if
+
+        existing    = self._table[self._table != 0]
+        self._table = np.zeros(capacity, dtype=np.uint64)
+        self._mask  = np.uint64(capacity - 1)
+        self.size   = 0
+        self._insert(existing)
+    #end _grow
+
+
+    def _insert(self, hashes: np.ndarray) -> np.ndarray:
+
+        """
+        Vectorised probe/insert of distinct fingerprints.
+
+        All pending values probe in lock step, each round a value either finds itself (duplicate), finds an
+        empty slot (insert, the first of several values racing for the same slot wins, the rest probe on)
+        or moves to the next slot.
+        """
+
+        is_new  = np.zeros(hashes.size, dtype=bool)
+        pending = np.arange(hashes.size)
+        slots   = hashes & self._mask
+
+        while pending.size:
+            current = self._table[slots]
+            keys    = hashes[pending]
+
+            found   = current == keys
+            empty   = current == 0
+
+            # Racing for the same empty slot, keep the first claimant
+            claim_rows        = np.flatnonzero(empty)
+            _, first          = np.unique(slots[claim_rows], return_index=True)
+            winners           = claim_rows[first]
+
+            self._table[slots[winners]] = keys[winners]
+            is_new[pending[winners]]    = True
+            self.size                  += int(winners.size)
+
+            done          = found.copy()
+            done[winners] = True
+
+            # Losers of a race re-probe the same slot next round, everyone else still pending moves on
+            advance          = ~(done | empty)
+            slots[advance]   = (slots[advance] + np.uint64(1)) & self._mask
+
+            pending = pending[~done]
+            slots   = slots[~done]
+        #end while
+
+        return is_new
+    #end _insert
+
+
+    def _add_fingerprints(self, hashes: np.ndarray) -> np.ndarray:
+
+        self._grow(self.size + hashes.size)
+
+        return self._insert(hashes)
+    #end _add_fingerprints
+#end FingerprintSet
+
+
+class BloomFilter(UniqueIndex):
+
+    """
+    Fixed size Bloom filter, sized up front from the expected number of values and the false positive rate.
+
+    Memory never grows, a false positive reports a new value as already seen, for addresses that just means
+    the address gets redrawn. Past capacity the false positive rate climbs, which shows up as a rising
+    collision rate in stats().
+    """
+
+    def __init__(self, capacity: int = 5_500_000, error_rate: float = 0.001):
+
+        super().__init__()
+        bits            = max(64, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.capacity   = capacity
+        self.error_rate = error_rate
+        self.num_hashes = max(1, int(round(bits / capacity * math.log(2))))
+        self.num_bits   = bits
+        self._bits      = np.zeros((bits + 7) // 8, dtype=np.uint8)
+    #end __init__
+
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._bits.nbytes)
+    #end nbytes
+
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+
+        """Kirsch-Mitzenmacher double hashing, k bit positions per fingerprint from its two 32 bit halves"""
+
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        k  = np.arange(self.num_hashes, dtype=np.uint64)
+
+        return (h1[:, None] + k[None, :] * h2[:, None]) % np.uint64(self.num_bits)
+    #end _positions
+
+
+    def _add_fingerprints(self, hashes: np.ndarray) -> np.ndarray:
+
+        positions = self._positions(hashes)
+        byte_idx  = (positions >> np.uint64(3)).astype(np.int64)
+        bit_mask  = (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8))
+
+        is_new    = ~np.all(self._bits[byte_idx] & bit_mask, axis=1)
+
+        # Set bits for the new values only, np.bitwise_or.at copes with repeated byte positions
+        np.bitwise_or.at(self._bits, byte_idx[is_new].ravel(), bit_mask[is_new].ravel())
+
+        return is_new
+    #end _add_fingerprints
+#end BloomFilter
+
+
+def create_unique_index(mode: str = "fingerprint", capacity: int = 5_500_000, error_rate: float = 0.001) -> UniqueIndex:
+
+    """
+    Factory for the uniqueness indexes.
+
+    Args:
+        mode:       'fingerprint' (exact, compact, grows with the data) or 'bloom' (fixed memory, approximate)
+        capacity:   Expected number of values, sizes the Bloom filter and pre-sizes the fingerprint table (at most
+                    2^20 values up front, it grows from there)
+        error_rate: Bloom filter false positive rate at capacity
+
+    Returns:
+        UniqueIndex instance
+    """
+
+    if mode.lower() == "fingerprint":
+        return FingerprintSet(initial_capacity=min(capacity, 1 << 20) * 2)
+
+    elif mode.lower() == "bloom":
+        return BloomFilter(capacity=capacity, error_rate=error_rate)
+
+    else:
+        raise ValueError(f"Unsupported unique index mode: {mode}")
+
+    #end if
+#end create_unique_index
@@ -64,6 +64,22 @@ def getConfigs():
     config_params["VARIATION"]              = float(os.environ["VARIATION"])
     config_params["VARIATION_PERC"]         = int(os.environ["VARIATION_PERC"])
     
+    # Address uniqueness, fingerprint (exact, compact) or bloom (fixed memory, approximate), see unique_index.py
+    config_params["ADDRESS_UNIQUE"]         = os.environ.get("ADDRESS_UNIQUE",     "fingerprint")
+    config_params["ADDRESS_CAPACITY"]       = int(os.environ.get("ADDRESS_CAPACITY",     5500000))
+    config_params["ADDRESS_ERROR_RATE"]     = float(os.environ.get("ADDRESS_ERROR_RATE", 0.001))
+    
+    # Parallel generation, WORKERS > 1 => ProcessPoolExecutor shards, SEED => repeatable run (random if not set)
+    config_params["WORKERS"]                = int(os.environ.get("WORKERS", 1))
+    config_params["SEED"]                   = int(os.environ["SEED"]) if os.environ.get("SEED") else None
+    
+    # Pipelined persist, WRITERS background writer threads (0 => synchronous) fed through a WRITE_QUEUE deep queue
+    config_params["WRITERS"]                = int(os.environ.get("WRITERS",     1))
+    config_params["WRITE_QUEUE"]            = int(os.environ.get("WRITE_QUEUE", 4))
+    
+    # JSON stores (PostgreSQL, Redis, Kafka json, JSONL), 1 => documents are JSON encoded once where they're generated
+    config_params["JSON_PRECODE"]           = int(os.environ.get("JSON_PRECODE", 1))
+    
     config_params["DEST"]                   = int(os.environ["DEST"])
     
     if config_params["DEST"] == 1:
@@ -75,15 +91,28 @@ def getConfigs():
         config_params["MONGO_USERNAME"]             = os.environ["MONGO_USERNAME"]
         config_params["MONGO_PASSWORD"]             = os.environ["MONGO_PASSWORD"]
         config_params["MONGO_DATASTORE"]            = os.environ["MONGO_DATASTORE"]
+        config_params["MONGO_ORDERED"]              = int(os.environ.get("MONGO_ORDERED",  0))      # 0 => unordered insert_many
+        config_params["MONGO_WRITE_W"]              = os.environ.get("MONGO_WRITE_W",      "1")     # 0, 1, ... or majority
+        config_params["MONGO_JOURNAL"]              = int(os.environ.get("MONGO_JOURNAL",  0))      # 1 => j=True
+        config_params["MONGO_RAW_BSON"]             = int(os.environ.get("MONGO_RAW_BSON", 1))      # 1 => BSON encode in the generator
+        config_params["MONGO_STREAMS"]              = int(os.environ.get("MONGO_STREAMS",  2))      # insert_many streams per collection, 0 => inline
+        config_params["MONGO_CLIENTS"]              = int(os.environ.get("MONGO_CLIENTS",  1))      # MongoClients the streams are spread over
+        config_params["MONGO_POOL_SIZE"]            = int(os.environ.get("MONGO_POOL_SIZE", 100))   # maxPoolSize per client
+        config_params["MONGO_COMPRESSORS"]          = os.environ.get("MONGO_COMPRESSORS", "zstd,snappy")   # wire compression, "" => none
 
         
-    elif config_params["DEST"] ==2:
-        config_params["LOGGINGFILE"]                = os.path.join(os.environ["LOGDIR"] , "postgres")
+    elif config_params["DEST"] in (2, 5):
+        config_params["LOGGINGFILE"]                = os.path.join(os.environ["LOGDIR"] , "postgres" if config_params["DEST"] == 2 else "postgres_async")
         config_params["POSTGRES_HOST"]              = os.environ["POSTGRES_HOST"]
         config_params["POSTGRES_PORT"]              = str(os.environ["POSTGRES_PORT"])
         config_params["POSTGRES_USER"]              = os.environ["POSTGRES_USER"]
         config_params["POSTGRES_PASSWORD"]          = os.environ["POSTGRES_PASSWORD"]
         config_params["POSTGRES_DB"]                = os.environ["POSTGRES_DB"]
+        config_params["POSTGRES_LOAD"]              = os.environ.get("POSTGRES_LOAD",        "merge")     # insert, copy or merge
+        config_params["POSTGRES_COPY_FORMAT"]       = os.environ.get("POSTGRES_COPY_FORMAT", "text")      # text or binary
+        config_params["POSTGRES_POOL"]              = int(os.environ.get("POSTGRES_POOL",         1))     # > 1 => one session per writer thread
+        config_params["POSTGRES_COMMIT_EVERY"]      = int(os.environ.get("POSTGRES_COMMIT_EVERY", 1))     # Commit per K insert calls per session
+        config_params["POSTGRES_INFLIGHT"]          = int(os.environ.get("POSTGRES_INFLIGHT",     8))     # DEST 5, batches in flight
 
     elif config_params["DEST"] ==3:
         config_params["LOGGINGFILE"]                = os.path.join(os.environ["LOGDIR"] , "redis")
@@ -100,6 +129,14 @@ def getConfigs():
             config_params["REDIS_SSL_CERT"]         = os.environ["REDIS_SSL_CERT"]
             config_params["REDIS_SSL_KEY"]          = os.environ["REDIS_SSL_KEY"] 
             config_params["REDIS_SSL_CA"]           = os.environ["REDIS_SSL_CA"]
+            
+        #end if
+        config_params["REDIS_TRANSACTION"]          = int(os.environ.get("REDIS_TRANSACTION", 0))     # 1 => MULTI/EXEC per chunk
+        config_params["REDIS_MSET"]                 = int(os.environ.get("REDIS_MSET",        1))     # 1 => MSET when there is no TTL
+        config_params["REDIS_CHUNK"]                = int(os.environ.get("REDIS_CHUNK",       500))   # Keys per round trip, 0 => whole batch
+        config_params["REDIS_PIPELINES"]            = int(os.environ.get("REDIS_PIPELINES",   2))     # Chunks written concurrently
+        config_params["REDIS_LAYOUT"]               = os.environ.get("REDIS_LAYOUT",          "string")   # string, hash or json (RedisJSON)
+        config_params["REDIS_HASH_BUCKETS"]         = int(os.environ.get("REDIS_HASH_BUCKETS", 65536))  # hash layout, buckets per store
 
     elif config_params["DEST"] ==4:
         config_params["LOGGINGFILE"]                = os.path.join(os.environ["LOGDIR"] , "kafka")
@@ -111,6 +148,33 @@ def getConfigs():
         config_params["SASL_PASSWORD"]              = os.environ["KAFKA_SASL_PASSWORD"] 
         config_params["MAXRETRIES"]                 = int(os.environ["KAFKA_MAXRETRIES"])
         config_params["DELAY"]                      = float(os.environ["KAFKA_DELAY"])
+        config_params["KAFKA_STREAMING"]            = int(os.environ.get("KAFKA_STREAMING",       1))         # 1 => no flush per batch
+        config_params["KAFKA_CHECKPOINT"]           = int(os.environ.get("KAFKA_CHECKPOINT",      0))         # Flush every N batches, 0 => at the end
+        config_params["KAFKA_FLUSH_TIMEOUT"]        = float(os.environ.get("KAFKA_FLUSH_TIMEOUT", 30))        # Seconds
+        config_params["KAFKA_LINGER_MS"]            = int(os.environ.get("KAFKA_LINGER_MS",       20))
+        config_params["KAFKA_BATCH_SIZE"]           = int(os.environ.get("KAFKA_BATCH_SIZE",      1048576))   # Bytes
+        config_params["KAFKA_COMPRESSION"]          = os.environ.get("KAFKA_COMPRESSION",         "lz4")      # none, gzip, snappy, lz4, zstd
+        config_params["KAFKA_IDEMPOTENCE"]          = int(os.environ.get("KAFKA_IDEMPOTENCE",     1))
+        config_params["KAFKA_ACKS"]                 = os.environ.get("KAFKA_ACKS",                "all")
+        config_params["KAFKA_QUEUE_MAX"]            = int(os.environ.get("KAFKA_QUEUE_MAX",       1000000))   # Local producer queue, messages
+        config_params["KAFKA_DELIVERY_RETRIES"]     = int(os.environ.get("KAFKA_DELIVERY_RETRIES", 3))        # Re-produce attempts per failed message
+        config_params["KAFKA_FORMAT"]               = os.environ.get("KAFKA_FORMAT",              "json")     # json or avro
+
+    elif config_params["DEST"] == 6:
+        config_params["LOGGINGFILE"]                = os.path.join(os.environ["LOGDIR"] , "parquet")
+        config_params["FILE_DIR"]                   = os.environ.get("FILE_DIR",                  "output")
+        config_params["PARQUET_FORMAT"]             = os.environ.get("PARQUET_FORMAT",            "parquet")  # parquet or arrow (IPC)
+        config_params["PARQUET_COMPRESSION"]        = os.environ.get("PARQUET_COMPRESSION",       "zstd")
+        config_params["PARQUET_ROW_GROUP"]          = int(os.environ.get("PARQUET_ROW_GROUP",     100000))    # Rows per row group
+        config_params["PARQUET_FILE_ROWS"]          = int(os.environ.get("PARQUET_FILE_ROWS",     0))         # Roll files after N rows, 0 => never
+
+    elif config_params["DEST"] == 7:
+        config_params["LOGGINGFILE"]                = os.path.join(os.environ["LOGDIR"] , "jsonl")
+        config_params["FILE_DIR"]                   = os.environ.get("FILE_DIR",                  "output")
+        config_params["JSONL_COMPRESSION"]          = os.environ.get("JSONL_COMPRESSION",         "zstd")     # zstd, gzip or none
+        config_params["JSONL_LEVEL"]                = int(os.environ.get("JSONL_LEVEL",           3))         # Compression level
+        config_params["JSONL_ROTATE_MB"]            = int(os.environ.get("JSONL_ROTATE_MB",       256))       # Start a new file after N MB
+        config_params["JSONL_THREADS"]              = int(os.environ.get("JSONL_THREADS",         2))         # Compression threads
 
     #end if
     config_params["ADULTS_STORE"]                   = os.environ["ADULTS_STORE"] 
@@ -222,6 +286,14 @@ def echo_config(config_params, mylogger):
         mylogger.info("* DayCap                           : " + str(config_params["DAYCAP"]))       # Max records for the Day block
         mylogger.info("* Age Block Size                   : " + str(config_params["BLOCKSIZE"]))
         mylogger.info("* Batch Size                       : " + str(config_params["BATCHSIZE"]))
+        mylogger.info("* Address Unique Mode              : " + config_params["ADDRESS_UNIQUE"])
+        mylogger.info("* Address Unique Capacity          : " + str(config_params["ADDRESS_CAPACITY"]))
+        mylogger.info("* Address Unique Error Rate        : " + str(config_params["ADDRESS_ERROR_RATE"]))
+        mylogger.info("* Workers                          : " + str(config_params["WORKERS"]))
+        mylogger.info("* Seed                             : " + str(config_params["SEED"]))
+        mylogger.info("* Writer Threads                   : " + str(config_params["WRITERS"]))
+        mylogger.info("* Writer Queue Size                : " + str(config_params["WRITE_QUEUE"]))
+        mylogger.info("* JSON Pre-encode                  : " + str(config_params["JSON_PRECODE"]))
     
         mylogger.info("* ")        
         mylogger.info("* Log Directory                    : " + config_params["LOGDIR"])
@@ -237,17 +309,28 @@ def echo_config(config_params, mylogger):
             mylogger.info("* Mongo Port                       : " + str(config_params["MONGO_PORT"]))
             mylogger.info("* Mongo Direct                     : " + config_params["MONGO_DIRECT"])
             mylogger.info("* Mongo Datastore                  : " + config_params["MONGO_DATASTORE"])
+            mylogger.info("* Mongo Ordered Inserts            : " + str(config_params["MONGO_ORDERED"]))
+            mylogger.info("* Mongo Write Concern              : w=" + config_params["MONGO_WRITE_W"] + " j=" + str(config_params["MONGO_JOURNAL"]))
+            mylogger.info("* Mongo Raw BSON                   : " + str(config_params["MONGO_RAW_BSON"]))
+            mylogger.info("* Mongo Streams / Clients          : " + str(config_params["MONGO_STREAMS"]) + " / " + str(config_params["MONGO_CLIENTS"]))
+            mylogger.info("* Mongo Pool Size                  : " + str(config_params["MONGO_POOL_SIZE"]))
+            mylogger.info("* Mongo Compressors                : " + config_params["MONGO_COMPRESSORS"])
             mylogger.info("* Mongo Adult Collection           : " + config_params["ADULTS_STORE"])
             mylogger.info("* Mongo Children Collection        : " + config_params["CHILDREN_STORE"])
             mylogger.info("* Mongo Families Collection        : " + config_params["FAMILY_STORE"])   
             mylogger.info("* ")
             
-        elif config_params["DEST"] == 2: 
-            mylogger.info("* DB Dest Specified                : PostgreSQL" )
+        elif config_params["DEST"] in (2, 5): 
+            mylogger.info("* DB Dest Specified                : " + ("PostgreSQL" if config_params["DEST"] == 2 else "PostgreSQL Async (asyncpg)"))
             mylogger.info("* PostgreSQL Host                  : " + config_params["POSTGRES_HOST"])
             mylogger.info("* PostgreSQL Port                  : " + str(config_params["POSTGRES_PORT"]))
             mylogger.info("* PostgreSQL DB                    : " + config_params["POSTGRES_DB"])
             mylogger.info("* PostgreSQL User                  : " + config_params["POSTGRES_USER"])
+            mylogger.info("* PostgreSQL Load Mode             : " + config_params["POSTGRES_LOAD"])
+            mylogger.info("* PostgreSQL COPY Format           : " + config_params["POSTGRES_COPY_FORMAT"])
+            mylogger.info("* PostgreSQL Pool Size             : " + str(config_params["POSTGRES_POOL"]))
+            mylogger.info("* PostgreSQL Commit Every          : " + str(config_params["POSTGRES_COMMIT_EVERY"]))
+            mylogger.info("* PostgreSQL Batches In Flight     : " + str(config_params["POSTGRES_INFLIGHT"]))
             mylogger.info("* PostgreSQL Password              : ************" )
             mylogger.info("* PostgreSQL Adult Table           : " + config_params["ADULTS_STORE"])
             mylogger.info("* PostgreSQL Children Table        : " + config_params["CHILDREN_STORE"])
@@ -268,6 +351,15 @@ def echo_config(config_params, mylogger):
                 mylogger.info("* Redis SSL Key                    : " + config_params["REDIS_SSL_KEY"])
                 mylogger.info("* Redis SSL CA                     : " + config_params["REDIS_SSL_CA"])
             
+            #end if
+            mylogger.info("* Redis Transaction / MSET         : " + str(config_params["REDIS_TRANSACTION"]) + " / " + str(config_params["REDIS_MSET"]))
+            mylogger.info("* Redis Chunk / Pipelines          : " + str(config_params["REDIS_CHUNK"]) + " / " + str(config_params["REDIS_PIPELINES"]))
+            mylogger.info("* Redis Layout                     : " + config_params["REDIS_LAYOUT"])
+            if config_params["REDIS_LAYOUT"] == "hash":
+                mylogger.info("* Redis Hash Buckets               : " + str(config_params["REDIS_HASH_BUCKETS"]))
+            
+            #end if
+            
 
         elif config_params["DEST"] == 4: 
             mylogger.info("* DB Dest Specified                : Kafka" )
@@ -275,9 +367,27 @@ def echo_config(config_params, mylogger):
             mylogger.info("* Kafka Schemaregistry servers     : " + config_params["SCHEMAREGISTRY_SERVERS"])
             mylogger.info("* Kafka Security Protocol          : " + config_params["SECURITY_PROTOCOL"])
             mylogger.info("* Kafka SASL Mechanisms            : " + config_params["SASL_MECHANISMS"])
+            mylogger.info("* Kafka Streaming / Checkpoint     : " + str(config_params["KAFKA_STREAMING"]) + " / " + str(config_params["KAFKA_CHECKPOINT"]))
+            mylogger.info("* Kafka Linger ms / Batch Size     : " + str(config_params["KAFKA_LINGER_MS"]) + " / " + str(config_params["KAFKA_BATCH_SIZE"]))
+            mylogger.info("* Kafka Compression                : " + config_params["KAFKA_COMPRESSION"])
+            mylogger.info("* Kafka Idempotence / Acks         : " + str(config_params["KAFKA_IDEMPOTENCE"]) + " / " + config_params["KAFKA_ACKS"])
+            mylogger.info("* Kafka Queue Max / Retries        : " + str(config_params["KAFKA_QUEUE_MAX"]) + " / " + str(config_params["KAFKA_DELIVERY_RETRIES"]))
+            mylogger.info("* Kafka Format                     : " + config_params["KAFKA_FORMAT"])
             mylogger.info("* Kafka Conn Max Retries           : " + str(config_params["MAXRETRIES"]))
             mylogger.info("* Kafka Conn Delay/Backof          : " + str(config_params["DELAY"]))
             
+        elif config_params["DEST"] == 6: 
+            mylogger.info("* DB Dest Specified                : Parquet/Arrow files" )
+            mylogger.info("* File Directory                   : " + config_params["FILE_DIR"])
+            mylogger.info("* Parquet Format / Compression     : " + config_params["PARQUET_FORMAT"] + " / " + config_params["PARQUET_COMPRESSION"])
+            mylogger.info("* Parquet Row Group / File Rows    : " + str(config_params["PARQUET_ROW_GROUP"]) + " / " + str(config_params["PARQUET_FILE_ROWS"]))
+            
+        elif config_params["DEST"] == 7: 
+            mylogger.info("* DB Dest Specified                : JSONL files" )
+            mylogger.info("* File Directory                   : " + config_params["FILE_DIR"])
+            mylogger.info("* JSONL Compression / Level        : " + config_params["JSONL_COMPRESSION"] + " / " + str(config_params["JSONL_LEVEL"]))
+            mylogger.info("* JSONL Rotate MB / Threads        : " + str(config_params["JSONL_ROTATE_MB"]) + " / " + str(config_params["JSONL_THREADS"]))
+            
         mylogger.info("* Adult Store                      : " + config_params["ADULTS_STORE"])
         mylogger.info("* Children Store                   : " + config_params["CHILDREN_STORE"])
         mylogger.info("* Families Store                   : " + config_params["FAMILY_STORE"])
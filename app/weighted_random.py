@@ -24,6 +24,10 @@
 #
 #   Method 3: Manual Implementation
 #       A custom implementation using cumulative weights - useful for understanding the underlying logic.
+#
+#   Method 4: Alias table (Walker/Vose) (Default)
+#       The alias table is compiled once when the selector is constructed, after which every draw costs one
+#       random.random() call and a single table lookup, O(1) regardless of the number of options.
 #       Key Features:
 #
 #   WeightedRandomSelector class: Reusable class that supports all three methods
@@ -46,12 +50,34 @@
 #   and handles edge cases properly. The weights don't need to sum to 1.0 - they can be any positive numbers and will be 
 #   automatically normalized.
 #
+#   Compiled selectors:
+#       Building a selector per draw re-walks the option list every time, so static option lists are compiled once
+#       and kept in a module level registry, see register_selector() / get_selector(), option_lists.py registers
+#       all of its lists at import.
+#
+#       gender_selector.get_random()                                    # option_lists.py compiled selector
+#       get_selector("gender_options").get_random()                     # same selector, looked up by name
+#       compiled_selector(bank_record["card_network"]).get_random()     # long lived list, compiled on first use
+#
+#   Bulk draws:
+#       sample(n, rng) draws n selections in one NumPy call, searchsorted against a cached cumulative probability
+#       array, returning the category indices, or with names=True the 'name' values.
+#
+#       rng     = np.random.default_rng()
+#       genders = gender_selector.sample(batch_size, rng, names=True)
+#
 #   Functions       :   WeightedRandomSelector (Class)
 #                   :       __init__
+#                   :       _build_alias_table
 #                   :       method1_random_choices
 #                   :       method2_numpy_choice
 #                   :       method3_manual_cumulative
+#                   :       method4_alias_table
 #                   :       get_random
+#                   :       sample
+#                   :   register_selector
+#                   :   get_selector
+#                   :   compiled_selector
 #
 #
 ########################################################################################################################
@@ -62,6 +88,7 @@ __copyright__   = "Copyright 2025, - George Leonard"
 
 
 import random
+from bisect import bisect_left
 import numpy as np
 from typing import List, Dict, Any, Union
 
@@ -91,8 +118,88 @@ class WeightedRandomSelector:
             print(f"Warning: Weights sum to {total_weight}, expected {scale}")
 
         #end if
+        
+        # Compile once, cumulative weights for bisect and the alias table for O(1) draws
+        self.total_weight       = total_weight
+        self.cumulative_weights = []
+        cumsum = 0
+        for weight in self.weights:
+            cumsum += weight
+            self.cumulative_weights.append(cumsum)
+        
+        #end for
+        
+        self._size                  = len(self.weights)
+        self._prob, self._alias     = self._build_alias_table()
+        
+        # NumPy views, built on first use by the numpy/bulk paths
+        self._cdf                   = None
+        self._names_array           = None
     #end def
     
+    
+    def _build_alias_table(self):
+        
+        """
+        Build a Walker/Vose alias table from the weights.
+        
+        Returns:
+            tuple: (prob, alias) lists, each column i keeps itself with probability prob[i] else yields alias[i]
+        """
+        
+        n     = self._size
+        prob  = [1.0] * n
+        alias = list(range(n))
+        
+        if n == 0 or self.total_weight <= 0:
+            return prob, alias
+        
+        #end if
+        
+        scaled = [weight * n / self.total_weight for weight in self.weights]
+        small  = [i for i, p in enumerate(scaled) if p < 1.0]
+        large  = [i for i, p in enumerate(scaled) if p >= 1.0]
+        
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            
+            prob[s]   = scaled[s]
+            alias[s]  = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+            
+            #end if
+        #end while
+        
+        # Whatever remains is 1.0 give or take floating point rounding
+        for i in small + large:
+            prob[i] = 1.0
+        
+        #end for
+        
+        return prob, alias
+    #end _build_alias_table
+    
+    
+    def _cumulative_probabilities(self) -> np.ndarray:
+        
+        """Cached cumulative probability array, normalised once, used with searchsorted"""
+        
+        if self._cdf is None:
+            cdf      = np.asarray(self.cumulative_weights, dtype=np.float64) / self.total_weight
+            cdf[-1]  = 1.0                                      # Guard against rounding on the last bucket
+            self._cdf = cdf
+        
+        #end if
+        
+        return self._cdf
+    #end _cumulative_probabilities
+    
     def method1_random_choices(self) -> Union[str, Dict]:
         
         """Method 1: Using random.choices() - Python 3.6+"""
@@ -102,62 +209,64 @@ class WeightedRandomSelector:
     
     def method2_numpy_choice(self) -> Union[str, Dict]:
         
-        """Method 2: Using numpy.random.choice() - Note: Only works with strings"""
-        if any(isinstance(name, dict) for name in self.names):
-            np.choice #doesn't work with dict objects, fall back to manual method
-            
-            return self.method3_manual_cumulative()
-        
-        #end if
+        """Method 2: Using numpy's global random state against the cached cumulative probabilities"""
         
-        # Normalize weights to probabilities
-        probabilities = np.array(self.weights) / sum(self.weights)
+        index = int(np.searchsorted(self._cumulative_probabilities(), np.random.random(), side='right'))
         
-        return np.random.choice(self.names, p=probabilities)
+        return self.names[min(index, self._size - 1)]
     #end def
     
     
     def method3_manual_cumulative(self) -> Union[str, Dict]:
         
-        """Method 3: Manual implementation using cumulative weights"""
+        """Method 3: Manual implementation using the precompiled cumulative weights"""
         
-        # Create cumulative weights
-        cumulative_weights = []
-        cumsum = 0
-        for weight in self.weights:
-            cumsum += weight
-            cumulative_weights.append(cumsum)
+        # Generate random number and find corresponding item
+        rand_val = random.random() * self.cumulative_weights[-1]
+        index    = bisect_left(self.cumulative_weights, rand_val)
         
-        #end for
+        # Fallback (shouldn't happen), guard against floating point rounding on the last bucket
+        if index >= self._size:
+            index = self._size - 1
         
-        # Generate random number and find corresponding item
-        rand_val = random.random() * cumulative_weights[-1]
+        #end if
         
-        for i, cum_weight in enumerate(cumulative_weights):
-            if rand_val <= cum_weight:
-                return self.names[i]
-            
-            #end if
-        #end for
+        return self.names[index]
+    # end def
+    
+    
+    def method4_alias_table(self) -> Union[str, Dict]:
+        
+        """Method 4: Walker/Vose alias table, O(1) per draw"""
+        
+        u = random.random() * self._size
+        i = int(u)
+        
+        if u - i < self._prob[i]:
+            return self.names[i]
+        
+        #end if
         
-        # Fallback (shouldn't reach here)
-        return self.names[-1]
+        return self.names[self._alias[i]]
     # end def
     
     
-    def get_random(self, method: str = "choices") -> Union[str, Dict]:
+    def get_random(self, method: str = "alias") -> Union[str, Dict]:
         
         """
         Get a weighted random selection using specified method.
         
         Args:
-            method: 'choices', 'numpy', or 'manual'
+            method: 'alias', 'choices', 'numpy', or 'manual'
         
         Returns:
             The selected 'name' value (string or dict/document)
         """
         
-        if method == "choices":
+        if method == "alias":
+            return self.method4_alias_table()
+        
+        elif method == "choices":
             return self.method1_random_choices()
         
         elif method == "numpy":
@@ -167,13 +276,125 @@ class WeightedRandomSelector:
             return self.method3_manual_cumulative()
         
         else:
-            raise ValueError("Method must be 'choices', 'numpy', or 'manual'")
+            raise ValueError("Method must be 'alias', 'choices', 'numpy', or 'manual'")
 
         #end if
     #end def
+    
+    
+    def sample(self, n: int, rng: np.random.Generator = None, names: bool = False) -> np.ndarray:
+        
+        """
+        Draw n weighted selections in one vectorised call.
+        
+        Args:
+            n:      Number of draws
+            rng:    numpy.random.Generator to draw from, defaults to the module level generator
+            names:  False returns the category indices, True returns the selected 'name' values
+        
+        Returns:
+            np.ndarray of n indices (int64), or of n 'name' values (object dtype, so str/int/dict
+            values come back as the original Python objects)
+        """
+        
+        if rng is None:
+            rng = _default_rng
+        
+        #end if
+        
+        indices = np.searchsorted(self._cumulative_probabilities(), rng.random(n), side='right')
+        np.minimum(indices, self._size - 1, out=indices)
+        
+        if not names:
+            return indices
+        
+        #end if
+        
+        if self._names_array is None:
+            names_array       = np.empty(self._size, dtype=object)
+            names_array[:]    = self.names
+            self._names_array = names_array
+        
+        #end if
+        
+        return self._names_array[indices]
+    #end sample
 #end class
 
 
+# Shared generator for the bulk sample() path when the caller doesn't pass their own.
+_default_rng = np.random.default_rng()
+
+
+# Module level registry of compiled selectors, static option lists are compiled once and reused for every draw.
+_selector_registry: Dict[str, WeightedRandomSelector] = {}
+_selector_cache:    Dict[tuple, tuple]                = {}     # (id(options), scale) -> (options, selector)
+
+
+def register_selector(name: str, options: List[Dict[str, Any]], scale: float = 1.0) -> WeightedRandomSelector:
+    
+    """
+    Compile an option list once and register it under name.
+    
+    Args:
+        name:    Registry key, by convention the option list variable name, e.g. 'gender_options'
+        options: List of dicts with 'name' and 'value' keys
+        scale:   Total weight scale (should match sum of all values)
+    
+    Returns:
+        The compiled WeightedRandomSelector
+    """
+    
+    selector                 = WeightedRandomSelector(options, scale=scale)
+    _selector_registry[name] = selector
+    _selector_cache[(id(options), scale)] = (options, selector)
+    
+    return selector
+#end register_selector
+
+
+def get_selector(name: str) -> WeightedRandomSelector:
+    
+    """
+    Return a previously registered selector.
+    
+    Raises:
+        KeyError: If no selector was registered under name
+    """
+    
+    try:
+        return _selector_registry[name]
+    
+    except KeyError:
+        raise KeyError(f"No compiled selector registered as '{name}'") from None
+    
+    #end try
+#end get_selector
+
+
+def compiled_selector(options: List[Dict[str, Any]], scale: float = 1.0) -> WeightedRandomSelector:
+    
+    """
+    Return the compiled selector for a long lived option list, compiling it on first use.
+    
+    Keyed on the list identity and scale, so only use this for lists that are not rebuilt per call, e.g. the
+    card_network list held on a loaded bank record. The options list is kept referenced alongside its
+    selector so the identity can't be recycled.
+    """
+    
+    cached = _selector_cache.get((id(options), scale))
+    if cached is not None and cached[0] is options:
+        return cached[1]
+    
+    #end if
+    
+    selector = WeightedRandomSelector(options, scale=scale)
+    _selector_cache[(id(options), scale)] = (options, selector)
+    
+    return selector
+#end compiled_selector
+
+
 # # Example usage and testing
 # if __name__ == "__main__":
     
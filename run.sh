@@ -33,12 +33,25 @@ export AGE_GAP=19                               # This drives the approx age dif
 export VARIATION=2.5
 export VARIATION_PERC=12                        # 12 = .12 = 12%
 
+export ADDRESS_UNIQUE=fingerprint               # fingerprint => exact, compact NumPy hash set, bloom => fixed memory Bloom filter
+export ADDRESS_CAPACITY=5500000                 # Upper bound on the addresses, sizes the Bloom filter, smaller when AGECAP implies fewer
+export ADDRESS_ERROR_RATE=0.001                 # Bloom filter false positive rate at capacity, a false positive just means a redraw
+
+export WORKERS=1                                # > 1 => generate in parallel, age bracket/date range shards over this many processes
+# export SEED=42                                # Set to make a run repeatable (names, IDs, addresses), random if not set
+export WRITERS=1                                # Background writer threads per generator process, 0 => flush synchronously
+export WRITE_QUEUE=4                            # Day batches that may wait for the writers before generation blocks
+export JSON_PRECODE=1                           # 1 => JSON stores get documents encoded once where they're generated, see json_codec.py
+
 export DEST=4
 # 0 no DB send
 # 1 MongoDB
 # 2 PostgreSQL
 # 3 Redis
 # 4 Kafka                                       -> Added 18 Aug 2025
+# 5 PostgreSQL, asyncpg, batches in flight      -> Added 17 Oct 2026, needs pip install asyncpg
+# 6 Parquet/Arrow IPC files                     -> Added 17 Oct 2026, needs pip install pyarrow
+# 7 Compressed JSONL files                      -> Added 17 Oct 2026, zstd needs pip install zstandard
 
 # MongoDB
 export MONGO_ROOT=mongodb
@@ -48,6 +61,14 @@ export MONGO_HOST=localhost
 export MONGO_PORT=27017
 export MONGO_DIRECT=directConnection=true 
 export MONGO_DATASTORE=distro 
+export MONGO_ORDERED=0                          # 0 => insert_many(ordered=False), the server can apply the batch in parallel
+export MONGO_WRITE_W=1                          # Bulk load write concern, 1, 0 (fire and forget) or majority
+export MONGO_JOURNAL=0                          # 1 => wait for the journal (j=True)
+export MONGO_RAW_BSON=1                         # 1 => documents are BSON encoded where they're generated, see connections.encode_documents
+export MONGO_STREAMS=2                          # Concurrent insert_many streams per collection, 0 => insert in the writer thread
+export MONGO_CLIENTS=1                          # MongoClients (connection pools) the streams are spread over
+export MONGO_POOL_SIZE=100                      # maxPoolSize per client
+export MONGO_COMPRESSORS=zstd,snappy            # Wire compression, needs zstandard / python-snappy, unavailable ones are skipped
 
 
 # PostgreSQL CDC Source
@@ -58,6 +79,12 @@ export POSTGRES_PORT=5432
 # export POSTGRES_CDC_USER=flinkcdc
 # export POSTGRES_CDC_PASSWORD=dbpassword
 export POSTGRES_DB=distro        
+export POSTGRES_LOAD=merge                      # insert => INSERT ... jsonb_array_elements, copy => COPY straight into the tables,
+                                                # merge => COPY into a staging table + INSERT ... ON CONFLICT DO NOTHING
+export POSTGRES_COPY_FORMAT=text                # COPY format, text or binary
+export POSTGRES_POOL=1                          # > 1 => pooled sessions, one per writer thread, raised to WRITERS + 1 if smaller (the main thread holds one)
+export POSTGRES_COMMIT_EVERY=1                  # Commit per K insert calls per session, a failure rolls back up to K-1 earlier calls too
+export POSTGRES_INFLIGHT=8                      # DEST=5, batches in flight on the asyncpg pool
 
 
 # REDIS - see .pws
@@ -69,17 +96,47 @@ export REDIS_SSL=0
 # export REDIS_SSL_CERT=
 # export REDIS_SSL_KEY=
 # export REDIS_SSL_CA=
+export REDIS_TRANSACTION=0                      # 1 => wrap each chunk in MULTI/EXEC
+export REDIS_MSET=1                             # 1 => one MSET per chunk when there is no TTL
+export REDIS_CHUNK=500                          # Keys per round trip, 0 => whole batch at once
+export REDIS_PIPELINES=2                        # Chunks written concurrently, each on its own pooled connection
+export REDIS_LAYOUT=string                      # string => JSON string per key, hash => bucketed hashes, json => RedisJSON (Redis Stack)
+export REDIS_HASH_BUCKETS=65536                 # hash layout, buckets per store, keep documents per bucket under hash-max-listpack-entries
 
 
 # KAFKA - see .pws                                          -> Added 18 Aug 2025
 export KAFKA_BOOTSTRAP_SERVERS=localhost:9092
-export KAFKA_SCHEMAREGISTRY_SERVERS=http://localhost:9081
+export KAFKA_SCHEMAREGISTRY_SERVERS=http://localhost:9081      # or file://logs/schema_registry.json, local stand-in, see kafka_serde.py
 export KAFKA_SECURITY_PROTOCOL=PLAINTEXT                    # PLAINTEXT or SSL or SASL_PLAINTEXT or SASL_SSL
 export KAFKA_SASL_MECHANISMS=PLAIN                          # PLAIN or SCRAM-SHA-256 or SCRAM-SHA-512
 # export KAFKA_SASL_USERNAME=
 # export KAFKA_SASL_PASSWORD=
 export KAFKA_MAXRETRIES=4                                   
 export KAFKA_DELAY=0.25                                     # delay seconds, which doubled ever retry
+export KAFKA_STREAMING=1                                    # 1 => produce and poll only, no flush after every batch
+export KAFKA_CHECKPOINT=0                                   # Flush every N batches, 0 => only at shutdown
+export KAFKA_FLUSH_TIMEOUT=30                               # Seconds to wait on outstanding messages at a flush
+export KAFKA_LINGER_MS=20
+export KAFKA_BATCH_SIZE=1048576                             # Bytes
+export KAFKA_COMPRESSION=lz4                                # none, gzip, snappy, lz4 or zstd
+export KAFKA_IDEMPOTENCE=1
+export KAFKA_ACKS=all                                       # all is required with idempotence
+export KAFKA_QUEUE_MAX=1000000                              # Local producer queue, messages
+export KAFKA_DELIVERY_RETRIES=3                             # Re-produce a message whose delivery failed (retriable errors) up to N times
+export KAFKA_FORMAT=json                                    # json or avro, avro registers the schemas with the schema registry
+
+# Parquet/Arrow files, DEST=6
+export FILE_DIR=output                                      # One sub directory per store, part files per process
+export PARQUET_FORMAT=parquet                               # parquet or arrow (IPC)
+export PARQUET_COMPRESSION=zstd
+export PARQUET_ROW_GROUP=100000                             # Rows buffered per store before a row group is written
+export PARQUET_FILE_ROWS=0                                  # Roll to a new part file after N rows, 0 => one file per store
+
+# JSONL files, DEST=7, FILE_DIR as above
+export JSONL_COMPRESSION=zstd                               # zstd, gzip or none
+export JSONL_LEVEL=3                                        # Compression level
+export JSONL_ROTATE_MB=256                                  # Start a new part file after N MB (compressed)
+export JSONL_THREADS=2                                      # Compression threads, the generator only blocks once 2 x this many chunks wait
 
 # Table Name, Topic Name, Collection Name or                # Move this from every persistent store out to a common set.
 export ADULTS_STORE=adults
@@ -0,0 +1,20 @@
+#######################################################################################################################
+#
+#
+#  	Project     	: 	Generic Data generator.
+#
+#   File            :   conftest.py
+#
+#   Description     :   pytest setup, the app modules import each other as top level modules, so app/ goes on the path.
+#
+#   Created     	:   17 Oct 2026
+#
+#   Usage:
+#       python -m pytest -q
+#
+#
+########################################################################################################################
+
+import os, sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
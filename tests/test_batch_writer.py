@@ -0,0 +1,167 @@
+#######################################################################################################################
+#
+#
+#  	Project     	: 	Generic Data generator.
+#
+#   File            :   test_batch_writer.py
+#
+#   Description     :   BatchWriter error handling, backpressure and batches settled on their Futures.
+#
+#   Created     	:   17 Oct 2026
+#
+#
+########################################################################################################################
+
+import concurrent.futures, logging, threading, time
+
+import pytest
+
+from batch_writer import BatchWriter
+from connections import DatabaseOperationError
+
+
+mylogger = logging.getLogger("test_batch_writer")
+
+
+class Sink:
+
+    """Flush function recording what it was given, batches listed in fail raise the paired error"""
+
+    def __init__(self, fail=None):
+        self.fail    = fail or {}
+        self.flushed = []
+        self.lock    = threading.Lock()
+    #end __init__
+
+    def __call__(self, batch):
+        if batch in self.fail:
+            raise self.fail[batch]
+        #end if
+
+        with self.lock:
+            self.flushed.append(batch)
+        #end with
+    #end __call__
+#end Sink
+
+
+@pytest.mark.parametrize("writers", [0, 1, 3])
+def test_recoverable_errors_skip_the_batch(writers):
+
+    sink     = Sink(fail={2: DatabaseOperationError("down"), 5: DatabaseOperationError("down")})
+    reported = []
+
+    with BatchWriter(sink, mylogger, writers=writers, queue_size=2, on_flushed=reported.append) as writer:
+        for batch in range(8):
+            writer.submit(batch)
+        #end for
+    #end with
+
+    assert sorted(sink.flushed) == sorted(reported) == [0, 1, 3, 4, 6, 7]
+    assert writer.stats() == {'writers': writers, 'submitted': 8, 'flushed': 6, 'failed': 2}
+#end test_recoverable_errors_skip_the_batch
+
+
+@pytest.mark.parametrize("writers", [0, 1])
+def test_fatal_error_stops_the_run(writers):
+
+    writer = BatchWriter(Sink(fail={1: KeyError("bug")}), mylogger, writers=writers, queue_size=1)
+    writer.submit(0)
+
+    with pytest.raises(KeyError):
+        for batch in range(1, 10):
+            writer.submit(batch)
+            time.sleep(0.01)
+        #end for
+    #end with
+
+    with pytest.raises(KeyError):
+        writer.close()
+    #end with
+
+    writer.close(raise_error=False)
+    assert writer.stats()["failed"] == 1
+
+    with pytest.raises(RuntimeError):
+        writer.submit(99)
+    #end with
+#end test_fatal_error_stops_the_run
+
+
+def test_submit_blocks_while_the_queue_is_full():
+
+    release = threading.Event()
+    writer  = BatchWriter(lambda batch: release.wait(), mylogger, writers=1, queue_size=1)
+
+    writer.submit(0)                                    # Picked up by the writer, which then blocks
+    time.sleep(0.05)
+    writer.submit(1)                                    # Fills the queue
+
+    blocked = threading.Thread(target=writer.submit, args=(2,))
+    blocked.start()
+    blocked.join(0.2)
+
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(2)
+
+    assert not blocked.is_alive()
+
+    writer.close()
+    assert writer.stats()["flushed"] == 3
+#end test_submit_blocks_while_the_queue_is_full
+
+
+def test_batches_settle_on_their_futures():
+
+    futures  = {batch: [concurrent.futures.Future(), concurrent.futures.Future()] for batch in range(3)}
+    reported = []
+    writer   = BatchWriter(lambda batch: futures[batch] + [None], mylogger, writers=1, on_flushed=reported.append)
+
+    for batch in range(3):
+        writer.submit(batch)
+    #end for
+
+    writer._queue.join()
+    assert reported == [] and writer.stats()["flushed"] == 0
+
+    futures[0][0].set_result(1)
+    futures[0][1].set_result(1)
+    futures[1][0].set_result(1)
+    futures[1][1].set_exception(DatabaseOperationError("insert failed"))
+
+    assert reported == [0]
+    assert writer.stats()["failed"] == 1
+
+    # close() waits for the loads still in flight
+    closer = threading.Thread(target=writer.close)
+    closer.start()
+    closer.join(0.2)
+
+    assert closer.is_alive()
+
+    futures[2][0].set_result(1)
+    futures[2][1].set_result(1)
+    closer.join(2)
+
+    assert not closer.is_alive()
+    assert reported == [0, 2]
+    assert writer.stats() == {'writers': 1, 'submitted': 3, 'flushed': 2, 'failed': 1}
+#end test_batches_settle_on_their_futures
+
+
+def test_drain_waits_for_futures_and_raises_fatal_errors():
+
+    future = concurrent.futures.Future()
+    writer = BatchWriter(lambda batch: future, mylogger, writers=0)
+    writer.submit(0)
+
+    threading.Timer(0.05, future.set_exception, args=(KeyError("bug"),)).start()
+
+    with pytest.raises(KeyError):
+        writer.drain()
+    #end with
+
+    writer.close(raise_error=False)
+#end test_drain_waits_for_futures_and_raises_fatal_errors
@@ -0,0 +1,234 @@
+#######################################################################################################################
+#
+#
+#  	Project     	: 	Generic Data generator.
+#
+#   File            :   test_faker_uniqueIdnumber.py
+#
+#   Description     :   FeistelPermutation, the collision free PPS stream and the SA ID sequence allocator.
+#
+#   Created     	:   17 Oct 2026
+#
+#
+########################################################################################################################
+
+import re
+
+import numpy as np
+import pytest
+from faker import Faker
+
+from faker_uniqueIdnumber import (FeistelPermutation, IrishPpsNumberProvider, PPS_CHECKSUM_ALPHABET, SAIdNumberProvider,
+                                  SASequenceAllocator, SA_BAND_COMBINATIONS, SA_SHARED_COMBINATIONS)
+
+
+def pps_check_letter(digits):
+
+    """Reference mod 23 check letter, weights 8 .. 2 over the 7 digits, W for a remainder of 0"""
+
+    return "WABCDEFGHIJKLMNOPQRSTUV"[sum(int(digit) * weight for digit, weight in zip(digits, range(8, 1, -1))) % 23]
+#end pps_check_letter
+
+
+def luhn_valid(number):
+
+    """Reference Luhn check over the full number, every second digit from the right doubled"""
+
+    total = 0
+    for i, digit in enumerate(int(digit) for digit in reversed(number)):
+        doubled = digit * 2 if i % 2 else digit
+        total  += doubled - 9 if doubled > 9 else doubled
+    #end for
+
+    return total % 10 == 0
+#end luhn_valid
+
+
+@pytest.fixture
+def fake():
+
+    fake = Faker()
+    fake.add_provider(IrishPpsNumberProvider)
+    fake.add_provider(SAIdNumberProvider)
+
+    return fake
+#end fake
+
+
+@pytest.mark.parametrize("domain", [1, 2, 10, 1000, 5000, 10 ** 5])
+def test_feistel_is_a_bijection(domain):
+
+    permutation = FeistelPermutation(domain, seed=42)
+    values      = permutation.permute_many(np.arange(domain))
+
+    assert np.array_equal(np.sort(values), np.arange(domain, dtype=np.uint64))
+#end test_feistel_is_a_bijection
+
+
+def test_feistel_scalar_matches_vectorised():
+
+    permutation = FeistelPermutation(10 ** 7, seed="pps")
+    counters    = np.arange(0, 10 ** 7, 9973)
+
+    assert [permutation.permute(int(counter)) for counter in counters] == permutation.permute_many(counters).tolist()
+#end test_feistel_scalar_matches_vectorised
+
+
+def test_feistel_is_keyed():
+
+    counters = np.arange(1000)
+
+    assert np.array_equal(FeistelPermutation(1000, 7).permute_many(counters), FeistelPermutation(1000, 7).permute_many(counters))
+    assert not np.array_equal(FeistelPermutation(1000, 7).permute_many(counters), FeistelPermutation(1000, 8).permute_many(counters))
+#end test_feistel_is_keyed
+
+
+def test_pps_check_letter():
+
+    assert PPS_CHECKSUM_ALPHABET == "WABCDEFGHIJKLMNOPQRSTUV"
+    assert IrishPpsNumberProvider._pps_check_letter([1, 2, 3, 4, 5, 6, 7]) == "T"
+    assert IrishPpsNumberProvider._pps_check_letter([0] * 7) == "W"
+#end test_pps_check_letter
+
+
+def test_unique_pps_numbers_are_valid_and_unique(fake):
+
+    fake.configure_pps_stream(seed=1, start=0, stop=50000)
+    numbers = fake.unique_pps_numbers(50000)
+
+    assert len(set(numbers)) == 50000
+    for number in numbers:
+        assert re.fullmatch(r"\d{7}[A-W]", number)
+        assert number[7] == pps_check_letter(number[:7])
+    #end for
+#end test_unique_pps_numbers_are_valid_and_unique
+
+
+def test_unique_pps_number_matches_batch(fake):
+
+    fake.configure_pps_stream(seed=3, start=100, stop=200)
+    singles = [fake.unique_pps_number() for _ in range(100)]
+
+    fake.configure_pps_stream(seed=3, start=100, stop=200)
+
+    assert fake.unique_pps_numbers(100) == singles
+#end test_unique_pps_number_matches_batch
+
+
+def test_pps_streams_with_disjoint_ranges_do_not_overlap(fake):
+
+    fake.configure_pps_stream(seed=5, start=0, stop=10000)
+    first = fake.unique_pps_numbers(10000)
+
+    fake.configure_pps_stream(seed=5, start=10000, stop=20000)
+    second = fake.unique_pps_numbers(10000)
+
+    assert not set(first) & set(second)
+#end test_pps_streams_with_disjoint_ranges_do_not_overlap
+
+
+def test_pps_stream_exhausted(fake):
+
+    fake.configure_pps_stream(seed=9, start=0, stop=3)
+    fake.unique_pps_numbers(2)
+    fake.unique_pps_number()
+
+    with pytest.raises(OverflowError):
+        fake.unique_pps_number()
+    #end with
+
+    with pytest.raises(ValueError):
+        fake.configure_pps_stream(seed=9, start=0, stop=10 ** 7 + 1)
+    #end with
+#end test_pps_stream_exhausted
+
+
+def test_sa_allocator_single_partition_hands_out_every_combination_once():
+
+    allocator = SASequenceAllocator(seed=1)
+    key       = ("800101", 5, 0)
+    combos    = np.concatenate([allocator.allocate(key, 1234), allocator.allocate(key, SA_BAND_COMBINATIONS - 1234)])
+
+    assert np.array_equal(np.sort(combos), np.arange(SA_BAND_COMBINATIONS))
+    assert allocator.remaining(key) == 0
+
+    with pytest.raises(OverflowError):
+        allocator.allocate(key, 1)
+    #end with
+
+    # Other keys are unaffected
+    assert allocator.allocate(("800101", 0, 0), 1).size == 1
+#end test_sa_allocator_single_partition_hands_out_every_combination_once
+
+
+def test_sa_allocator_partitions_are_disjoint():
+
+    partitions = 4
+    key        = ("900215", 0, 0)
+    owner      = SASequenceAllocator(seed=2, partition=0, partitions=partitions)
+    owned      = owner.allocate(key, SA_BAND_COMBINATIONS - SA_SHARED_COMBINATIONS, owned=True)
+
+    with pytest.raises(OverflowError):
+        owner.allocate(key, 1, owned=True)
+    #end with
+
+    shared = []
+    for partition in range(partitions):
+        allocator = owner if partition == 0 else SASequenceAllocator(seed=2, partition=partition, partitions=partitions)
+        shared.append(allocator.allocate(key, allocator.remaining(key)))
+
+        with pytest.raises(OverflowError):
+            allocator.allocate(key, 1)
+        #end with
+    #end for
+
+    combos = np.concatenate([owned] + shared)
+
+    assert np.array_equal(np.sort(combos), np.arange(SA_BAND_COMBINATIONS))
+#end test_sa_allocator_partitions_are_disjoint
+
+
+def test_sa_allocator_rejects_bad_partitions():
+
+    with pytest.raises(ValueError):
+        SASequenceAllocator(seed=1, partition=4, partitions=4)
+    #end with
+
+    with pytest.raises(ValueError):
+        SASequenceAllocator(seed=1, partition=0, partitions=SA_SHARED_COMBINATIONS + 1)
+    #end with
+#end test_sa_allocator_rejects_bad_partitions
+
+
+def test_sa_id_numbers_have_valid_luhn_check_digits(fake):
+
+    fake.configure_sa_allocator(seed=3)
+    males   = fake.sa_id_numbers(3000, birth_date="80/01/01", gender="male", owned=True)
+    females = fake.sa_id_numbers(2000, birth_date="1980/01/01", gender="female", citizen=False)
+    either  = fake.sa_id_numbers(500, birth_date="75/06/30")
+
+    assert len(set(males + females + either)) == 5500
+
+    for number in males + females + either:
+        assert luhn_valid(number)
+        assert fake.validate_sa_id(number)
+        assert int(number[12]) == SAIdNumberProvider(fake)._calculate_luhn_check_digit(number[:12])
+    #end for
+
+    assert all(number.startswith("800101") and number[6] in "56789" and number[10] == "0" for number in males)
+    assert all(number[6] in "01234" and number[10] == "1" for number in females)
+#end test_sa_id_numbers_have_valid_luhn_check_digits
+
+
+def test_sa_id_numbers_overflow(fake):
+
+    fake.configure_sa_allocator(seed=4)
+    fake.sa_id_numbers(SA_BAND_COMBINATIONS, birth_date="01/02/03", gender="female")
+
+    with pytest.raises(OverflowError):
+        fake.unique_sa_id_number(birth_date="01/02/03", gender="female")
+    #end with
+
+    assert fake.validate_sa_id(fake.unique_sa_id_number(birth_date="01/02/03", gender="male"))
+    assert not fake.validate_sa_id("8001015009088")
+#end test_sa_id_numbers_overflow
@@ -0,0 +1,100 @@
+#######################################################################################################################
+#
+#
+#  	Project     	: 	Generic Data generator.
+#
+#   File            :   test_unique_index.py
+#
+#   Description     :   FingerprintSet and BloomFilter uniqueness behaviour.
+#
+#   Created     	:   17 Oct 2026
+#
+#
+########################################################################################################################
+
+import numpy as np
+import pytest
+
+from unique_index import BloomFilter, FingerprintSet, create_unique_index, fingerprints
+
+
+def addresses(start, stop):
+
+    return [f"{i} Main Street|D{i % 24:02d}|Dublin" for i in range(start, stop)]
+#end addresses
+
+
+def test_fingerprints_are_stable_and_never_zero():
+
+    values = addresses(0, 1000)
+
+    assert np.array_equal(fingerprints(values), fingerprints(values))
+    assert np.all(fingerprints(values) != 0)
+#end test_fingerprints_are_stable_and_never_zero
+
+
+def test_fingerprint_set_is_exact():
+
+    index  = FingerprintSet(initial_capacity=16)
+    is_new = index.add_many(addresses(0, 100) + addresses(50, 150) + ["0 Main Street|D00|Dublin"])
+
+    # First occurrence wins, repeats within the batch and against earlier batches are collisions
+    assert is_new[:100].all() and not is_new[100:150].any() and is_new[150:200].all() and not is_new[200]
+    assert len(index) == 150
+    assert index.add("149 Main Street|D05|Dublin") is False
+    assert index.add("new") is True
+    assert index.stats() == {
+        'mode':             'FingerprintSet',
+        'checks':           203,
+        'collisions':       52,
+        'collision_rate':   round(52 / 203, 6),
+        'nbytes':           index.nbytes
+    }
+#end test_fingerprint_set_is_exact
+
+
+def test_fingerprint_set_grows_and_keeps_everything():
+
+    index = FingerprintSet(initial_capacity=16)
+    start = index.nbytes
+
+    for chunk in range(0, 20000, 1000):
+        assert index.add_many(addresses(chunk, chunk + 1000)).all()
+    #end for
+
+    assert len(index) == 20000
+    assert index.nbytes > start
+    assert len(index) <= index.nbytes // 8 * index.max_load
+    assert not index.add_many(addresses(0, 20000)).any()
+#end test_fingerprint_set_grows_and_keeps_everything
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+
+    index = BloomFilter(capacity=20000, error_rate=0.01)
+    size  = index.nbytes
+
+    assert index.add_many(addresses(0, 20000)).sum() >= 20000 * 0.99
+    assert not index.add_many(addresses(0, 20000)).any()
+
+    # Unseen values, at capacity roughly error_rate of them look seen
+    false_positives = np.count_nonzero(~index.add_many(addresses(100000, 120000)))
+
+    assert false_positives < 20000 * 0.01 * 3
+    assert index.nbytes == size
+#end test_bloom_filter_has_no_false_negatives_and_bounded_false_positives
+
+
+def test_create_unique_index():
+
+    assert isinstance(create_unique_index("fingerprint", capacity=1000), FingerprintSet)
+    assert isinstance(create_unique_index("Bloom", capacity=1000), BloomFilter)
+
+    # Pre-sized from the capacity, not a fixed 16 MB table
+    assert create_unique_index("fingerprint", capacity=1000).nbytes < 64 * 1024
+    assert create_unique_index("fingerprint", capacity=10 ** 9).nbytes <= (1 << 21) * 8
+
+    with pytest.raises(ValueError):
+        create_unique_index("set")
+    #end with
+#end test_create_unique_index